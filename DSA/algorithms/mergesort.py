@@ -10,6 +10,8 @@ def mergesort(items: List[Any]) -> List[Any]:
     STABLE: Yes.
 
     Use for sorting linked lists.
+        (This version slices Python lists. For linked lists see
+         data_structures.linked_list.merge_sort_nodes, which relinks nodes in O(1) space.)
     Use if all the data can't fit into memory
         (Sort into temporary files/storage,
          combine sorted files/temporary storage.)
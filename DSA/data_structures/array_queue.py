@@ -1,51 +1,95 @@
-from typing import Any
+from array import array
+from typing import Any, Iterable, Optional, Sequence
 
 _DEFAULT_CAPACITY = 10
 
 
 class ArrayQueue:
-    """A FIFO queue implemented using an array internally.
+    """A FIFO queue implemented using a circular array internally.
 
-    The main issue here is that we will occasionally shrink
-    or grow our queue capacity based on the current size.
-    But in return we get on average O(1) operations.
+    The front of the queue is at _start, and the queue wraps around
+    the end of the array back to index 0, so enqueue/dequeue never
+    have to shift items around. We only copy when we grow or shrink,
+    and at that point we unroll the ring so it starts at index 0 again.
 
-    enqueue: O(1) average, O(n) amortized
-    dequeue: O(1), O(n/2) amortized
-    """
+    Batches are moved with slice assignment, which needs at most two
+    copies (the run up to the end of the array, and the wrapped run
+    from index 0).
 
-    def __init__(self, capacity=_DEFAULT_CAPACITY):
-        self._start = 0
-        self._end = 0
-        self.size = 0
+    enqueue: O(1) amortized
+    dequeue: O(1) amortized
+    enqueue_many/dequeue_many: O(k) for k items, but done in at most two slice copies
+
+    Typed mode:
+    Pass an array module typecode (e.g. 'd' for floats, 'q' for 64-bit ints)
+    and the values are stored unboxed in an array.array instead of a list.
+    That's ~8 bytes per item instead of a pointer plus a boxed object, and lets
+    us hand out memoryviews (peek_view, dequeue_into) that NumPy etc. can
+    read without building a list first.
+    """
 
+    def __init__(self, capacity=_DEFAULT_CAPACITY, typecode: Optional[str] = None):
         if capacity < 1:
             raise ValueError('Capacity must be at least 1')
 
-        self._queue = [None] * capacity
+        self._start = 0
+        self._min_capacity = capacity
+        self._typecode = typecode
+        self._empty = None if typecode is None else 0
+        self.size = 0
+
+        self._queue = self._blank(capacity)
 
     def enqueue(self, val: Any) -> None:
         """Adds an item to the end of the queue.
 
-        1. If we reached capacity (end = len), double the size
-        2. Add a value to the end of the queue
-        3. Increment end pointer and size.
+        1. If we reached capacity (size = len), double the size
+        2. Add a value at (start + size) % len, wrapping around the end
+        3. Increment size.
 
-        Time: O(1) average, O(n) amortized.
+        Time: O(1) amortized.
 
         :param val: The value to add.
         :return: None.
         """
-        if self._end == len(self._queue):
-            self._grow(len(self._queue))
+        if self.size == len(self._queue):
+            self._resize(2 * len(self._queue))
 
-        self._queue[self._end] = val  # We can't use append because that will always add to the end.
-        self._end += 1
+        self._queue[(self._start + self.size) % len(self._queue)] = val
         self.size += 1
 
-    def _grow(self, new_size: int) -> None:
-        """Extend the queue to a new size."""
-        self._queue.extend([None] * new_size)
+    def enqueue_many(self, vals: Iterable[Any]) -> None:
+        """Adds all of the items to the end of the queue, in order.
+
+        1. Make sure we have room for everything (resize at most once).
+        2. Copy the first run up to the end of the array.
+        3. Copy whatever is left to the start of the array (wrap around).
+
+        Time: O(k) for k items.
+
+        :param vals: The values to add.
+        :return: None.
+        """
+        if self._typecode is not None:
+            if not isinstance(vals, array) or vals.typecode != self._typecode:
+                vals = array(self._typecode, vals)
+        elif not isinstance(vals, (list, tuple)):
+            vals = list(vals)
+
+        count = len(vals)
+        if count == 0:
+            return
+
+        if self.size + count > len(self._queue):
+            self._resize(max(self.size + count, 2 * len(self._queue)))
+
+        capacity = len(self._queue)
+        end = (self._start + self.size) % capacity
+        first_run = min(count, capacity - end)
+
+        self._queue[end:end + first_run] = vals[:first_run]
+        self._queue[:count - first_run] = vals[first_run:]
+        self.size += count
 
     def dequeue(self) -> Any:
         """Removes and returns the item from the front of the queue.
@@ -53,11 +97,10 @@ class ArrayQueue:
         1. If the queue is empty, raise an exception.
         2. Get the value from the start.
         3. Set the start to none.
-        4. Increment start pointer.
-        5. If start == end, reset both to 0 (queue empty).
-        6. If the end is 1/4 of queue size, shrink the queue by half.
+        4. Move the start pointer forward, wrapping around the end.
+        5. If the size is 1/4 of queue capacity, shrink the queue by half.
 
-        Time: O(1) average, O(n/2) amortized.
+        Time: O(1) amortized.
 
         :return: The front of the queue.
         """
@@ -65,25 +108,152 @@ class ArrayQueue:
             raise Exception('Queue is empty.')
 
         val = self._queue[self._start]
-        self._queue[self._start] = None
-        self._start += 1
+        self._queue[self._start] = self._empty
+        self._start = (self._start + 1) % len(self._queue)
+        self.size -= 1
 
-        # We dequeued everything
-        if self._start == self._end:
-            self._start = 0
-            self._end = 0
+        if self.size <= len(self._queue) // 4:
+            self._shrink_if_sparse()
 
-        if self._end == int(len(self._queue) / 4):
-            self._shrink(int(len(self._queue) / 2))
+        return val
 
-        self.size -= 1
+    def dequeue_many(self, count: int) -> Sequence[Any]:
+        """Removes and returns up to count items from the front of the queue.
 
-        return val
+        Unlike dequeue, this doesn't raise if there are fewer than count items,
+        it just returns everything that is left (so draining an empty queue gives []).
+
+        Time: O(k) for k items.
+
+        :param count: The maximum number of items to remove.
+        :return: The removed items, front of the queue first
+                 (an array.array in typed mode, otherwise a list).
+        """
+        if count < 0:
+            raise ValueError('Count must not be negative')
+
+        count = min(count, self.size)
+        vals = self._read(count)
+        self._discard(count)
+
+        return vals
+
+    def dequeue_into(self, buffer: Any) -> int:
+        """Removes items from the front of the queue, copying them into buffer.
+
+        Typed mode only. The buffer can be anything writable that supports
+        the buffer protocol (a bytearray, array.array, NumPy array...).
+        The values are copied straight from our array, so no Python objects
+        are created for them.
+
+        Time: O(k) for k items.
+
+        :param buffer: The buffer to fill, from index 0.
+        :return: The number of items copied (at most len(buffer)).
+        """
+        self._check_typed()
+
+        target = memoryview(buffer)
+        if target.format != self._typecode:
+            target = target.cast('B').cast(self._typecode)
 
-    def _shrink(self, new_size: int) -> None:
-        """Shrinks the queue to a new size."""
-        self._queue = self._queue[:new_size + 1]
+        count = min(len(target), self.size)
+        first_run = min(count, len(self._queue) - self._start)
+
+        with memoryview(self._queue) as source:
+            target[:first_run] = source[self._start:self._start + first_run]
+            target[first_run:count] = source[:count - first_run]
+
+        self._discard(count)
+
+        return count
+
+    def peek_view(self) -> memoryview:
+        """Returns a read-only view of the items at the front of the queue, without copying.
+
+        Typed mode only. The view only covers the contiguous run
+        up to the end of the array, so if the queue has wrapped around
+        it can be shorter than size. Dequeue len(view) items to move past it.
+
+        The view is only valid until the next call that changes the queue.
+
+        :return: A memoryview over the front of the queue.
+        """
+        self._check_typed()
+
+        first_run = min(self.size, len(self._queue) - self._start)
+
+        return memoryview(self._queue)[self._start:self._start + first_run].toreadonly()
+
+    def reserve(self, capacity: int) -> None:
+        """Makes sure the queue can hold capacity items without reallocating.
+
+        The reserved capacity also becomes the floor we shrink to,
+        so a queue that fills and drains repeatedly keeps its array.
+
+        :param capacity: The number of items to make room for.
+        :return: None.
+        """
+        if capacity > len(self._queue):
+            self._resize(capacity)
+
+        self._min_capacity = max(self._min_capacity, capacity)
 
     def is_empty(self) -> bool:
         """Returns True if the queue is empty."""
         return self.size == 0
+
+    def _read(self, count: int) -> Sequence[Any]:
+        """Copies count items from the front of the queue (at most two slices)."""
+        first_run = min(count, len(self._queue) - self._start)
+        vals = self._queue[self._start:self._start + first_run]
+
+        if count > first_run:
+            vals.extend(self._queue[:count - first_run])
+
+        return vals
+
+    def _discard(self, count: int) -> None:
+        """Clears count items from the front of the queue and moves the start pointer."""
+        capacity = len(self._queue)
+        first_run = min(count, capacity - self._start)
+
+        if self._typecode is None:
+            # Clear the slots so we don't keep the objects alive (nothing to clear in typed mode)
+            self._queue[self._start:self._start + first_run] = [None] * first_run
+            self._queue[:count - first_run] = [None] * (count - first_run)
+
+        self._start = (self._start + count) % capacity
+        self.size -= count
+
+        if self.size <= capacity // 4:
+            self._shrink_if_sparse()
+
+    def _shrink_if_sparse(self) -> None:
+        """Halves the capacity while the queue is at most 1/4 full."""
+        capacity = len(self._queue)
+
+        while self.size <= capacity // 4 and capacity // 2 >= self._min_capacity:
+            capacity //= 2
+
+        if capacity != len(self._queue):
+            self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Copies the queue into a new array, unrolling it to start at index 0."""
+        vals = self._read(self.size)
+        vals.extend(self._blank(capacity - self.size))
+
+        self._queue = vals
+        self._start = 0
+
+    def _blank(self, capacity: int) -> Sequence[Any]:
+        """Returns an empty backing array of the given capacity."""
+        if self._typecode is None:
+            return [None] * capacity
+
+        return array(self._typecode, [0]) * capacity
+
+    def _check_typed(self) -> None:
+        if self._typecode is None:
+            raise TypeError('Only supported for typed queues (pass a typecode)')
@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from data_structures.array_queue import ArrayQueue
 
@@ -53,11 +54,118 @@ class ArrayQueueTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             ArrayQueue(0)
 
+    def test_wrap_around(self):
+        array_queue = ArrayQueue(4)
+        array_queue.enqueue(1)
+        array_queue.enqueue(2)
+        array_queue.enqueue(3)
+
+        self.assertEqual(1, array_queue.dequeue())
+        self.assertEqual(2, array_queue.dequeue())
+
+        array_queue.enqueue(4)
+        array_queue.enqueue(5)
+        array_queue.enqueue(6)
+
+        self.assertEqual(4, len(array_queue._queue))
+        self.assertEqual([3, 4, 5, 6], array_queue.dequeue_many(4))
+
+    def test_enqueue_many(self):
+        array_queue = ArrayQueue(4)
+        array_queue.enqueue(1)
+        array_queue.enqueue(2)
+        array_queue.dequeue()
 
+        array_queue.enqueue_many(range(3, 8))
 
+        self.assertEqual(6, array_queue.size)
+        self.assertEqual([2, 3, 4, 5, 6, 7], array_queue.dequeue_many(6))
 
+    def test_enqueue_many_wraps_around(self):
+        array_queue = ArrayQueue(5)
+        array_queue.enqueue_many([1, 2, 3, 4])
+        array_queue.dequeue_many(3)
 
+        array_queue.enqueue_many([5, 6, 7])
 
+        self.assertEqual(5, len(array_queue._queue))
+        self.assertEqual([4, 5, 6, 7], array_queue.dequeue_many(4))
 
+    def test_dequeue_many(self):
+        array_queue = ArrayQueue()
+        array_queue.enqueue_many([1, 2, 3])
 
+        self.assertEqual([1, 2], array_queue.dequeue_many(2))
+        self.assertEqual([3], array_queue.dequeue_many(5))
+        self.assertEqual([], array_queue.dequeue_many(5))
+        self.assertTrue(array_queue.is_empty())
+
+    def test_dequeue_many_negative_count_raises_value_error(self):
+        array_queue = ArrayQueue()
+        with self.assertRaises(ValueError):
+            array_queue.dequeue_many(-1)
+
+    def test_reserve(self):
+        array_queue = ArrayQueue(2)
+        array_queue.reserve(100)
+        self.assertEqual(100, len(array_queue._queue))
+
+        array_queue.enqueue_many(range(100))
+        self.assertEqual(100, len(array_queue._queue))
+
+        # Draining shouldn't shrink below the reserved capacity
+        array_queue.dequeue_many(100)
+        self.assertEqual(100, len(array_queue._queue))
+
+    def test_shrink(self):
+        array_queue = ArrayQueue(2)
+        array_queue.enqueue_many(range(64))
+        array_queue.dequeue_many(62)
+
+        self.assertEqual(4, len(array_queue._queue))
+        self.assertEqual([62, 63], array_queue.dequeue_many(2))
+
+    def test_typed_enqueue_dequeue(self):
+        array_queue = ArrayQueue(2, typecode='d')
+        array_queue.enqueue(1.5)
+        array_queue.enqueue_many([2.5, 3.5, 4.5])
+
+        self.assertEqual('d', array_queue._queue.typecode)
+        self.assertEqual(1.5, array_queue.dequeue())
+        self.assertEqual(array('d', [2.5, 3.5]), array_queue.dequeue_many(2))
+        self.assertEqual(1, array_queue.size)
+
+    def test_typed_dequeue_into(self):
+        array_queue = ArrayQueue(4, typecode='q')
+        array_queue.enqueue_many([1, 2, 3])
+        array_queue.dequeue_many(2)
+        array_queue.enqueue_many([4, 5, 6])  # Wraps around
+
+        buffer = array('q', [0] * 3)
+        self.assertEqual(3, array_queue.dequeue_into(buffer))
+        self.assertEqual(array('q', [3, 4, 5]), buffer)
+
+        raw = bytearray(8 * 4)
+        self.assertEqual(1, array_queue.dequeue_into(raw))
+        self.assertEqual([6, 0, 0, 0], memoryview(raw).cast('q').tolist())
+        self.assertTrue(array_queue.is_empty())
+
+    def test_typed_peek_view(self):
+        array_queue = ArrayQueue(4, typecode='d')
+        array_queue.enqueue_many([1.0, 2.0, 3.0, 4.0])
+        array_queue.dequeue_many(2)
+        array_queue.enqueue(5.0)
+
+        view = array_queue.peek_view()
+        self.assertEqual([3.0, 4.0], view.tolist())
+        self.assertTrue(view.readonly)
+        self.assertEqual(3, array_queue.size)
+
+    def test_untyped_views_raise_type_error(self):
+        array_queue = ArrayQueue()
+        array_queue.enqueue(1)
 
+        with self.assertRaises(TypeError):
+            array_queue.peek_view()
+        with self.assertRaises(TypeError):
+            array_queue.dequeue_into(bytearray(8))
@@ -0,0 +1,206 @@
+from typing import Any, Iterator
+
+# Values per block (CPython's deque also uses 64).
+_BLOCK_LENGTH = 64
+# Where an empty deque starts, so it can grow either way before needing a new block.
+_CENTER = (_BLOCK_LENGTH - 1) // 2
+
+
+class Block:
+    """A fixed-size array of slots, linked to the blocks on either side."""
+
+    __slots__ = ('values', 'prev', 'next')
+
+    def __init__(self) -> None:
+        self.values = [None] * _BLOCK_LENGTH
+        self.prev = None
+        self.next = None
+
+
+class BlockDeque:
+    """A double-ended queue made of linked fixed-size blocks (like CPython's collections.deque).
+
+    A DoublyLinkedList allocates a node per value. Here we allocate a block
+    of 64 slots at a time, and the deque is a window over a chain of blocks:
+
+    [ . . . 1 2 ] <> [ 3 4 5 6 7 ] <> [ 8 9 . . . ]
+            ^ left index                  ^ right index
+
+    * Adding to the head/tail fills the next free slot, and links a new block when one runs out.
+    * Popping clears the slot, and unlinks the end block when it empties.
+    Since blocks are never split or merged, every block except the end ones is full,
+    so we can find index i by skipping i // 64 blocks.
+
+    * Add to head/tail: O(1)
+    * Pop head/tail: O(1)
+    * Get item: O(n/B), walking from the closer end
+    * Rotate by k: O(min(k, n - k))
+    """
+
+    def __init__(self) -> None:
+        self._left_block = self._right_block = Block()
+        self._left_index = _CENTER + 1
+        self._right_index = _CENTER
+        self.size = 0
+
+    def add_to_head(self, val: Any) -> None:
+        """Adds an item to the start of the deque.
+
+        :param val: The item to add.
+        :return: None
+        """
+        if self._left_index == 0:
+            block = Block()
+            block.next = self._left_block
+            self._left_block.prev = block
+            self._left_block = block
+            self._left_index = _BLOCK_LENGTH
+
+        self._left_index -= 1
+        self._left_block.values[self._left_index] = val
+        self.size += 1
+
+    def add_to_tail(self, val: Any) -> None:
+        """Adds an item to the end of the deque.
+
+        :param val: The item to add.
+        :return: None
+        """
+        if self._right_index == _BLOCK_LENGTH - 1:
+            block = Block()
+            block.prev = self._right_block
+            self._right_block.next = block
+            self._right_block = block
+            self._right_index = -1
+
+        self._right_index += 1
+        self._right_block.values[self._right_index] = val
+        self.size += 1
+
+    def pop_head(self) -> Any:
+        """Removes and returns the head.
+
+        :return: The value at head.
+        """
+        if self.size == 0:
+            raise Exception('Deque is empty')
+
+        val = self._left_block.values[self._left_index]
+        self._left_block.values[self._left_index] = None
+        self._left_index += 1
+        self.size -= 1
+
+        if self.size == 0:
+            self._recenter()
+        elif self._left_index == _BLOCK_LENGTH:
+            block = self._left_block.next
+            block.prev = None
+            self._left_block.next = None
+            self._left_block = block
+            self._left_index = 0
+
+        return val
+
+    def pop_tail(self) -> Any:
+        """Removes and returns the tail.
+
+        :return: The value at tail.
+        """
+        if self.size == 0:
+            raise Exception('Deque is empty')
+
+        val = self._right_block.values[self._right_index]
+        self._right_block.values[self._right_index] = None
+        self._right_index -= 1
+        self.size -= 1
+
+        if self.size == 0:
+            self._recenter()
+        elif self._right_index == -1:
+            block = self._right_block.prev
+            block.next = None
+            self._right_block.prev = None
+            self._right_block = block
+            self._right_index = _BLOCK_LENGTH - 1
+
+        return val
+
+    def rotate(self, count: int = 1) -> None:
+        """Rotates the deque count steps to the right (tail values move to the head).
+
+        A negative count rotates to the left. Rotating right by k is the same
+        as rotating left by n - k, so we do whichever moves fewer values.
+
+        :param count: The number of steps to rotate.
+        :return: None
+        """
+        if self.size <= 1:
+            return
+
+        count %= self.size
+        if count > self.size // 2:
+            count -= self.size
+
+        for _ in range(count):
+            self.add_to_head(self.pop_tail())
+        for _ in range(-count):
+            self.add_to_tail(self.pop_head())
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Any:
+        """Returns the value at index, skipping whole blocks from the closer end."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Index out of range')
+
+        if index < self.size // 2:
+            # Position counting from slot 0 of the left block
+            position = self._left_index + index
+            block = self._left_block
+            for _ in range(position // _BLOCK_LENGTH):
+                block = block.next
+            slot = position % _BLOCK_LENGTH
+        else:
+            # Position counting back from the last slot of the right block
+            position = (_BLOCK_LENGTH - 1 - self._right_index) + (self.size - 1 - index)
+            block = self._right_block
+            for _ in range(position // _BLOCK_LENGTH):
+                block = block.prev
+            slot = _BLOCK_LENGTH - 1 - position % _BLOCK_LENGTH
+
+        return block.values[slot]
+
+    def __iter__(self) -> Iterator[Any]:
+        block = self._left_block
+        start = self._left_index
+
+        while block is not self._right_block:
+            yield from block.values[start:]
+            block = block.next
+            start = 0
+
+        yield from block.values[start:self._right_index + 1]
+
+    def __reversed__(self) -> Iterator[Any]:
+        block = self._right_block
+        stop = self._right_index
+
+        while block is not self._left_block:
+            for i in range(stop, -1, -1):
+                yield block.values[i]
+            block = block.prev
+            stop = _BLOCK_LENGTH - 1
+
+        for i in range(stop, self._left_index - 1, -1):
+            yield block.values[i]
+
+    def _recenter(self) -> None:
+        """Moves the indices back to the middle of the (only) block once we're empty."""
+        self._left_index = _CENTER + 1
+        self._right_index = _CENTER
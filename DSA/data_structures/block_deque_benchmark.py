@@ -0,0 +1,83 @@
+"""Compares BlockDeque with DoublyLinkedList (one node per value).
+
+Run from the DSA directory:
+    python -m data_structures.block_deque_benchmark
+"""
+import timeit
+import tracemalloc
+
+from data_structures.block_deque import BlockDeque
+from data_structures.doubly_linked_list import DoublyLinkedList
+
+_SIZE = 100_000
+_WINDOW = 1_000
+_REPEAT = 5
+
+
+def _fill(deque_class):
+    deque = deque_class()
+    for i in range(_SIZE):
+        deque.add_to_tail(i)
+    return deque
+
+
+def _drain(deque):
+    while not deque.is_empty():
+        deque.pop_head()
+
+
+def _sliding_window(deque_class):
+    """Keeps the last _WINDOW values, reading the middle one each step."""
+    deque = deque_class()
+    for i in range(_SIZE):
+        deque.add_to_tail(i)
+        if deque.size > _WINDOW:
+            deque.pop_head()
+            _middle(deque)
+
+
+def _middle(deque):
+    if isinstance(deque, BlockDeque):
+        return deque[deque.size // 2]
+    # No indexing on the linked list, so walk to the middle
+    return next(deque.window(deque.size // 2))
+
+
+def _peak_memory(deque_class):
+    tracemalloc.start()
+    deque = _fill(deque_class)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deque
+    return peak
+
+
+def _drain_statement(deque_class):
+    deques = [_fill(deque_class) for _ in range(_REPEAT)]
+    return lambda: _drain(deques.pop())
+
+
+def _best_time(statement):
+    return min(timeit.repeat(statement, number=1, repeat=_REPEAT))
+
+
+def main():
+    print(f'{_SIZE:,} values, best of {_REPEAT}')
+    print(f'{"":24}{"DoublyLinkedList":>18}{"BlockDeque":>14}')
+
+    rows = [
+        ('add_to_tail', lambda cls: lambda: _fill(cls)),
+        ('pop_head', lambda cls: _drain_statement(cls)),
+        (f'sliding window ({_WINDOW})', lambda cls: lambda: _sliding_window(cls)),
+    ]
+
+    for name, make_statement in rows:
+        times = [_best_time(make_statement(cls)) for cls in (DoublyLinkedList, BlockDeque)]
+        print(f'{name:24}{times[0]:>16.3f}s{times[1]:>12.3f}s')
+
+    memory = [_peak_memory(cls) / 2 ** 20 for cls in (DoublyLinkedList, BlockDeque)]
+    print(f'{"peak memory":24}{memory[0]:>15.1f}MB{memory[1]:>11.1f}MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import random
+import unittest
+from collections import deque
+
+from data_structures.block_deque import BlockDeque
+
+
+class BlockDequeTest(unittest.TestCase):
+
+    def test_add_to_tail(self):
+        block_deque = BlockDeque()
+        for i in range(200):
+            block_deque.add_to_tail(i)
+
+        self.assertEqual(200, block_deque.size)
+        self.assertEqual(list(range(200)), list(block_deque))
+
+    def test_add_to_head(self):
+        block_deque = BlockDeque()
+        for i in range(200):
+            block_deque.add_to_head(i)
+
+        self.assertEqual(list(range(199, -1, -1)), list(block_deque))
+
+    def test_pop_head_and_tail(self):
+        block_deque = BlockDeque()
+        for i in range(150):
+            block_deque.add_to_tail(i)
+
+        self.assertEqual(0, block_deque.pop_head())
+        self.assertEqual(149, block_deque.pop_tail())
+
+        for i in range(1, 75):
+            self.assertEqual(i, block_deque.pop_head())
+        for i in range(148, 74, -1):
+            self.assertEqual(i, block_deque.pop_tail())
+
+        self.assertTrue(block_deque.is_empty())
+        self.assertIs(block_deque._left_block, block_deque._right_block)
+
+        with self.assertRaises(Exception):
+            block_deque.pop_head()
+        with self.assertRaises(Exception):
+            block_deque.pop_tail()
+
+    def test_getitem(self):
+        block_deque = BlockDeque()
+        for i in range(100):
+            block_deque.add_to_tail(i)
+        for i in range(1, 100):
+            block_deque.add_to_head(-i)
+
+        expected = list(range(-99, 100))
+        for i in range(len(expected)):
+            self.assertEqual(expected[i], block_deque[i])
+        self.assertEqual(99, block_deque[-1])
+        self.assertEqual(-99, block_deque[-199])
+
+        with self.assertRaises(IndexError):
+            block_deque[199]
+
+    def test_rotate(self):
+        block_deque = BlockDeque()
+        for i in range(10):
+            block_deque.add_to_tail(i)
+
+        block_deque.rotate(3)
+        self.assertEqual([7, 8, 9, 0, 1, 2, 3, 4, 5, 6], list(block_deque))
+
+        block_deque.rotate(-5)
+        self.assertEqual([2, 3, 4, 5, 6, 7, 8, 9, 0, 1], list(block_deque))
+
+        block_deque.rotate(28)  # Same as rotating 8 right, i.e. 2 left
+        self.assertEqual([4, 5, 6, 7, 8, 9, 0, 1, 2, 3], list(block_deque))
+
+    def test_reversed(self):
+        block_deque = BlockDeque()
+        for i in range(130):
+            block_deque.add_to_tail(i)
+        block_deque.pop_head()
+
+        self.assertEqual(list(range(129, 0, -1)), list(reversed(block_deque)))
+        self.assertEqual([], list(reversed(BlockDeque())))
+
+    def test_matches_collections_deque(self):
+        rand = random.Random(5)
+        block_deque = BlockDeque()
+        expected = deque()
+
+        for i in range(5000):
+            op = rand.randrange(6)
+            if op == 0:
+                block_deque.add_to_head(i)
+                expected.appendleft(i)
+            elif op == 1:
+                block_deque.add_to_tail(i)
+                expected.append(i)
+            elif op == 2 and expected:
+                self.assertEqual(expected.popleft(), block_deque.pop_head())
+            elif op == 3 and expected:
+                self.assertEqual(expected.pop(), block_deque.pop_tail())
+            elif op == 4:
+                steps = rand.randint(-20, 20)
+                block_deque.rotate(steps)
+                expected.rotate(steps)
+            elif expected:
+                index = rand.randrange(len(expected))
+                self.assertEqual(expected[index], block_deque[index])
+
+        self.assertEqual(list(expected), list(block_deque))
+        self.assertEqual(len(expected), len(block_deque))
+
+
+if __name__ == '__main__':
+    unittest.main()
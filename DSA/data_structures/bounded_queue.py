@@ -0,0 +1,185 @@
+import asyncio
+import threading
+from typing import Any, Callable, List, Optional
+
+from data_structures.array_queue import ArrayQueue
+
+
+class BlockingQueue:
+    """A bounded FIFO queue for passing items between threads.
+
+    put blocks while the queue is full and get blocks while it's empty,
+    so producers get backpressure without having to poll.
+
+    We keep one lock and two condition variables on it:
+        * not_empty: consumers wait on this, producers notify it.
+        * not_full: producers wait on this, consumers notify it.
+
+    The items live in an ArrayQueue created with capacity maxsize, which is
+    also its shrink floor, so it never reallocates. We only wait on a condition
+    when we actually have to (the queue is full/empty). Compared to queue.Queue
+    we skip the task_done/join bookkeeping, and get_many drains a whole batch
+    under one lock (see bounded_queue_benchmark).
+
+    Time:
+        put: O(1)
+        get: O(1)
+        get_many: O(k) for k items
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initializes the queue.
+
+        :param maxsize: The most items the queue can hold before put blocks.
+        """
+        if maxsize < 1:
+            raise ValueError('Max size must be at least 1.')
+
+        self.maxsize = maxsize
+        self._queue = ArrayQueue(maxsize)
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def size(self) -> int:
+        return self._queue.size
+
+    def put(self, val: Any, timeout: Optional[float] = None) -> None:
+        """Adds an item to the end of the queue, waiting for space if it's full.
+
+        :param val: The item to add.
+        :param timeout: Seconds to wait for space, or None to wait forever.
+        :return: None.
+        """
+        with self._lock:
+            if self._queue.size >= self.maxsize and not self._not_full.wait_for(self._has_space, timeout):
+                raise TimeoutError('Queue is full.')
+
+            self._queue.enqueue(val)
+            self._not_empty.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Removes and returns the front of the queue, waiting for an item if it's empty.
+
+        :param timeout: Seconds to wait for an item, or None to wait forever.
+        :return: The item that was least-recently added to the queue.
+        """
+        with self._lock:
+            if not self._queue.size and not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError('Queue is empty.')
+
+            val = self._queue.dequeue()
+            self._not_full.notify()
+
+            return val
+
+    def get_many(self, count: int, timeout: Optional[float] = None) -> List[Any]:
+        """Removes and returns up to count items, waiting until at least one is available.
+
+        :param count: The maximum number of items to return.
+        :param timeout: Seconds to wait for the first item, or None to wait forever.
+        :return: The items, front of the queue first.
+        """
+        with self._lock:
+            if not self._queue.size and not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError('Queue is empty.')
+
+            vals = self._queue.dequeue_many(count)
+            self._not_full.notify(len(vals))
+
+            return vals
+
+    def _has_items(self) -> bool:
+        return not self._queue.is_empty()
+
+    def _has_space(self) -> bool:
+        return self._queue.size < self.maxsize
+
+
+class AsyncQueue:
+    """A bounded FIFO queue for passing items between asyncio tasks.
+
+    Same idea as BlockingQueue, but put/get are coroutines that suspend
+    the task instead of blocking the thread. Only use it from one event loop.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initializes the queue.
+
+        :param maxsize: The most items the queue can hold before put waits.
+        """
+        if maxsize < 1:
+            raise ValueError('Max size must be at least 1.')
+
+        self.maxsize = maxsize
+        self._queue = ArrayQueue(maxsize)
+
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    @property
+    def size(self) -> int:
+        return self._queue.size
+
+    async def put(self, val: Any, timeout: Optional[float] = None) -> None:
+        """Adds an item to the end of the queue, waiting for space if it's full.
+
+        :param val: The item to add.
+        :param timeout: Seconds to wait for space, or None to wait forever.
+        :return: None.
+        """
+        async with self._not_full:
+            await self._wait(self._not_full, self._has_space, timeout, 'Queue is full.')
+
+            self._queue.enqueue(val)
+            self._not_empty.notify()
+
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        """Removes and returns the front of the queue, waiting for an item if it's empty.
+
+        :param timeout: Seconds to wait for an item, or None to wait forever.
+        :return: The item that was least-recently added to the queue.
+        """
+        async with self._not_empty:
+            await self._wait(self._not_empty, self._has_items, timeout, 'Queue is empty.')
+
+            val = self._queue.dequeue()
+            self._not_full.notify()
+
+            return val
+
+    async def get_many(self, count: int, timeout: Optional[float] = None) -> List[Any]:
+        """Removes and returns up to count items, waiting until at least one is available.
+
+        :param count: The maximum number of items to return.
+        :param timeout: Seconds to wait for the first item, or None to wait forever.
+        :return: The items, front of the queue first.
+        """
+        async with self._not_empty:
+            await self._wait(self._not_empty, self._has_items, timeout, 'Queue is empty.')
+
+            vals = self._queue.dequeue_many(count)
+            self._not_full.notify(len(vals))
+
+            return vals
+
+    @staticmethod
+    async def _wait(condition: asyncio.Condition, predicate: Callable[[], bool],
+                    timeout: Optional[float], message: str) -> None:
+        """Waits on the condition until predicate is true (must hold the lock)."""
+        if predicate():
+            return
+
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(message) from None
+
+    def _has_items(self) -> bool:
+        return not self._queue.is_empty()
+
+    def _has_space(self) -> bool:
+        return self._queue.size < self.maxsize
@@ -0,0 +1,88 @@
+"""Compares BlockingQueue with queue.Queue.
+
+* put/get pairs: one thread, so this is just the cost of the calls (no waiting).
+* producer/consumer: one thread puts, another gets, through a small queue,
+  so both sides keep filling/draining it and waiting on each other.
+* get_many: the same, but the consumer takes up to _BATCH items per call
+  (queue.Queue has no batch get, so it still gets one at a time).
+
+Expect the single item rows to be about even: both queues take a lock and run a few
+lines of Python per call. get_many is where BlockingQueue pulls ahead.
+
+Run from the DSA directory:
+    python -m data_structures.bounded_queue_benchmark
+"""
+import queue
+import threading
+import timeit
+
+from data_structures.bounded_queue import BlockingQueue
+
+_ITEMS = 200_000
+_MAXSIZE = 1_000
+_BATCH = 100
+_REPEAT = 5
+
+
+def _put_get(q):
+    put, get = q.put, q.get
+    for i in range(_ITEMS):
+        put(i)
+        get()
+
+
+def _produce(q):
+    put = q.put
+    for i in range(_ITEMS):
+        put(i)
+
+
+def _producer_consumer(q):
+    producer = threading.Thread(target=_produce, args=(q,))
+    producer.start()
+
+    get = q.get
+    for _ in range(_ITEMS):
+        get()
+
+    producer.join()
+
+
+def _producer_batch_consumer(q):
+    if not isinstance(q, BlockingQueue):
+        return _producer_consumer(q)
+
+    producer = threading.Thread(target=_produce, args=(q,))
+    producer.start()
+
+    received = 0
+    while received < _ITEMS:
+        received += len(q.get_many(_BATCH))
+
+    producer.join()
+
+
+def _best_time(run, make_queue):
+    return min(timeit.repeat(lambda: run(make_queue()), number=1, repeat=_REPEAT))
+
+
+def main():
+    queues = [('queue.Queue', lambda: queue.Queue(_MAXSIZE)),
+              ('BlockingQueue', lambda: BlockingQueue(_MAXSIZE))]
+
+    print(f'{_ITEMS:,} items, max size {_MAXSIZE:,}, best of {_REPEAT}')
+    print(f'{"":24}' + ''.join(f'{name:>16}' for name, _ in queues))
+
+    rows = [
+        ('put/get pairs', _put_get),
+        ('producer/consumer', _producer_consumer),
+        (f'get_many ({_BATCH})', _producer_batch_consumer),
+    ]
+
+    for name, run in rows:
+        times = [_best_time(run, make_queue) for _, make_queue in queues]
+        print(f'{name:24}' + ''.join(f'{time:>15.3f}s' for time in times))
+
+
+if __name__ == '__main__':
+    main()
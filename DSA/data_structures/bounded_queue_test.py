@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import unittest
+
+from data_structures.bounded_queue import AsyncQueue, BlockingQueue
+
+
+class BlockingQueueTest(unittest.TestCase):
+
+    def test_put_get(self):
+        queue = BlockingQueue(3)
+        queue.put(1)
+        queue.put(2)
+        queue.put(3)
+
+        self.assertEqual(3, queue.size)
+        self.assertEqual(1, queue.get())
+        self.assertEqual(2, queue.get())
+        self.assertEqual(3, queue.get())
+        self.assertEqual(0, queue.size)
+
+    def test_get_many(self):
+        queue = BlockingQueue(5)
+        for i in range(5):
+            queue.put(i)
+
+        self.assertEqual([0, 1, 2], queue.get_many(3))
+        self.assertEqual([3, 4], queue.get_many(10))
+
+    def test_put_full_queue_times_out(self):
+        queue = BlockingQueue(1)
+        queue.put(1)
+
+        with self.assertRaises(TimeoutError):
+            queue.put(2, timeout=0.01)
+
+    def test_get_empty_queue_times_out(self):
+        queue = BlockingQueue(1)
+
+        with self.assertRaises(TimeoutError):
+            queue.get(timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            queue.get_many(5, timeout=0.01)
+
+    def test_producer_consumer(self):
+        queue = BlockingQueue(4)
+        received = []
+
+        def consume():
+            while len(received) < 1000:
+                received.extend(queue.get_many(16, timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+
+        for i in range(1000):
+            queue.put(i, timeout=5)
+
+        consumer.join(timeout=5)
+
+        self.assertEqual(list(range(1000)), received)
+
+    def test_init_with_invalid_max_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BlockingQueue(0)
+
+
+class AsyncQueueTest(unittest.TestCase):
+
+    def test_put_get(self):
+        async def run():
+            queue = AsyncQueue(2)
+            await queue.put(1)
+            await queue.put(2)
+
+            return [await queue.get(), await queue.get()]
+
+        self.assertEqual([1, 2], asyncio.run(run()))
+
+    def test_producer_consumer(self):
+        async def run():
+            queue = AsyncQueue(4)
+            received = []
+
+            async def produce():
+                for i in range(100):
+                    await queue.put(i)
+
+            async def consume():
+                while len(received) < 100:
+                    received.extend(await queue.get_many(8))
+
+            await asyncio.wait_for(asyncio.gather(produce(), consume()), 5)
+
+            return received
+
+        self.assertEqual(list(range(100)), asyncio.run(run()))
+
+    def test_timeouts(self):
+        async def run():
+            queue = AsyncQueue(1)
+
+            with self.assertRaises(TimeoutError):
+                await queue.get(timeout=0.01)
+
+            await queue.put(1)
+
+            with self.assertRaises(TimeoutError):
+                await queue.put(2, timeout=0.01)
+
+            # The queue should still work after a timeout
+            return await queue.get()
+
+        self.assertEqual(1, asyncio.run(run()))
+
+
+if __name__ == '__main__':
+    unittest.main()
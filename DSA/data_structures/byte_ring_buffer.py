@@ -0,0 +1,123 @@
+from typing import Any
+
+
+class ByteRingBuffer:
+    """A circular FIFO buffer of bytes, e.g. for a network receive buffer.
+
+    Like RingBuffer, but instead of one object per slot we keep a single
+    bytearray and copy whole buffers in and out of it. A write or read that
+    crosses the end of the array is split into (at most) two contiguous copies:
+    one up to the end, and one from index 0.
+
+    When the buffer is full, write normally only takes what fits.
+    With overwrite=True it drops the oldest bytes instead, which is what
+    you want for telemetry where the newest data matters most.
+
+    * write: O(k) for k bytes
+    * readinto: O(k) for k bytes
+    """
+
+    def __init__(self, capacity: int, overwrite: bool = False) -> None:
+        """Initializes the buffer.
+
+        :param capacity: The number of bytes the buffer can hold.
+        :param overwrite: If True, writing to a full buffer drops the oldest bytes.
+        """
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._read_pos = 0
+        self._overwrite = overwrite
+        self.size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def write(self, data: Any) -> int:
+        """Copies bytes into the buffer.
+
+        1. Work out how many bytes we can take (what fits, or everything if overwriting).
+        2. If overwriting, move the read position past the oldest bytes we'll clobber.
+        3. Copy up to the end of the array, then the rest from index 0.
+
+        :param data: Any bytes-like object.
+        :return: The number of bytes written.
+        """
+        data = memoryview(data).cast('B')
+        capacity = len(self._buffer)
+
+        if self._overwrite:
+            written = len(data)
+            if written > capacity:
+                # Only the newest bytes can survive
+                data = data[written - capacity:]
+
+            dropped = len(data) - (capacity - self.size)
+            if dropped > 0:
+                self._read_pos = (self._read_pos + dropped) % capacity
+                self.size -= dropped
+        else:
+            written = min(len(data), capacity - self.size)
+            data = data[:written]
+
+        count = len(data)
+        write_pos = (self._read_pos + self.size) % capacity
+        first_run = min(count, capacity - write_pos)
+
+        self._view[write_pos:write_pos + first_run] = data[:first_run]
+        self._view[:count - first_run] = data[first_run:]
+        self.size += count
+
+        return written
+
+    def readinto(self, buffer: Any) -> int:
+        """Moves bytes from the front of the buffer into a writable buffer.
+
+        :param buffer: Any writable bytes-like object (bytearray, memoryview...).
+        :return: The number of bytes read (0 if the buffer is empty).
+        """
+        target = memoryview(buffer).cast('B')
+        count = self._copy_front(target)
+        self._consume(count)
+
+        return count
+
+    def read(self, count: int = -1) -> bytes:
+        """Removes and returns up to count bytes from the front (all of them if count < 0)."""
+        if count < 0 or count > self.size:
+            count = self.size
+
+        target = bytearray(count)
+        self.readinto(target)
+
+        return bytes(target)
+
+    def peek(self, count: int = -1) -> bytes:
+        """Returns up to count bytes from the front, without removing them."""
+        if count < 0 or count > self.size:
+            count = self.size
+
+        target = bytearray(count)
+        self._copy_front(memoryview(target))
+
+        return bytes(target)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def _copy_front(self, target: memoryview) -> int:
+        """Copies bytes from the front into target (at most two copies), returns the count."""
+        count = min(len(target), self.size)
+        first_run = min(count, len(self._buffer) - self._read_pos)
+
+        target[:first_run] = self._view[self._read_pos:self._read_pos + first_run]
+        target[first_run:count] = self._view[:count - first_run]
+
+        return count
+
+    def _consume(self, count: int) -> None:
+        self._read_pos = (self._read_pos + count) % len(self._buffer)
+        self.size -= count
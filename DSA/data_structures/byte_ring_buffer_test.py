@@ -0,0 +1,67 @@
+import unittest
+
+from data_structures.byte_ring_buffer import ByteRingBuffer
+
+
+class ByteRingBufferTest(unittest.TestCase):
+
+    def test_write_read(self):
+        ring_buffer = ByteRingBuffer(8)
+
+        self.assertEqual(5, ring_buffer.write(b'hello'))
+        self.assertEqual(5, ring_buffer.size)
+        self.assertEqual(b'hel', ring_buffer.read(3))
+        self.assertEqual(b'lo', ring_buffer.read())
+        self.assertTrue(ring_buffer.is_empty())
+
+    def test_write_full_buffer_is_partial(self):
+        ring_buffer = ByteRingBuffer(4)
+
+        self.assertEqual(4, ring_buffer.write(b'abcdef'))
+        self.assertEqual(0, ring_buffer.write(b'g'))
+        self.assertEqual(b'abcd', ring_buffer.read())
+
+    def test_wrap_around(self):
+        ring_buffer = ByteRingBuffer(5)
+        ring_buffer.write(b'abcd')
+        ring_buffer.read(3)
+
+        self.assertEqual(4, ring_buffer.write(b'efgh'))
+        self.assertEqual(b'defgh', ring_buffer.peek())
+
+        target = bytearray(8)
+        self.assertEqual(5, ring_buffer.readinto(target))
+        self.assertEqual(b'defgh', bytes(target[:5]))
+        self.assertEqual(0, ring_buffer.readinto(target))
+
+    def test_readinto_memoryview_slice(self):
+        ring_buffer = ByteRingBuffer(8)
+        ring_buffer.write(bytearray(b'123456'))
+
+        target = bytearray(b'xxxxxx')
+        self.assertEqual(3, ring_buffer.readinto(memoryview(target)[2:5]))
+        self.assertEqual(b'xx123x', bytes(target))
+        self.assertEqual(b'456', ring_buffer.read())
+
+    def test_overwrite_oldest(self):
+        ring_buffer = ByteRingBuffer(5, overwrite=True)
+        ring_buffer.write(b'abcd')
+
+        self.assertEqual(3, ring_buffer.write(b'efg'))
+        self.assertEqual(5, ring_buffer.size)
+        self.assertEqual(b'cdefg', ring_buffer.read())
+
+    def test_overwrite_with_oversized_write_keeps_newest(self):
+        ring_buffer = ByteRingBuffer(4, overwrite=True)
+        ring_buffer.write(b'ab')
+
+        self.assertEqual(10, ring_buffer.write(b'0123456789'))
+        self.assertEqual(b'6789', ring_buffer.read())
+
+    def test_init_with_invalid_capacity_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ByteRingBuffer(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+import threading
+from typing import Any, Callable, Optional
+
+from data_structures.hash_map import HashMap
+
+# Default number of stripes (rounded up to a power of two).
+_STRIPES = 16
+
+# Fibonacci hashing (see OpenAddressingHashMap): multiply by 2^64 / golden ratio
+# and keep the top bits. Each stripe's HashMap picks buckets with the low bits
+# (hash % array size), so using the top bits here keeps the two choices independent.
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+# Marks "no value" in an optimistic read, since None is a valid value.
+_MISSING = object()
+
+
+class _Stripe:
+    """One partition of the map: a HashMap, the lock writers take, and a version for readers."""
+
+    __slots__ = ('map', 'lock', 'version')
+
+    def __init__(self) -> None:
+        self.map = HashMap()
+        self.lock = threading.Lock()
+        # Odd while a write is in progress (a seqlock)
+        self.version = 0
+
+
+class ConcurrentHashMap:
+    """A thread-safe hash map, split into independently locked stripes (like Java's ConcurrentHashMap).
+
+    With one HashMap behind one lock, every thread waits for every other thread.
+    Here each key belongs to one of N stripes (picked from its hash), and each stripe
+    has its own HashMap and lock, so threads only wait for each other when they
+    hit the same stripe: roughly 1/N of the time.
+
+    Writers take the stripe's lock. Readers don't take it at all (a seqlock):
+    1. Read the stripe's version. If it's odd, a write is in progress.
+    2. Look the key up.
+    3. Read the version again. If it changed, a write ran while we were reading, and we
+       might have seen half of it, so retry with the lock held.
+    Writers bump the version before and after changing the stripe, so it's odd in between.
+
+    put_if_absent and compute run entirely under the stripe's lock, so they're atomic.
+
+    Operations:
+    * Put(key, val): O(1) avg
+    * Get(key): O(1) avg
+    * Remove(key): O(1) avg
+    * Contains(key): O(1) avg
+    * Size: O(number of stripes)
+    """
+
+    def __init__(self, stripes: int = _STRIPES) -> None:
+        """Initializes the map.
+
+        :param stripes: How many independently locked partitions to use (rounded up to a power of two).
+        """
+        if stripes < 1:
+            raise ValueError('Stripes must be at least 1')
+
+        stripe_count = 1
+        while stripe_count < stripes:
+            stripe_count *= 2
+
+        self._stripes = [_Stripe() for _ in range(stripe_count)]
+        self._shift = 64 - (stripe_count.bit_length() - 1)
+
+    @property
+    def size(self) -> int:
+        """The number of keys (may be stale if other threads are writing)."""
+        return sum(stripe.map.size for stripe in self._stripes)
+
+    def put(self, key: Any, val: Any) -> None:
+        stripe = self._stripe(hash(key))
+
+        with stripe.lock:
+            stripe.version += 1
+            try:
+                stripe.map.put(key, val)
+            finally:
+                stripe.version += 1
+
+    def get(self, key: Any) -> Any:
+        """Returns the value for this key, without taking a lock (unless a write gets in the way)."""
+        val = self._read(key)
+        if val is _MISSING:
+            raise KeyError('Key not found!')
+
+        return val
+
+    def get_or_default(self, key: Any, default: Any = None) -> Any:
+        """Returns the value for this key, or default if it isn't in the map."""
+        val = self._read(key)
+
+        return default if val is _MISSING else val
+
+    def contains(self, key: Any) -> bool:
+        return self._read(key) is not _MISSING
+
+    def delete(self, key: Any) -> None:
+        stripe = self._stripe(hash(key))
+
+        with stripe.lock:
+            stripe.version += 1
+            try:
+                stripe.map.delete(key)
+            finally:
+                stripe.version += 1
+
+    def put_if_absent(self, key: Any, val: Any) -> Any:
+        """Adds the key with this value, unless it's already in the map.
+
+        Like dict.setdefault, returns the value the key has afterwards:
+        val if we added it, otherwise the value that was already there.
+        """
+        stripe = self._stripe(hash(key))
+
+        with stripe.lock:
+            current = stripe.map.get_or_default(key, _MISSING)
+            if current is not _MISSING:
+                return current
+
+            stripe.version += 1
+            try:
+                stripe.map.put(key, val)
+            finally:
+                stripe.version += 1
+
+            return val
+
+    def compute(self, key: Any, fn: Callable[[Any, Optional[Any]], Optional[Any]]) -> Optional[Any]:
+        """Atomically replaces the key's value with fn(key, current value).
+
+        current value is None if the key isn't in the map.
+        If fn returns None, the key is removed (like Java's compute).
+        fn runs with the stripe locked, so keep it short, and don't touch the map from it.
+
+        :return: The new value (None if the key was removed).
+        """
+        stripe = self._stripe(hash(key))
+
+        with stripe.lock:
+            current = stripe.map.get_or_default(key, _MISSING)
+            val = fn(key, None if current is _MISSING else current)
+
+            stripe.version += 1
+            try:
+                if val is not None:
+                    stripe.map.put(key, val)
+                elif current is not _MISSING:
+                    stripe.map.delete(key)
+            finally:
+                stripe.version += 1
+
+            return val
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def _read(self, key: Any) -> Any:
+        """Returns the key's value, or _MISSING.
+
+        Tries a lock-free read first, and falls back to taking the lock if a write overlapped it.
+        """
+        stripe = self._stripe(hash(key))
+
+        version = stripe.version
+        if version % 2 == 0:
+            try:
+                val = stripe.map.get_or_default(key, _MISSING)
+            except Exception:
+                # A write moved things around under us; the locked read below will sort it out
+                pass
+            else:
+                if stripe.version == version:
+                    return val
+
+        with stripe.lock:
+            return stripe.map.get_or_default(key, _MISSING)
+
+    def _stripe(self, key_hash: int) -> _Stripe:
+        """Gets the key's stripe, using the top bits of the scrambled hash."""
+        return self._stripes[((key_hash * _FIBONACCI) & _MASK_64) >> self._shift]
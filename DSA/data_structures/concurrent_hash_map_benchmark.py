@@ -0,0 +1,80 @@
+"""Compares ConcurrentHashMap with a HashMap behind one global lock, under a thread pool.
+
+Each thread does a mix of gets (90%) and puts (10%) on random keys.
+Shows total operations per second as the number of threads and stripes goes up.
+(With the GIL, threads can't run Python code in parallel, so on a regular build
+expect roughly equal numbers: the lock-free gets save a lock, but pay for the version
+checks and the stripe lookup. Stripes only pay off on free-threaded builds.)
+
+Run from the DSA directory:
+    python -m data_structures.concurrent_hash_map_benchmark
+"""
+import random
+import threading
+import time
+
+from data_structures.concurrent_hash_map import ConcurrentHashMap
+from data_structures.hash_map import HashMap
+
+_KEYS = 10_000
+_OPS_PER_THREAD = 50_000
+_THREADS = (1, 4, 8)
+_STRIPES = (1, 4, 16)
+_READ_RATIO = 0.9
+
+
+class _GlobalLockHashMap:
+    """What we had before: one HashMap, one lock around every call."""
+
+    def __init__(self) -> None:
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def put(self, key, val) -> None:
+        with self._lock:
+            self._map.put(key, val)
+
+    def get_or_default(self, key, default=None):
+        with self._lock:
+            return self._map.get_or_default(key, default)
+
+
+def _work(hash_map, seed: int) -> None:
+    rand = random.Random(seed)
+    for _ in range(_OPS_PER_THREAD):
+        key = rand.randrange(_KEYS)
+        if rand.random() < _READ_RATIO:
+            hash_map.get_or_default(key)
+        else:
+            hash_map.put(key, key)
+
+
+def _ops_per_second(make_map, threads: int) -> float:
+    hash_map = make_map()
+    for i in range(_KEYS):
+        hash_map.put(i, i)
+
+    workers = [threading.Thread(target=_work, args=(hash_map, seed)) for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return threads * _OPS_PER_THREAD / (time.perf_counter() - start)
+
+
+def main():
+    maps = [('global lock', _GlobalLockHashMap)]
+    maps += [(f'{stripes} stripes', lambda stripes=stripes: ConcurrentHashMap(stripes)) for stripes in _STRIPES]
+
+    print(f'{_OPS_PER_THREAD:,} ops per thread, {_READ_RATIO:.0%} gets, thousands of ops/second')
+    print(f'{"":14}' + ''.join(f'{f"{threads} threads":>14}' for threads in _THREADS))
+
+    for name, make_map in maps:
+        rates = [_ops_per_second(make_map, threads) / 1000 for threads in _THREADS]
+        print(f'{name:14}' + ''.join(f'{rate:>14.0f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
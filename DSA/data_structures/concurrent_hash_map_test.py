@@ -0,0 +1,139 @@
+import threading
+import unittest
+
+from data_structures.concurrent_hash_map import ConcurrentHashMap
+
+
+class ConcurrentHashMapTest(unittest.TestCase):
+
+    def test_put_get_delete(self):
+        hash_map = ConcurrentHashMap()
+        hash_map.put('1', 1)
+        hash_map.put('2', 2)
+        hash_map.put('1', 'one')
+
+        self.assertEqual(2, hash_map.size)
+        self.assertEqual('one', hash_map.get('1'))
+        self.assertTrue(hash_map.contains('2'))
+        self.assertIn('2', hash_map)
+
+        hash_map.delete('2')
+
+        self.assertEqual(1, len(hash_map))
+        self.assertFalse(hash_map.contains('2'))
+        with self.assertRaises(KeyError):
+            hash_map.get('2')
+        with self.assertRaises(KeyError):
+            hash_map.delete('2')
+
+    def test_get_or_default(self):
+        hash_map = ConcurrentHashMap()
+        hash_map.put('a', None)
+
+        self.assertIsNone(hash_map.get_or_default('a', 0))
+        self.assertEqual(0, hash_map.get_or_default('b', 0))
+        self.assertIsNone(hash_map.get_or_default('b'))
+
+    def test_put_if_absent(self):
+        hash_map = ConcurrentHashMap()
+
+        self.assertEqual(1, hash_map.put_if_absent('a', 1))
+        self.assertEqual(1, hash_map.put_if_absent('a', 2))
+        self.assertEqual(1, hash_map.get('a'))
+
+    def test_compute(self):
+        hash_map = ConcurrentHashMap()
+
+        self.assertEqual(1, hash_map.compute('a', lambda key, val: (val or 0) + 1))
+        self.assertEqual(2, hash_map.compute('a', lambda key, val: (val or 0) + 1))
+        self.assertEqual(2, hash_map.get('a'))
+
+        # Returning None removes the key
+        self.assertIsNone(hash_map.compute('a', lambda key, val: None))
+        self.assertFalse(hash_map.contains('a'))
+        self.assertIsNone(hash_map.compute('b', lambda key, val: None))
+        self.assertEqual(0, hash_map.size)
+
+    def test_compute_error_leaves_stripe_usable(self):
+        hash_map = ConcurrentHashMap()
+        hash_map.put('a', 1)
+
+        with self.assertRaises(ZeroDivisionError):
+            hash_map.compute('a', lambda key, val: val / 0)
+
+        self.assertEqual(1, hash_map.get('a'))
+        hash_map.put('a', 2)
+        self.assertEqual(2, hash_map.get('a'))
+
+    def test_read_during_write_falls_back_to_lock(self):
+        hash_map = ConcurrentHashMap(stripes=1)
+        hash_map.put('a', 1)
+        stripe = hash_map._stripes[0]
+
+        # Pretend a writer is halfway through: the read has to wait for the lock
+        stripe.version += 1
+        stripe.lock.acquire()
+        results = []
+        reader = threading.Thread(target=lambda: results.append(hash_map.get('a')))
+        reader.start()
+        reader.join(0.05)
+        self.assertEqual([], results)
+
+        stripe.version += 1
+        stripe.lock.release()
+        reader.join()
+        self.assertEqual([1], results)
+
+    def test_concurrent_compute_counts_exactly(self):
+        hash_map = ConcurrentHashMap(stripes=4)
+
+        def work():
+            for i in range(2000):
+                hash_map.compute(i % 50, lambda key, val: (val or 0) + 1)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(50, hash_map.size)
+        for i in range(50):
+            self.assertEqual(8 * 2000 // 50, hash_map.get(i))
+
+    def test_concurrent_readers_see_every_key(self):
+        hash_map = ConcurrentHashMap(stripes=2)
+        for i in range(100):
+            hash_map.put(i, i)
+        missing = []
+        done = threading.Event()
+
+        def write():
+            # Keeps resizing the stripes while the readers run
+            for i in range(100, 5000):
+                hash_map.put(i, i)
+            done.set()
+
+        def read():
+            while not done.is_set():
+                missing.extend(i for i in range(100) if hash_map.get_or_default(i) != i)
+
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], missing)
+        self.assertEqual(5000, hash_map.size)
+
+    def test_stripes_round_up_to_power_of_two(self):
+        self.assertEqual(8, len(ConcurrentHashMap(stripes=5)._stripes))
+        self.assertEqual(1, len(ConcurrentHashMap(stripes=1)._stripes))
+
+        with self.assertRaises(ValueError):
+            ConcurrentHashMap(stripes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
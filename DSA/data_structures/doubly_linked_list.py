@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, Callable, Iterator, Optional
+
+from data_structures.linked_list import merge_sort_nodes
 
 
 class Node:
@@ -23,6 +25,11 @@ class DoublyLinkedList:
     * Add to head/tail: O(1)
     * Pop head/tail: O(1)
     * Remove value: O(n)
+    * Remove/move/insert after a node: O(1)
+
+    The add methods return the node they added, as a handle. Hang on to it
+    and you can later remove or move that item in O(1), without searching
+    (this is how an LRU cache uses its list).
 
     Uses:
         * Implement stack or queue.
@@ -33,7 +40,7 @@ class DoublyLinkedList:
         self._tail = None
         self.size = 0
 
-    def add_to_head(self, val: Any) -> None:
+    def add_to_head(self, val: Any) -> Node:
         """Adds an item to the start of the queue.
 
         1. Save the previous head.
@@ -44,7 +51,7 @@ class DoublyLinkedList:
         Space: O(1)
 
         :param val: The item to add.
-        :return: None
+        :return: The new node (a handle for remove_node etc.)
         """
         previous_head = self._head
         self._head = Node(val)
@@ -57,7 +64,9 @@ class DoublyLinkedList:
 
         self.size += 1
 
-    def add_to_tail(self, val: Any) -> None:
+        return self._head
+
+    def add_to_tail(self, val: Any) -> Node:
         """Adds an item to the end of the queue.
 
         1. Save the previous tail
@@ -69,7 +78,7 @@ class DoublyLinkedList:
         Space: O(1)
 
         :param val: The item to add.
-        :return: None
+        :return: The new node (a handle for remove_node etc.)
         """
         previous_tail = self._tail
         self._tail = Node(val)
@@ -82,11 +91,13 @@ class DoublyLinkedList:
 
         self.size += 1
 
+        return self._tail
+
     def pop_head(self) -> Any:
         """Removes and returns the head.
 
         1. Save the value at head.
-        2. Set head = head.next
+        2. Set head = head.next, and unlink the old head.
         3. If new head empty, set the tail empty too.
 
         Time: O(1)
@@ -97,20 +108,23 @@ class DoublyLinkedList:
         if not self._head:
             raise Exception('List is empty')
 
-        val = self._head.val
-        self._head = self._head.next
+        old_head = self._head
+        self._head = old_head.next
+        old_head.next = None
         self.size -= 1
 
         if not self._head:  # We had a len(1) queue.
             self._tail = None
+        else:
+            self._head.prev = None
 
-        return val
+        return old_head.val
 
     def pop_tail(self) -> Any:
         """Removes and returns the tail.
 
         1. Save the value at tail.
-        2. Set the tail to be tail previous.
+        2. Set the tail to be tail previous, and unlink the old tail.
         3. If the tail is null, set head null too.
 
         Time: O(1)
@@ -121,22 +135,24 @@ class DoublyLinkedList:
         if not self._tail:
             raise Exception('List is empty')
 
-        val = self._tail.val
-        self._tail = self._tail.prev
+        old_tail = self._tail
+        self._tail = old_tail.prev
+        old_tail.prev = None
         self.size -= 1
 
         if not self._tail:  # We had a len(1) queue.
             self._head = None
+        else:
+            self._tail.next = None
 
-        return val
+        return old_tail.val
 
     def remove_val(self, val: Any) -> None:
         """Removes a value from the queue.
 
         1. Iterate while current node exists and doesn't equal value.
         2. If current node == None, the value wasn't found.
-        3. If current node is head or tail, pop head or pop tail
-        4. Else set the previous node's next to the current node's next.
+        3. Unlink the node (see remove_node).
 
         Time: O(n)
         Space: O(1)
@@ -155,13 +171,70 @@ class DoublyLinkedList:
         if not current_node:
             raise KeyError('Value not found')
 
-        if current_node is self._head:
-            self.pop_head()
-        elif current_node is self._tail:
-            self.pop_tail()
-        else:
-            current_node.prev.next = current_node.next
-            self.size -= 1
+        self.remove_node(current_node)
+
+    def remove_node(self, node: Node) -> Any:
+        """Removes a node that was returned by one of the add methods.
+
+        1. Point the previous node (or head) past the node.
+        2. Point the next node (or tail) back past the node.
+        3. Clear the node's links, so we can tell it's no longer in the list.
+
+        Time: O(1)
+        Space: O(1)
+
+        :param node: The handle of the node to remove.
+        :return: The node's value.
+        """
+        self._check_linked(node)
+        self._unlink(node)
+        self.size -= 1
+
+        return node.val
+
+    def move_to_head(self, node: Node) -> None:
+        """Moves a node to the start of the queue (e.g. marking it most recently used).
+
+        Time: O(1)
+        Space: O(1)
+
+        :param node: The handle of the node to move.
+        :return: None.
+        """
+        self._check_linked(node)
+
+        if node is self._head:
+            return
+
+        self._unlink(node)
+
+        node.next = self._head
+        self._head.prev = node
+        self._head = node
+
+    def insert_after(self, node: Node, val: Any) -> Node:
+        """Adds an item straight after a node.
+
+        Time: O(1)
+        Space: O(1)
+
+        :param node: The handle of the node to insert after.
+        :param val: The item to add.
+        :return: The new node (a handle for remove_node etc.)
+        """
+        self._check_linked(node)
+
+        if node is self._tail:
+            return self.add_to_tail(val)
+
+        new_node = Node(val)
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.size += 1
+
+        return new_node
 
     def reverse(self) -> None:
         """Reverses the queue.
@@ -200,17 +273,103 @@ class DoublyLinkedList:
         self._tail = old_head
         self._head = previous
 
+    def sort(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        """Sorts the queue in place by relinking its nodes.
+
+        1. Sort the chain using only the next pointers (see merge_sort_nodes).
+        2. Walk the sorted chain once to fix up the prev pointers.
+
+        Time: O(n log n)
+        Space: O(1)
+
+        :param key: A function to get the value to compare by
+                    (called O(n log n) times, unlike sorted, so keep it cheap).
+        :return: None.
+        """
+        if self.size <= 1:
+            return
+
+        self._head, self._tail = merge_sort_nodes(self._head, key)
+
+        previous = None
+        current = self._head
+
+        while current:
+            current.prev = previous
+            previous = current
+            current = current.next
+
     def is_empty(self) -> bool:
         return self.size == 0
 
-    def __iter__(self):
-        self.current = self._head
-        return self
+    def window(self, start: int, stop: Optional[int] = None) -> Iterator[Any]:
+        """Lazily yields the values in [start, stop), like islice(queue, start, stop).
+
+        Negative indices count from the end (like slicing).
+        We find the first node by walking from whichever end is closer,
+        so a window near the tail doesn't walk the whole list.
+
+        Time: O(min(start, size - start) + (stop - start))
+        Space: O(1)
+
+        :param start: The index of the first value.
+        :param stop: The index to stop before (None for the end of the queue).
+        :return: An iterator over the values.
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+
+        if start <= self.size // 2:
+            node = self._head
+            for _ in range(start):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self.size - 1 - start):
+                node = node.prev
+
+        for _ in range(stop - start):
+            yield node.val
+            node = node.next
 
-    def __next__(self):
-        if not self.current:
-            raise StopIteration
+    def __iter__(self) -> Iterator[Any]:
+        """Yields the values from head to tail.
 
-        val = self.current
-        self.current = self.current.next
-        return val
+        Each call gets its own cursor, so nested loops over the same queue work.
+        """
+        node = self._head
+        while node:
+            yield node.val
+            node = node.next
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Yields the values from tail to head."""
+        node = self._tail
+        while node:
+            yield node.val
+            node = node.prev
+
+    def _unlink(self, node: Node) -> None:
+        """Links a node's neighbours to each other, fixing up head/tail, and clears its links."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+
+        node.next = None
+        node.prev = None
+
+    def _check_linked(self, node: Node) -> None:
+        """Raises if a node has already been removed.
+
+        A removed node has no links, and only a 1-item list's head has no links too.
+        We can't cheaply check a node belongs to THIS list though.
+        """
+        if not node.prev and not node.next and node is not self._head:
+            raise ValueError('Node is not in the list')
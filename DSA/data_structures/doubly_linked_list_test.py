@@ -101,3 +101,153 @@ class DoublyLinkedListTest(unittest.TestCase):
         self.assertEqual(3, deque._head.next.next.val)
         self.assertEqual(2, deque._head.next.next.next.val)
         self.assertEqual(1, deque._tail.val)
+
+    def test_sort(self):
+        deque = DoublyLinkedList()
+        for val in [5, 3, 4, 1, 2, 3]:
+            deque.add_to_tail(val)
+
+        deque.sort()
+
+        self.assertEqual(1, deque._head.val)
+        self.assertIsNone(deque._head.prev)
+        self.assertEqual(5, deque._tail.val)
+        self.assertIsNone(deque._tail.next)
+
+        # Walk both ways to check next and prev agree
+        forwards = []
+        node = deque._head
+        while node:
+            forwards.append(node.val)
+            node = node.next
+
+        backwards = []
+        node = deque._tail
+        while node:
+            backwards.append(node.val)
+            node = node.prev
+
+        self.assertEqual([1, 2, 3, 3, 4, 5], forwards)
+        self.assertEqual([5, 4, 3, 3, 2, 1], backwards)
+
+    def test_sort_with_key(self):
+        deque = DoublyLinkedList()
+        for val in ['ccc', 'a', 'bb']:
+            deque.add_to_tail(val)
+
+        deque.sort(key=len)
+
+        self.assertEqual('a', deque.pop_head())
+        self.assertEqual('ccc', deque.pop_tail())
+        self.assertEqual('bb', deque.pop_tail())
+
+    def test_remove_val_fixes_prev_links(self):
+        deque = DoublyLinkedList()
+        for val in [1, 2, 3]:
+            deque.add_to_tail(val)
+
+        deque.remove_val(2)
+
+        self.assertEqual(1, deque._tail.prev.val)
+        self.assertEqual(3, deque._head.next.val)
+
+    def test_pop_clears_links(self):
+        deque = DoublyLinkedList()
+        for val in [1, 2, 3]:
+            deque.add_to_tail(val)
+
+        deque.pop_head()
+        deque.pop_tail()
+
+        self.assertIsNone(deque._head.prev)
+        self.assertIsNone(deque._tail.next)
+        self.assertIs(deque._head, deque._tail)
+
+    def test_remove_node(self):
+        deque = DoublyLinkedList()
+        first = deque.add_to_tail(1)
+        middle = deque.add_to_tail(2)
+        last = deque.add_to_tail(3)
+
+        self.assertEqual(2, deque.remove_node(middle))
+        self.assertIs(last, first.next)
+        self.assertIs(first, last.prev)
+
+        self.assertEqual(1, deque.remove_node(first))
+        self.assertEqual(3, deque.remove_node(last))
+        self.assertTrue(deque.is_empty())
+        self.assertIsNone(deque._head)
+        self.assertIsNone(deque._tail)
+
+    def test_remove_node_twice_raises_value_error(self):
+        deque = DoublyLinkedList()
+        node = deque.add_to_tail(1)
+        deque.add_to_tail(2)
+
+        deque.remove_node(node)
+        with self.assertRaises(ValueError):
+            deque.remove_node(node)
+
+        self.assertEqual(1, deque.size)
+
+    def test_move_to_head(self):
+        deque = DoublyLinkedList()
+        first = deque.add_to_tail(1)
+        deque.add_to_tail(2)
+        last = deque.add_to_tail(3)
+
+        deque.move_to_head(last)
+        self.assertEqual(3, deque._head.val)
+        self.assertEqual(2, deque._tail.val)
+        self.assertIsNone(deque._tail.next)
+
+        deque.move_to_head(last)
+        deque.move_to_head(first)
+        self.assertEqual(1, deque.pop_head())
+        self.assertEqual(3, deque.pop_head())
+        self.assertEqual(2, deque.pop_head())
+
+    def test_insert_after(self):
+        deque = DoublyLinkedList()
+        first = deque.add_to_tail(1)
+        last = deque.add_to_tail(3)
+
+        middle = deque.insert_after(first, 2)
+        end = deque.insert_after(last, 4)
+
+        self.assertEqual(4, deque.size)
+        self.assertIs(middle, last.prev)
+        self.assertIs(end, deque._tail)
+        self.assertEqual(1, deque.pop_head())
+        self.assertEqual(2, deque.pop_head())
+        self.assertEqual(3, deque.pop_head())
+        self.assertEqual(4, deque.pop_head())
+
+
+class DoublyLinkedListIterationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.deque = DoublyLinkedList()
+        for val in range(10):
+            self.deque.add_to_tail(val)
+
+    def test_iteration_yields_values(self):
+        self.assertEqual(list(range(10)), list(self.deque))
+
+    def test_nested_iteration(self):
+        pairs = [(a, b) for a in self.deque for b in self.deque]
+
+        self.assertEqual(100, len(pairs))
+        self.assertEqual((9, 9), pairs[-1])
+
+    def test_reversed(self):
+        self.assertEqual(list(range(9, -1, -1)), list(reversed(self.deque)))
+
+    def test_window(self):
+        self.assertEqual([2, 3, 4], list(self.deque.window(2, 5)))
+        self.assertEqual([7, 8, 9], list(self.deque.window(-3)))
+        self.assertEqual([6, 7], list(self.deque.window(-4, -2)))
+        self.assertEqual([0], list(self.deque.window(0, 1)))
+        self.assertEqual([9], list(self.deque.window(9)))
+        self.assertEqual([], list(self.deque.window(5, 2)))
+        self.assertEqual([], list(DoublyLinkedList().window(0)))
@@ -0,0 +1,178 @@
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Average keys per bucket when placing keys. Bigger buckets mean fewer seeds to store
+# (CHD's paper uses ~5), but in Python the seed search is what's slow: with ~1 key per bucket,
+# over a third of the keys land in single key buckets that take a slot directly, so the
+# multi-key buckets never have to squeeze into an almost full table.
+_KEYS_PER_BUCKET = 1
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+def _mix(key_hash: int, seed: int) -> int:
+    """Scrambles a hash with a seed (SplitMix64's finalizer), so each seed sends the key somewhere else."""
+    x = (key_hash + seed * _GOLDEN) & _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
+
+class FrozenHashMap:
+    """A read-only hash map where every key gets its own slot (a minimal perfect hash).
+
+    Cf. HashMap, which has to cope with any key turning up, so it keeps spare
+    buckets and chains keys that collide. When we know every key up front,
+    we can instead pick a hash function with no collisions at all, and store
+    n keys in exactly n slots. A lookup is then one probe: no chains, no tombstones.
+
+    We build that function with CHD (compress, hash and displace):
+    1. Split the keys into buckets of ~_KEYS_PER_BUCKET, by hash.
+    2. Going from the biggest bucket to the smallest, try seeds 1, 2, 3...
+       until mix(hash, seed) % n puts every key in the bucket in a free slot.
+       Store that seed for the bucket.
+    3. Buckets with one key just take any free slot directly.
+       We store that as a negative seed: -(slot + 1).
+    Lookup: slot = mix(hash, seed of the key's bucket) % n, or the direct slot.
+
+    Keys with exactly the same hash can't be split up by any seed,
+    so all but the first of them go in a small overflow dict.
+
+    The keys, values and hashes live in flat arrays (the seeds and hashes in
+    typed arrays), so there's no per-entry node like in HashMap.
+
+    * Build: O(n) expected
+    * Get(key): O(1) worst case (one probe)
+    * Contains(key): O(1) worst case
+    """
+
+    def __init__(self, keys: List[Any], vals: List[Any], hashes: array, seeds: array,
+                 overflow: Dict[Any, Any]) -> None:
+        """Use from_items (or HashMap.freeze) to build one."""
+        self._keys = keys
+        self._vals = vals
+        self._hashes = hashes
+        self._seeds = seeds
+        self._overflow = overflow
+        self.size = len(keys) + len(overflow)
+
+    @classmethod
+    def from_items(cls, pairs: Any) -> 'FrozenHashMap':
+        """Builds the map from (key, value) pairs. If a key appears more than once, the last value wins.
+
+        :param pairs: A dict, a HashMap, or an iterable of (key, value) pairs.
+        """
+        if hasattr(pairs, 'items'):
+            pairs = pairs.items()
+
+        # Group the pairs by full hash, dropping repeated keys
+        by_hash: Dict[int, List[List[Any]]] = {}
+        for key, val in pairs:
+            group = by_hash.setdefault(hash(key), [])
+            for pair in group:
+                if pair[0] is key or pair[0] == key:
+                    pair[1] = val
+                    break
+            else:
+                group.append([key, val])
+
+        # The first key for each hash goes in the table, the rest overflow
+        entries: List[Tuple[int, Any, Any]] = []
+        overflow = {}
+        for key_hash, group in by_hash.items():
+            entries.append((key_hash, group[0][0], group[0][1]))
+            overflow.update(group[1:])
+
+        size = len(entries)
+        bucket_count = max(1, size // _KEYS_PER_BUCKET)
+        buckets: List[List[int]] = [[] for _ in range(bucket_count)]
+        for i, (key_hash, _, _) in enumerate(entries):
+            buckets[_mix(key_hash, 0) % bucket_count].append(i)
+
+        seeds = array('q', [0] * bucket_count)
+        slots = [-1] * size  # The entry in each slot
+        by_size = sorted(range(bucket_count), key=lambda bucket: len(buckets[bucket]), reverse=True)
+
+        for bucket in by_size:
+            members = buckets[bucket]
+            if len(members) < 2:
+                break
+
+            seed = 1
+            while True:
+                chosen = {_mix(entries[i][0], seed) % size for i in members}
+                if len(chosen) == len(members) and all(slots[slot] == -1 for slot in chosen):
+                    break
+                seed += 1
+
+            for i in members:
+                slots[_mix(entries[i][0], seed) % size] = i
+            seeds[bucket] = seed
+
+        # Single key buckets take the remaining slots directly
+        free_slots = (slot for slot in range(size) if slots[slot] == -1)
+        for bucket in by_size:
+            if len(buckets[bucket]) == 1:
+                slot = next(free_slots)
+                slots[slot] = buckets[bucket][0]
+                seeds[bucket] = -(slot + 1)
+
+        keys = [entries[i][1] for i in slots]
+        vals = [entries[i][2] for i in slots]
+        hashes = array('q', (entries[i][0] for i in slots))
+
+        return cls(keys, vals, hashes, seeds, overflow)
+
+    def get(self, key: Any) -> Any:
+        """Returns the value for this key."""
+        key_hash = hash(key)
+        slot = self._slot(key_hash)
+
+        if slot is not None and self._hashes[slot] == key_hash:
+            slot_key = self._keys[slot]
+            if slot_key is key or slot_key == key:
+                return self._vals[slot]
+
+        if self._overflow and key in self._overflow:
+            return self._overflow[key]
+
+        raise KeyError('Key not found!')
+
+    def contains(self, key: Any) -> bool:
+        try:
+            self.get(key)
+        except KeyError:
+            return False
+
+        return True
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        yield from zip(self._keys, self._vals)
+        yield from self._overflow.items()
+
+    def keys(self) -> Iterator[Any]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[Any]:
+        return (val for _, val in self.items())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def _slot(self, key_hash: int) -> Optional[int]:
+        """Returns the only slot the key could be in (None for an empty map)."""
+        if not self._keys:
+            return None
+
+        seed = self._seeds[_mix(key_hash, 0) % len(self._seeds)]
+        if seed < 0:
+            return -seed - 1
+
+        return _mix(key_hash, seed) % len(self._keys)
@@ -0,0 +1,94 @@
+import unittest
+
+from data_structures.frozen_hash_map import FrozenHashMap
+from data_structures.hash_map import HashMap
+
+
+class _SameHashKey:
+    """Distinct keys that all have exactly the same hash."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, _SameHashKey) and self.name == other.name
+
+
+class FrozenHashMapTest(unittest.TestCase):
+
+    def test_get(self):
+        hash_map = FrozenHashMap.from_items({'a': 1, 'b': 2, 'c': 3})
+
+        self.assertEqual(3, hash_map.size)
+        self.assertEqual(1, hash_map.get('a'))
+        self.assertEqual(2, hash_map.get('b'))
+        self.assertEqual(3, hash_map.get('c'))
+        self.assertTrue(hash_map.contains('a'))
+        self.assertNotIn('d', hash_map)
+
+        with self.assertRaises(KeyError):
+            hash_map.get('d')
+
+    def test_many_keys_one_slot_each(self):
+        pairs = [(str(i), i) for i in range(5000)] + [(i, -i) for i in range(5000)]
+        hash_map = FrozenHashMap.from_items(pairs)
+
+        # n keys in exactly n slots
+        self.assertEqual(10000, len(hash_map._keys))
+        for key, val in pairs:
+            self.assertEqual(val, hash_map.get(key))
+        for i in range(5000, 6000):
+            self.assertFalse(hash_map.contains(str(i)))
+            self.assertFalse(hash_map.contains(i))
+
+    def test_last_value_wins(self):
+        hash_map = FrozenHashMap.from_items([('a', 1), ('b', 2), ('a', 3)])
+
+        self.assertEqual(2, hash_map.size)
+        self.assertEqual(3, hash_map.get('a'))
+
+    def test_keys_with_the_same_hash_overflow(self):
+        keys = [_SameHashKey(i) for i in range(5)]
+        hash_map = FrozenHashMap.from_items([(key, key.name) for key in keys] + [('x', 'y')])
+
+        self.assertEqual(6, hash_map.size)
+        self.assertEqual(4, len(hash_map._overflow))
+        for key in keys:
+            self.assertEqual(key.name, hash_map.get(_SameHashKey(key.name)))
+        self.assertEqual('y', hash_map.get('x'))
+        self.assertFalse(hash_map.contains(_SameHashKey(10)))
+
+    def test_empty_map(self):
+        hash_map = FrozenHashMap.from_items([])
+
+        self.assertEqual(0, len(hash_map))
+        self.assertFalse(hash_map.contains('a'))
+        self.assertEqual([], list(hash_map.items()))
+
+    def test_iteration(self):
+        hash_map = FrozenHashMap.from_items({'a': 1, 'b': 2, _SameHashKey(0): 3, _SameHashKey(1): 4})
+
+        self.assertEqual(4, len(list(hash_map)))
+        self.assertEqual({1, 2, 3, 4}, set(hash_map.values()))
+        self.assertEqual(1, dict(hash_map.items())['a'])
+
+    def test_freeze_hash_map(self):
+        hash_map = HashMap.from_dict({i: str(i) for i in range(100)})
+        frozen = hash_map.freeze()
+
+        # A copy: changing the HashMap afterwards doesn't change it
+        hash_map.put(0, 'changed')
+        hash_map.put(100, '100')
+
+        self.assertEqual(100, frozen.size)
+        self.assertEqual('0', frozen.get(0))
+        self.assertFalse(frozen.contains(100))
+        for i in range(100):
+            self.assertEqual(str(i), frozen.get(i))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,165 @@
-from typing import Any
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from data_structures.frozen_hash_map import FrozenHashMap
 
 # Typically set to power or two or prime number
 _ARRAY_SIZE = 97
 
+# Grow the array once size > max load factor * array size (same default as Java).
+# Shrink it once size < max load factor / 4 * array size.
+_MAX_LOAD_FACTOR = 0.75
+
+# How many buckets to move from the old array to the new one per operation while resizing.
+_REHASH_STEP = 4
+
+# Turn a chain into a _TreeBin once it gets longer than this, and back once it's this short
+# (same as Java's HashMap; the gap stops a bucket flipping back and forth).
+_TREEIFY_THRESHOLD = 8
+_UNTREEIFY_THRESHOLD = 6
+
+# Key types whose instances are totally ordered against each other, and whose comparisons
+# never raise. Only these get sorted within a run of equal hashes in a _TreeBin.
+_ORDERED_TYPES = (int, str, bytes)
+
 
 class Node:
 
-    def __init__(self, key: Any, val: Any, next_node):
+    def __init__(self, key: Any, val: Any, next_node, key_hash: int):
         self.key = key
+        # The key's full hash, so we can skip __eq__ on nodes that can't match,
+        # and move the node when resizing without hashing the key again.
+        self.key_hash = key_hash
         self.val = val
         self.next = next_node
 
 
+def _matches(node: Node, key: Any, key_hash: int) -> bool:
+    """Only nodes with the same hash can hold the key, so we compare the (cheap) stored
+    hashes first, then identity, and only call the key's __eq__ on a real candidate.
+    """
+    return node.key_hash == key_hash and (node.key is key or node.key == key)
+
+
+def _chain_length(node: Optional[Node], limit: int) -> int:
+    """Counts the nodes in a chain, stopping at limit."""
+    length = 0
+    while node and length < limit:
+        length += 1
+        node = node.next
+    return length
+
+
+def _chain(node: Optional[Node]) -> Iterator[Node]:
+    """Yields the nodes in a chain (safe to relink each node once it's been yielded)."""
+    while node:
+        next_node = node.next
+        yield node
+        node = next_node
+
+
+class _TreeBin:
+    """A bucket whose chain got too long, with its nodes kept sorted by hash.
+
+    Cf. Java 8's HashMap, which turns long chains into red-black trees, so a flood
+    of colliding keys costs O(log n) per lookup instead of O(n).
+    We get the same O(log n) lookups with a binary search over a sorted array.
+    (Inserting shifts the array along, but that's one fast memmove.)
+
+    Keys with exactly the same hash form a run. We can only binary search a run
+    if its keys are totally ordered, and a key's < can't be trusted for that
+    (e.g. frozenset's < is a subset test, so sorting by it puts keys in the wrong place).
+    So a run is only sorted by key while every key in it has the same type, and
+    that type is in _ORDERED_TYPES. Any other run is kept in insertion order and scanned,
+    like a chain (Java falls back to a scan for keys that aren't Comparable too).
+    """
+
+    __slots__ = ('_hashes', '_keys', '_nodes', '_run_types')
+
+    def __init__(self, nodes: Iterable[Node]) -> None:
+        # Parallel lists, sorted by hash (the keys are only there to bisect on)
+        self._hashes: List[int] = []
+        self._keys: List[Any] = []
+        self._nodes: List[Node] = []
+        # The key type of each run that's sorted by key, or None if the run is just scanned
+        self._run_types: Dict[int, Optional[type]] = {}
+
+        for node in nodes:
+            node.next = None
+            self.add(node)
+
+    @classmethod
+    def from_chain(cls, node: Node) -> '_TreeBin':
+        return cls(_chain(node))
+
+    def to_chain(self) -> Optional[Node]:
+        """Links the nodes back up into a chain, and returns its head."""
+        head = None
+        for node in reversed(self._nodes):
+            node.next = head
+            head = node
+
+        return head
+
+    def find(self, key: Any, key_hash: int) -> Optional[Node]:
+        index = self._index(key, key_hash)
+        return self._nodes[index] if index is not None else None
+
+    def add(self, node: Node) -> None:
+        """Adds a node (for a key that isn't in the bin yet) in sorted position."""
+        key_hash, key = node.key_hash, node.key
+        lo, hi = self._run(key_hash)
+
+        if lo == hi:
+            self._run_types[key_hash] = type(key) if type(key) in _ORDERED_TYPES else None
+        elif self._run_types[key_hash] is not type(key):
+            # Different types can't be ordered against each other, so this run gets scanned from now on
+            self._run_types[key_hash] = None
+
+        index = bisect_left(self._keys, key, lo, hi) if self._run_types[key_hash] else hi
+        self._hashes.insert(index, key_hash)
+        self._keys.insert(index, key)
+        self._nodes.insert(index, node)
+
+    def remove(self, key: Any, key_hash: int) -> bool:
+        """Removes the key's node, returns True if it was there."""
+        index = self._index(key, key_hash)
+        if index is None:
+            return False
+
+        del self._hashes[index]
+        del self._keys[index]
+        del self._nodes[index]
+
+        lo, hi = self._run(key_hash)
+        if lo == hi:
+            del self._run_types[key_hash]
+
+        return True
+
+    def _index(self, key: Any, key_hash: int) -> Optional[int]:
+        lo, hi = self._run(key_hash)
+
+        if lo < hi and type(key) is self._run_types[key_hash]:
+            index = bisect_left(self._keys, key, lo, hi)
+            if index < hi and _matches(self._nodes[index], key, key_hash):
+                return index
+            return None
+
+        return next((i for i in range(lo, hi) if _matches(self._nodes[i], key, key_hash)), None)
+
+    def _run(self, key_hash: int) -> Tuple[int, int]:
+        """Returns the [start, end) indexes of the nodes with this hash."""
+        lo = bisect_left(self._hashes, key_hash)
+        return lo, bisect_right(self._hashes, key_hash, lo)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._nodes)
+
+
 class HashMap:
     """A hash map implemented with chaining.
 
@@ -22,100 +170,335 @@ class HashMap:
     Therefore, even though we may have "wasted space", this
     behaves more gracefully as the array fills up.
 
-    Operations:
-    * Put(key, val): O(1) avg, O(n) worst case (collisions)
-    * Get(key): O(1) avg, O(n) worst case
-    * Remove(key): O(1) avg, O(n) worst case
-    * Contains(key): O(1) avg, O(n) worst case
+    Resizing:
+    Once the load factor (size / number of buckets) goes over max_load_factor,
+    the chains start getting long, so we double the array (and halve it when
+    the map gets sparse). Every key has to be moved to its bucket in the new array,
+    but instead of doing that all in one go (a big pause on one unlucky put),
+    we rehash incrementally, like Redis:
+        * Keep the old array around, and move _REHASH_STEP buckets across on every operation.
+        * Until it's done, look keys up in both arrays, and add new keys to the new array.
+
+    Each node caches its key's hash, so lookups skip nodes whose hash differs
+    without calling the key's (possibly expensive) __eq__, and resizing never rehashes a key.
+
+    Collisions:
+    If lots of keys land in one bucket (e.g. someone picks keys that collide on purpose),
+    walking the chain makes every operation O(n). So, like Java 8, once a chain gets longer
+    than _TREEIFY_THRESHOLD we keep that bucket sorted by hash instead (see _TreeBin), which bounds
+    the worst case at O(log n), as long as the keys' full hashes differ (or they're int/str/bytes).
+    Keys that all have exactly the same hash, and can't be ordered, still cost O(n).
+
+    Operations (worst case is with colliding keys):
+    * Put(key, val): O(1) avg, O(log n) worst case
+    * Get(key): O(1) avg, O(log n) worst case
+    * Remove(key): O(1) avg, O(log n) worst case
+    * Contains(key): O(1) avg, O(log n) worst case
+    * Put many(k pairs): O(k) avg, resizing at most once
+    * Iterate keys/values/items: O(n + number of buckets)
     """
-    def __init__(self, size: int = _ARRAY_SIZE):
-        """Initialize the array with a default size."""
+    def __init__(self, size: int = _ARRAY_SIZE, max_load_factor: float = _MAX_LOAD_FACTOR):
+        """Initialize the array with a default size.
+
+        :param size: The initial number of buckets (also the smallest we'll shrink to).
+        :param max_load_factor: The average chain length that triggers growing the array.
+        """
+        if size < 1:
+            raise ValueError('Size must be at least 1')
+        if max_load_factor <= 0:
+            raise ValueError('Max load factor must be positive')
+
         self._arr = [None] * size
+        self._min_array_size = size
+        self._max_load_factor = max_load_factor
         self.size = 0
 
+        # While resizing: the array we're moving buckets out of, and the next bucket to move.
+        self._old_arr: Optional[List[Node]] = None
+        self._rehash_index = 0
+
     def put(self, key: Any, val: Any):
         """Adds a key and value to the hash map.
 
-        1. Get the hash (index)
-        2. Get the node at that index
-        3. While it's not null...
-            3.1 If the key matches, just update the value (key already exists)
-        4. Set the node at this index to be key, val, and the node at this index if it exists
-           (i.e., add it to the front of the linked list)
+        1. Move a few buckets if we're resizing.
+        2. Look for the key (in both arrays if we're resizing)
+            2.1 If it exists, just update the value
+        3. Otherwise, add a new node at the front of the key's chain in the (new) array
+           (or into its _TreeBin, if the chain got too long).
+        4. Start resizing if we went over the max load factor.
 
         Time: O(1) average, O(n) worst case
         """
-        index = self._hash(key)
-        node = self._arr[index]
+        self._rehash_step()
 
-        while node:
-            if node.key == key:
-                # Updating an existing key
-                node.val = val
-                return
-            node = node.next
+        key_hash = hash(key)
+        node = self._find(key, key_hash)
+        if node:
+            # Updating an existing key
+            node.val = val
+            return
 
+        self._add(self._arr, Node(key, val, None, key_hash))
         self.size += 1
-        self._arr[index] = Node(key, val, self._arr[index])
+
+        self._resize_if_needed()
 
     def contains(self, key: Any) -> bool:
         """Returns True if key exists in map"""
-        index = self._hash(key)
-        node = self._arr[index]
-
-        while node:
-            if node.key == key:
-                return True
-            node = node.next
+        self._rehash_step()
 
-        return False
+        return self._find(key, hash(key)) is not None
 
     def get(self, key: Any) -> Any:
         """Returns the value for this key."""
-        index = self._hash(key)
-        node = self._arr[index]
+        self._rehash_step()
 
-        while node:
-            if node.key == key:
-                return node.val
-            node = node.next
+        node = self._find(key, hash(key))
+        if not node:
+            raise KeyError('Key not found!')
 
-        raise KeyError('Key not found!')
+        return node.val
+
+    def get_or_default(self, key: Any, default: Any = None) -> Any:
+        """Returns the value for this key, or default if it isn't in the map.
+
+        Unlike get, this doesn't move any buckets along if we're resizing,
+        so it never changes the map (ConcurrentHashMap relies on that for lock-free reads).
+        """
+        node = self._find(key, hash(key))
+
+        return node.val if node else default
 
     def delete(self, key: Any) -> None:
-        """Deletes a key from the hash map in a recursive fashion.
+        """Deletes a key from the hash map.
 
-        1. Get the node at this index.
-        2. Call the delete function with this node and key.
-            2.1 If the node is null, raise a KeyError.
-            2.2 If the node.key == key, return next node.
-            2.3 Set node.next to a call with node.next
-            2.4 Return the node.
+        1. Move a few buckets if we're resizing.
+        2. Unlink the key's node from its chain in the (new) array,
+           or from the old array if it hasn't been moved yet.
+        3. If neither had it, raise a KeyError.
+        4. Start resizing if the map got sparse.
 
         Time: O(1) average, O(n) worst case.
         """
-        index = self._hash(key)
-        self._arr[index] = self._delete(self._arr[index], key)
+        self._rehash_step()
 
-    def _delete(self, node: Node, key: Any) -> Node:
-        """Delete helper method."""
-        if not node:
-            raise KeyError('Key not found!')
+        key_hash = hash(key)
+        if not self._delete(self._arr, key, key_hash):
+            if self._old_arr is None or not self._delete(self._old_arr, key, key_hash):
+                raise KeyError('Key not found!')
+
+        self.size -= 1
+        self._resize_if_needed()
+
+    @classmethod
+    def from_dict(cls, mapping: Mapping[Any, Any], max_load_factor: float = _MAX_LOAD_FACTOR) -> 'HashMap':
+        """Builds a hash map with the same keys and values, sized for them up front."""
+        hash_map = cls(max_load_factor=max_load_factor)
+        hash_map.update(mapping)
+
+        return hash_map
 
-        if key == node.key:
-            self.size -= 1
-            return node.next
+    def put_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Adds (key, value) pairs, like calling put on each one.
+
+        1. Grow the array once, to fit every pair (and finish any resize that's running).
+        2. Add each pair straight into the array, without put's per-call resize checks.
+
+        Time: O(k) average for k pairs
+        """
+        pairs = list(pairs)
+        self._reserve(self.size + len(pairs))
+        arr = self._arr
+
+        for key, val in pairs:
+            key_hash = hash(key)
+            node = self._find_in(arr, key, key_hash)
+
+            if node:
+                node.val = val
+            else:
+                self._add(arr, Node(key, val, None, key_hash))
+                self.size += 1
+
+    def update(self, mapping: Union[Mapping[Any, Any], 'HashMap', Iterable[Tuple[Any, Any]]]) -> None:
+        """Adds every key and value from a dict, another HashMap, or an iterable of pairs."""
+        self.put_many(mapping.items() if hasattr(mapping, 'items') else mapping)
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        """Returns the value for each key, or default for keys that aren't in the map."""
+        self._rehash_step()
+
+        values = []
+        for key in keys:
+            node = self._find(key, hash(key))
+            values.append(node.val if node else default)
+
+        return values
+
+    def freeze(self) -> FrozenHashMap:
+        """Returns a read-only copy where every lookup is one probe (see FrozenHashMap)."""
+        return FrozenHashMap.from_items(self.items())
+
+    def keys(self) -> Iterator[Any]:
+        return (node.key for node in self._nodes())
+
+    def values(self) -> Iterator[Any]:
+        return (node.val for node in self._nodes())
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return ((node.key, node.val) for node in self._nodes())
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def _nodes(self) -> Iterator[Node]:
+        """Yields every node, bucket by bucket.
+
+        Finishes any resize first, so every node is in the one array.
+        (Like a dict, don't add or delete keys while iterating.)
+        """
+        self._finish_rehash()
+
+        for bucket in self._arr:
+            yield from bucket if isinstance(bucket, _TreeBin) else _chain(bucket)
+
+    def _find(self, key: Any, key_hash: int) -> Optional[Node]:
+        """Returns the key's node, looking in the old array too if we're resizing."""
+        node = self._find_in(self._arr, key, key_hash)
+
+        if node is None and self._old_arr is not None:
+            node = self._find_in(self._old_arr, key, key_hash)
 
-        node.next = self._delete(node.next, key)
         return node
 
-    def _hash(self, key: Any) -> int:
+    def _find_in(self, arr: List[Node], key: Any, key_hash: int) -> Optional[Node]:
+        bucket = arr[self._hash(key_hash, arr)]
+
+        if isinstance(bucket, _TreeBin):
+            return bucket.find(key, key_hash)
+
+        return next((node for node in _chain(bucket) if _matches(node, key, key_hash)), None)
+
+    def _add(self, arr: List[Node], node: Node) -> None:
+        """Adds a node (for a key that isn't in arr yet) to its bucket.
+
+        If that makes the chain longer than _TREEIFY_THRESHOLD, turn it into a _TreeBin.
+        """
+        index = self._hash(node.key_hash, arr)
+        bucket = arr[index]
+
+        if isinstance(bucket, _TreeBin):
+            bucket.add(node)
+            return
+
+        node.next = bucket
+        arr[index] = node
+
+        if _chain_length(node, _TREEIFY_THRESHOLD + 1) > _TREEIFY_THRESHOLD:
+            arr[index] = _TreeBin.from_chain(node)
+
+    def _delete(self, arr: List[Node], key: Any, key_hash: int) -> bool:
+        """Removes the key's node from its bucket in arr, returns True if it was there."""
+        index = self._hash(key_hash, arr)
+        node = arr[index]
+
+        if isinstance(node, _TreeBin):
+            if not node.remove(key, key_hash):
+                return False
+
+            if len(node) <= _UNTREEIFY_THRESHOLD:
+                arr[index] = node.to_chain()
+
+            return True
+
+        previous = None
+
+        while node and not _matches(node, key, key_hash):
+            previous = node
+            node = node.next
+
+        if not node:
+            return False
+
+        if previous:
+            previous.next = node.next
+        else:
+            arr[index] = node.next
+
+        return True
+
+    def _resize_if_needed(self) -> None:
+        """Starts resizing if we're over the max load factor, or under a quarter of it.
+
+        We don't start a new resize while one is running. The load can go over
+        the limit for a bit in the meantime, but that just means slightly longer chains.
+        """
+        if self._old_arr is not None:
+            return
+
+        array_size = len(self._arr)
+
+        if self.size > self._max_load_factor * array_size:
+            self._start_rehash(array_size * 2)
+        elif self.size < self._max_load_factor / 4 * array_size and array_size // 2 >= self._min_array_size:
+            self._start_rehash(array_size // 2)
+
+    def _start_rehash(self, array_size: int) -> None:
+        self._old_arr = self._arr
+        self._arr = [None] * array_size
+        self._rehash_index = 0
+
+    def _rehash_step(self) -> None:
+        """Moves the next _REHASH_STEP buckets from the old array to the new one."""
+        if self._old_arr is None:
+            return
+
+        end = min(self._rehash_index + _REHASH_STEP, len(self._old_arr))
+
+        for i in range(self._rehash_index, end):
+            bucket = self._old_arr[i]
+            nodes = bucket if isinstance(bucket, _TreeBin) else _chain(bucket)
+
+            for node in nodes:
+                self._add(self._arr, node)
+
+            self._old_arr[i] = None
+
+        self._rehash_index = end
+
+        if end == len(self._old_arr):
+            self._old_arr = None
+
+    def _finish_rehash(self) -> None:
+        while self._old_arr is not None:
+            self._rehash_step()
+
+    def _reserve(self, count: int) -> None:
+        """Grows the array (all in one go) so count keys fit under the max load factor."""
+        self._finish_rehash()
+
+        array_size = len(self._arr)
+        while count > self._max_load_factor * array_size:
+            array_size *= 2
+
+        if array_size > len(self._arr):
+            self._start_rehash(array_size)
+            self._finish_rehash()
+
+    def _hash(self, key_hash: int, arr: List[Node]) -> int:
         """Gets a hash index to add the item to in the array.
 
-        * Take the abs value of the key's hash, then the modulus
-          of the array size.
+        * Take the key's hash modulus the array size
+          (Python's % is never negative for a positive divisor, so no abs needed).
 
-        :param key: The key to add to the hash map.
+        :param key_hash: The hash of the key to add to the hash map.
+        :param arr: The array we want an index into.
         :return: The position in the array to add the item.
         """
-        return abs(hash(key)) % len(self._arr)
+        return key_hash % len(arr)
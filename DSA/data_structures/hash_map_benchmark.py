@@ -0,0 +1,68 @@
+"""Times HashMap lookups when every key collides (a hash flooding attack).
+
+Long chains get moved into a _TreeBin. Its keys with exactly the same hash can only be
+binary searched if they're ints, strs or bytes (so a lookup stays O(log n));
+any other keys with the same hash get scanned, like a chain, so a lookup is O(n).
+
+Run from the DSA directory:
+    python -m data_structures.hash_map_benchmark
+"""
+import timeit
+
+from data_structures.hash_map import HashMap
+
+_SIZES = (100, 1_000, 4_000)
+_LOOKUPS = 200
+_REPEAT = 5
+
+
+def _colliding_int(i):
+    """Ints that all hash to 0 (hash(n) is n mod 2^61 - 1)."""
+    return i * (2 ** 61 - 1)
+
+
+class _CollidingKey:
+    """Every key has the same hash, and keys can't be ordered."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and self.name == other.name
+
+
+def _lookup_statement(make_key, size):
+    hash_map = HashMap()
+    for i in range(size):
+        hash_map.put(make_key(i), i)
+
+    step = max(size // _LOOKUPS, 1)
+    keys = [make_key(i) for i in range(0, size, step)]
+
+    def lookups():
+        for key in keys:
+            hash_map.get(key)
+
+    return lookups, len(keys)
+
+
+def _microseconds_per_lookup(make_key, size):
+    statement, count = _lookup_statement(make_key, size)
+    return min(timeit.repeat(statement, number=1, repeat=_REPEAT)) / count * 1e6
+
+
+def main():
+    print(f'Colliding keys, best of {_REPEAT}, microseconds per get')
+    print(f'{"keys":>8}{"int keys":>12}{"other keys":>12}')
+
+    for size in _SIZES:
+        searched = _microseconds_per_lookup(_colliding_int, size)
+        scanned = _microseconds_per_lookup(_CollidingKey, size)
+        print(f'{size:>8,}{searched:>12.2f}{scanned:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
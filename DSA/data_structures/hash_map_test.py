@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 
-from data_structures.hash_map import HashMap
+from data_structures import hash_map as hash_map_module
+from data_structures.hash_map import HashMap, _TreeBin
 
 
 class HashMapTest(unittest.TestCase):
@@ -71,5 +73,320 @@ class HashMapTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             hash_map.get("4")
 
+    def test_grows_past_max_load_factor(self):
+        hash_map = HashMap(size=8)
+        for i in range(6):
+            hash_map.put(i, i)
+
+        self.assertEqual(8, len(hash_map._arr))
+
+        hash_map.put(6, 6)  # 7 / 8 > 0.75
+
+        self.assertEqual(16, len(hash_map._arr))
+        self.assertEqual(8, len(hash_map._old_arr))
+
+    def test_rehashes_incrementally(self):
+        hash_map = HashMap(size=8)
+        for i in range(7):
+            hash_map.put(i, i)
+
+        # Everything can still be found while the buckets are being moved
+        for i in range(7):
+            self.assertEqual(i, hash_map.get(i))
+
+        self.assertIsNone(hash_map._old_arr)
+        self.assertEqual(7, sum(_chain_length(bucket) for bucket in hash_map._arr))
+
+    def test_many_keys(self):
+        hash_map = HashMap()
+        for i in range(10000):
+            hash_map.put(str(i), i)
+
+        self.assertEqual(10000, hash_map.size)
+        self.assertLessEqual(hash_map.size, 0.75 * len(hash_map._arr) + 100)
+
+        for i in range(10000):
+            self.assertEqual(i, hash_map.get(str(i)))
+
+        hash_map.put('5', 'five')
+        self.assertEqual('five', hash_map.get('5'))
+        self.assertEqual(10000, hash_map.size)
+
+    def test_shrinks_when_sparse(self):
+        hash_map = HashMap(size=4)
+        for i in range(1000):
+            hash_map.put(i, i)
+
+        grown_size = len(hash_map._arr)
+
+        for i in range(990):
+            hash_map.delete(i)
+
+        self.assertLess(len(hash_map._arr), grown_size)
+        self.assertGreaterEqual(len(hash_map._arr), 4)
+        for i in range(990, 1000):
+            self.assertEqual(i, hash_map.get(i))
+        self.assertFalse(hash_map.contains(0))
+
+    def test_delete_during_rehash(self):
+        hash_map = HashMap(size=8)
+        for i in range(7):
+            hash_map.put(i, i)
+
+        hash_map.delete(3)
+        hash_map.delete(5)
+
+        self.assertEqual(5, hash_map.size)
+        self.assertFalse(hash_map.contains(3))
+        self.assertFalse(hash_map.contains(5))
+        with self.assertRaises(KeyError):
+            hash_map.delete(3)
+
+    def test_compares_cached_hashes_before_keys(self):
+        hash_map = HashMap(size=1)
+        keys = [_CountingKey(i) for i in range(5)]
+        for key in keys:
+            hash_map.put(key, key.name)
+        _CountingKey.eq_calls = _CountingKey.hash_calls = 0
+
+        # Every key shares the one bucket, but only the matching node's key gets compared
+        self.assertEqual(3, hash_map.get(_CountingKey(3)))
+        self.assertEqual(1, _CountingKey.eq_calls)
+
+        # Growing moves the nodes without hashing their keys again
+        _CountingKey.hash_calls = 0
+        for i in range(5, 50):
+            hash_map.put(i, i)
+        self.assertEqual(0, _CountingKey.hash_calls)
+        self.assertEqual(3, hash_map.get(keys[3]))
+
+    def test_long_chains_become_tree_bins(self):
+        hash_map = HashMap()
+        keys = [_CollidingKey(i) for i in range(100)]
+        for key in keys:
+            hash_map.put(key, key.name)
+
+        bucket = hash_map._arr[42 % len(hash_map._arr)]
+        self.assertIsInstance(bucket, _TreeBin)
+        self.assertEqual(100, len(bucket))
+        for key in keys:
+            self.assertEqual(key.name, hash_map.get(key))
+        self.assertFalse(hash_map.contains(_CollidingKey(1000)))
+
+        # Back to a chain once it gets short
+        for key in keys[:94]:
+            hash_map.delete(key)
+        bucket = hash_map._arr[42 % len(hash_map._arr)]
+        self.assertNotIsInstance(bucket, _TreeBin)
+        self.assertEqual(6, _chain_length(bucket))
+        for key in keys[94:]:
+            self.assertEqual(key.name, hash_map.get(key))
+
+    def test_tree_bin_lookups_binary_search(self):
+        hash_map = HashMap()
+        # Different hashes that all land in bucket 0 (the array size is always 97 * a power of two)
+        spread = [_CollidingKey(i, key_hash=i * 97 * 2 ** 20) for i in range(1, 101)]
+        # Ints with exactly the same hash (hash(n) is n mod 2^61 - 1)
+        same_hash = [42 + i * (2 ** 61 - 1) for i in range(100)]
+        for key in spread + same_hash:
+            hash_map.put(key, key)
+
+        for bucket_keys in (spread, same_hash):
+            for key in bucket_keys:
+                with mock.patch.object(hash_map_module, '_matches', wraps=hash_map_module._matches) as matches:
+                    self.assertIs(key, hash_map.get(key))
+                # Bisect straight to the one candidate, instead of walking the bucket
+                self.assertEqual(1, matches.call_count)
+
+    def test_tree_bins_survive_resizing(self):
+        hash_map = HashMap(size=4)
+        keys = [_CollidingKey(i) for i in range(20)]
+        for key in keys:
+            hash_map.put(key, key.name)
+        for i in range(200):
+            hash_map.put(str(i), i)
+
+        buckets = hash_map._arr + (hash_map._old_arr or [])
+        self.assertTrue(any(isinstance(bucket, _TreeBin) for bucket in buckets))
+        for key in keys:
+            self.assertEqual(key.name, hash_map.get(key))
+        for i in range(200):
+            self.assertEqual(i, hash_map.get(str(i)))
+
+    def test_partially_ordered_colliding_keys(self):
+        # frozenset's < is a subset test, so sorting these by < would put them in the wrong place
+        hash_map = HashMap()
+        keys = [_CollidingFrozenSet({i}) for i in range(20)]
+        for _ in range(2):
+            for i, key in enumerate(keys):
+                hash_map.put(key, i)
+
+        self.assertIsInstance(hash_map._arr[0], _TreeBin)
+        self.assertEqual(20, hash_map.size)
+        self.assertEqual(20, len(list(hash_map.keys())))
+        for i, key in enumerate(keys):
+            self.assertEqual(i, hash_map.get(_CollidingFrozenSet({i})))
+
+        for key in keys[::2]:
+            hash_map.delete(key)
+        for i, key in enumerate(keys):
+            self.assertEqual(i % 2 == 1, hash_map.contains(key))
+
+    def test_colliding_keys_of_mixed_types(self):
+        hash_map = HashMap()
+        keys = [42 + i * (2 ** 61 - 1) for i in range(10)] + [_CollidingKey(i) for i in range(10)]
+        for key in keys:
+            hash_map.put(key, key)
+        # True == 1, so it has to find the int key 1, even though it's a bool
+        hash_map.put(1, 'one')
+
+        self.assertIsInstance(hash_map._arr[42 % len(hash_map._arr)], _TreeBin)
+        for key in keys:
+            self.assertIs(key, hash_map.get(key))
+        self.assertEqual('one', hash_map.get(True))
+
+    def test_colliding_keys_are_never_ordered(self):
+        hash_map = HashMap()
+        keys = [_BrokenOrderKey(i) for i in range(20)]
+        for key in keys:
+            hash_map.put(key, key.name)
+
+        self.assertIsInstance(hash_map._arr[42 % len(hash_map._arr)], _TreeBin)
+        for key in keys:
+            self.assertEqual(key.name, hash_map.get(key))
+        hash_map.delete(keys[3])
+        self.assertFalse(hash_map.contains(keys[3]))
+
+    def test_iteration(self):
+        hash_map = HashMap(size=4)
+        for i in range(26):
+            hash_map.put(i, str(i))
+
+        # Mid-resize, so iterating has to finish it first
+        self.assertIsNotNone(hash_map._old_arr)
+        self.assertEqual(set(range(26)), set(hash_map))
+        self.assertIsNone(hash_map._old_arr)
+
+        self.assertEqual(set(range(26)), set(hash_map.keys()))
+        self.assertEqual({str(i) for i in range(26)}, set(hash_map.values()))
+        self.assertEqual({i: str(i) for i in range(26)}, dict(hash_map.items()))
+        self.assertEqual(26, len(hash_map))
+        self.assertIn(3, hash_map)
+        self.assertNotIn(30, hash_map)
+
+    def test_iteration_includes_tree_bins(self):
+        hash_map = HashMap()
+        keys = [_CollidingKey(i) for i in range(20)]
+        for key in keys:
+            hash_map.put(key, key.name)
+        hash_map.put('other', -1)
+
+        self.assertEqual({key.name: key.name for key in keys} | {'other': -1},
+                         {getattr(key, 'name', key): val for key, val in hash_map.items()})
+
+    def test_put_many_resizes_once(self):
+        hash_map = HashMap()
+        hash_map.put_many((i, i * 2) for i in range(1000))
+
+        self.assertEqual(1000, hash_map.size)
+        self.assertIsNone(hash_map._old_arr)
+        self.assertLessEqual(hash_map.size, 0.75 * len(hash_map._arr))
+        for i in range(1000):
+            self.assertEqual(i * 2, hash_map.get(i))
+
+        # Existing keys get updated
+        hash_map.put_many([(0, 'zero'), (1000, 'new')])
+        self.assertEqual(1001, hash_map.size)
+        self.assertEqual('zero', hash_map.get(0))
+        self.assertEqual('new', hash_map.get(1000))
+
+    def test_update_and_from_dict(self):
+        hash_map = HashMap.from_dict({'a': 1, 'b': 2})
+        self.assertEqual({'a': 1, 'b': 2}, dict(hash_map.items()))
+
+        hash_map.update({'b': 3, 'c': 4})
+        hash_map.update([('d', 5)])
+        hash_map.update(HashMap.from_dict({'e': 6}))
+
+        self.assertEqual({'a': 1, 'b': 3, 'c': 4, 'd': 5, 'e': 6}, dict(hash_map.items()))
+
+    def test_get_or_default_does_not_move_buckets(self):
+        hash_map = HashMap(size=4)
+        for i in range(26):
+            hash_map.put(i, str(i))
+        rehash_index = hash_map._rehash_index
+
+        self.assertIsNotNone(hash_map._old_arr)
+        self.assertEqual('3', hash_map.get_or_default(3))
+        self.assertEqual(-1, hash_map.get_or_default(30, -1))
+        self.assertIsNone(hash_map.get_or_default(30))
+        self.assertEqual(rehash_index, hash_map._rehash_index)
+
+    def test_get_many(self):
+        hash_map = HashMap.from_dict({'a': 1, 'b': 2})
+
+        self.assertEqual([1, None, 2], hash_map.get_many(['a', 'x', 'b']))
+        self.assertEqual([0, 2], hash_map.get_many(['x', 'b'], default=0))
+
+    def test_init_with_invalid_arguments_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            HashMap(size=0)
+        with self.assertRaises(ValueError):
+            HashMap(max_load_factor=0)
+
+
+class _CountingKey:
+    """A key that counts how often it gets hashed and compared."""
+    eq_calls = 0
+    hash_calls = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        _CountingKey.hash_calls += 1
+        return hash(self.name)
+
+    def __eq__(self, other):
+        _CountingKey.eq_calls += 1
+        return isinstance(other, _CountingKey) and self.name == other.name
+
+
+class _CollidingKey:
+    """A key whose hash always collides (unless we pick one)."""
+
+    def __init__(self, name, key_hash=42):
+        self.name = name
+        self.key_hash = key_hash
+
+    def __hash__(self):
+        return self.key_hash
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and self.name == other.name
+
+
+class _CollidingFrozenSet(frozenset):
+    """A partially ordered key (< means subset) whose hash always collides."""
+
+    def __hash__(self):
+        return 0
+
+
+class _BrokenOrderKey(_CollidingKey):
+    """A colliding key whose < raises something other than TypeError."""
+
+    def __lt__(self, other):
+        raise AttributeError('No ordering here')
+
+
+def _chain_length(node):
+    length = 0
+    while node:
+        length += 1
+        node = node.next
+    return length
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,286 @@
+from array import array
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # The batch operations fall back to a loop
+    np = None
+
+# Must be a power of two, so we can take a slot with a shift instead of a modulus.
+_ARRAY_SIZE = 8
+
+# Grow once more than 2/3 of the slots are used (as in OpenAddressingHashMap).
+_MAX_LOAD_NUMERATOR = 2
+_MAX_LOAD_DENOMINATOR = 3
+
+# Fibonacci hashing: multiply by 2^64 / golden ratio and keep the top bits.
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+class IntHashMap:
+    """A hash map from int64 keys to int64 values, stored in typed arrays.
+
+    Cf. OpenAddressingHashMap, which stores any key, so it has to keep a
+    boxed Python object per key and value and call hash() and __eq__ on them.
+    Here the keys and values are raw 8-byte ints in two array('q')s
+    (plus a byte per slot saying whether it's used), and the slot is just
+    the key times a constant, so there's nothing to box or call.
+
+    * Linear probing from the key's (Fibonacci hashed) slot.
+    * Delete: instead of leaving a tombstone, shift the following keys in the run back
+      into the gap, if that's closer to their home slot (backward shift deletion).
+      Runs stay as short as if the key had never been added.
+
+    get_batch/put_batch look up or add a whole vector of keys at once.
+    With NumPy installed they probe every key in lockstep (one vectorized step per probe distance),
+    so a batch costs a handful of NumPy calls instead of one Python call per key.
+    Without NumPy they just loop.
+
+    Operations:
+    * Put(key, val): O(1) avg
+    * Get(key): O(1) avg
+    * Remove(key): O(1) avg
+    * Contains(key): O(1) avg
+    * Get/put batch of k keys: O(k) avg
+    """
+
+    def __init__(self, size: int = _ARRAY_SIZE) -> None:
+        """Initialize the arrays with a default size (rounded up to a power of two)."""
+        if size < 1:
+            raise ValueError('Size must be at least 1')
+
+        array_size = 2
+        while array_size < size:
+            array_size *= 2
+
+        self._min_array_size = array_size
+        self._allocate(array_size)
+
+    def put(self, key: int, val: int) -> None:
+        """Adds a key and value to the hash map, growing it if it's over 2/3 full."""
+        slot = self._probe(key)
+
+        if not self._used[slot]:
+            self._keys[slot] = key
+            self._used[slot] = 1
+            self.size += 1
+
+        self._vals[slot] = val
+
+        if self.size * _MAX_LOAD_DENOMINATOR > len(self._keys) * _MAX_LOAD_NUMERATOR:
+            self._resize(self._array_size_for(self.size))
+
+    def get(self, key: int) -> int:
+        """Returns the value for this key."""
+        slot = self._probe(key)
+        if not self._used[slot]:
+            raise KeyError('Key not found!')
+
+        return self._vals[slot]
+
+    def contains(self, key: int) -> bool:
+        return bool(self._used[self._probe(key)])
+
+    def delete(self, key: int) -> None:
+        """Deletes a key, shifting later keys in its run back to fill the gap.
+
+        Going forward from the gap until an empty slot, a key can move back into the gap
+        if its home slot isn't between the gap and where it is now (else it would end up
+        before its home, where a probe would never find it).
+        """
+        gap = self._probe(key)
+        if not self._used[gap]:
+            raise KeyError('Key not found!')
+
+        keys, vals, used, mask = self._keys, self._vals, self._used, self._mask
+        slot = gap
+
+        while True:
+            slot = (slot + 1) & mask
+            if not used[slot]:
+                break
+
+            home = self._slot(keys[slot])
+            if (slot - home) & mask >= (slot - gap) & mask:
+                keys[gap] = keys[slot]
+                vals[gap] = vals[slot]
+                gap = slot
+
+        used[gap] = 0
+        self.size -= 1
+
+        if self.size * 8 < len(keys) and len(keys) > self._min_array_size:
+            self._resize(self._array_size_for(self.size))
+
+    def get_batch(self, keys: Iterable[int], default: Optional[int] = None) -> Any:
+        """Returns the values for a batch of keys, in the same order.
+
+        :param keys: The keys to look up (a NumPy array, or any iterable of ints).
+        :param default: The value for missing keys. If None, a missing key raises KeyError.
+        :return: A NumPy int64 array (or an array('q') without NumPy).
+        """
+        if np is None:
+            return array('q', (self._get_or_default(key, default) for key in keys))
+
+        keys = np.asarray(keys, dtype=np.int64)
+        table_keys, table_vals, used = self._numpy_views()
+        result = np.zeros(len(keys), dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+
+        # Probe every key one step at a time, dropping keys as they hit a match or an empty slot
+        pending = np.arange(len(keys))
+        slots = self._numpy_slots(keys)
+
+        while pending.size:
+            in_use = used[slots] != 0
+            hit = in_use & (table_keys[slots] == keys[pending])
+
+            result[pending[hit]] = table_vals[slots[hit]]
+            found[pending[hit]] = True
+
+            still_probing = in_use & ~hit
+            pending = pending[still_probing]
+            slots = (slots[still_probing] + 1) & self._mask
+
+        if not found.all():
+            if default is None:
+                raise KeyError('Key not found!')
+            result[~found] = default
+
+        return result
+
+    def put_batch(self, keys: Iterable[int], vals: Iterable[int]) -> None:
+        """Adds a batch of keys and values. If a key appears more than once, the last value wins.
+
+        1. Grow the arrays once, to fit the whole batch.
+        2. Probe every key one step at a time. A key that finds itself updates its value.
+           Keys that reach an empty slot claim it, one key per slot; the rest keep probing.
+        """
+        if np is None:
+            for key, val in zip(keys, vals):
+                self.put(key, val)
+            return
+
+        keys = np.asarray(keys, dtype=np.int64)
+        vals = np.asarray(vals, dtype=np.int64)
+        if keys.shape != vals.shape:
+            raise ValueError('Need the same number of keys and values')
+
+        # Keep the last value for each key
+        reversed_keys = keys[::-1]
+        _, last = np.unique(reversed_keys, return_index=True)
+        keys = reversed_keys[last]
+        vals = vals[::-1][last]
+
+        array_size = self._array_size_for(self.size + len(keys))
+        if array_size > len(self._keys):
+            self._resize(array_size)
+
+        table_keys, table_vals, used = self._numpy_views()
+        pending = np.arange(len(keys))
+        slots = self._numpy_slots(keys)
+
+        while pending.size:
+            in_use = used[slots] != 0
+            hit = in_use & (table_keys[slots] == keys[pending])
+            table_vals[slots[hit]] = vals[pending[hit]]
+
+            # Of the keys at each empty slot, the first one gets it
+            empty = np.flatnonzero(~in_use)
+            claimed_slots, first = np.unique(slots[empty], return_index=True)
+            winners = pending[empty[first]]
+            table_keys[claimed_slots] = keys[winners]
+            table_vals[claimed_slots] = vals[winners]
+            used[claimed_slots] = 1
+            self.size += len(winners)
+
+            # Everyone else moves on (losers see the slot taken next step, and move on then)
+            still_probing = ~hit
+            still_probing[empty[first]] = False
+            advance = in_use[still_probing]
+            pending = pending[still_probing]
+            slots = slots[still_probing]
+            slots[advance] = (slots[advance] + 1) & self._mask
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        for key, val, used in zip(self._keys, self._vals, self._used):
+            if used:
+                yield key, val
+
+    def keys(self) -> Iterator[int]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[int]:
+        return (val for _, val in self.items())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        return self.contains(key)
+
+    def __iter__(self) -> Iterator[int]:
+        return self.keys()
+
+    def _get_or_default(self, key: int, default: Optional[int]) -> int:
+        slot = self._probe(key)
+        if self._used[slot]:
+            return self._vals[slot]
+        if default is None:
+            raise KeyError('Key not found!')
+
+        return default
+
+    def _probe(self, key: int) -> int:
+        """Returns the key's slot, or the empty slot where it would go."""
+        keys, used, mask = self._keys, self._used, self._mask
+        slot = self._slot(key)
+
+        while used[slot] and keys[slot] != key:
+            slot = (slot + 1) & mask
+
+        return slot
+
+    def _slot(self, key: int) -> int:
+        """Gets the key's home slot, using the top bits of the scrambled key."""
+        return ((key * _FIBONACCI) & _MASK_64) >> self._shift
+
+    def _numpy_slots(self, keys):
+        """_slot for an array of keys (uint64 multiplication wraps around, like & _MASK_64)."""
+        scrambled = keys.astype(np.uint64) * np.uint64(_FIBONACCI)
+        return (scrambled >> np.uint64(self._shift)).astype(np.int64)
+
+    def _numpy_views(self):
+        """NumPy arrays over our keys, values and used flags (no copying)."""
+        return (np.frombuffer(self._keys, dtype=np.int64),
+                np.frombuffer(self._vals, dtype=np.int64),
+                np.frombuffer(self._used, dtype=np.uint8))
+
+    def _array_size_for(self, size: int) -> int:
+        """Returns the smallest power of two array size that keeps size entries under 2/3 full."""
+        array_size = self._min_array_size
+        while size * _MAX_LOAD_DENOMINATOR > array_size * _MAX_LOAD_NUMERATOR:
+            array_size *= 2
+
+        return array_size
+
+    def _resize(self, array_size: int) -> None:
+        entries = list(self.items())
+        self._allocate(array_size)
+
+        for key, val in entries:
+            slot = self._probe(key)
+            self._keys[slot] = key
+            self._vals[slot] = val
+            self._used[slot] = 1
+
+        self.size = len(entries)
+
+    def _allocate(self, array_size: int) -> None:
+        self._keys = array('q', bytes(8 * array_size))
+        self._vals = array('q', bytes(8 * array_size))
+        self._used = bytearray(array_size)
+        self._mask = array_size - 1
+        self._shift = 64 - (array_size.bit_length() - 1)
+        self.size = 0
@@ -0,0 +1,155 @@
+import random
+import unittest
+from array import array
+from unittest import mock
+
+from data_structures import int_hash_map
+from data_structures.int_hash_map import IntHashMap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class IntHashMapTest(unittest.TestCase):
+
+    def test_put_get(self):
+        hash_map = IntHashMap()
+        hash_map.put(1, 10)
+        hash_map.put(-2, 20)
+        hash_map.put(1, 11)
+
+        self.assertEqual(2, hash_map.size)
+        self.assertEqual(11, hash_map.get(1))
+        self.assertEqual(20, hash_map.get(-2))
+        self.assertTrue(hash_map.contains(-2))
+        self.assertNotIn(3, hash_map)
+
+        with self.assertRaises(KeyError):
+            hash_map.get(3)
+
+    def test_int64_range(self):
+        hash_map = IntHashMap()
+        hash_map.put(2 ** 63 - 1, -2 ** 63)
+        hash_map.put(-2 ** 63, 2 ** 63 - 1)
+
+        self.assertEqual(-2 ** 63, hash_map.get(2 ** 63 - 1))
+        self.assertEqual(2 ** 63 - 1, hash_map.get(-2 ** 63))
+
+        with self.assertRaises(OverflowError):
+            hash_map.put(2 ** 63, 0)
+
+    def test_grows_and_shrinks(self):
+        hash_map = IntHashMap()
+        for i in range(1000):
+            hash_map.put(i, i * 2)
+
+        self.assertEqual(2048, len(hash_map._keys))
+        for i in range(1000):
+            self.assertEqual(i * 2, hash_map.get(i))
+
+        for i in range(990):
+            hash_map.delete(i)
+
+        self.assertLess(len(hash_map._keys), 2048)
+        self.assertEqual({i: i * 2 for i in range(990, 1000)}, dict(hash_map.items()))
+
+    def test_delete_shifts_run_back(self):
+        hash_map = IntHashMap(size=16)
+        # Keys that all start probing from the same slot
+        keys = [key for key in range(10000) if hash_map._slot(key) == 3][:4]
+        for key in keys:
+            hash_map.put(key, key)
+
+        hash_map.delete(keys[0])
+
+        # No tombstone: the run moved back, starting at the home slot
+        self.assertEqual(keys[1:], [hash_map._keys[slot] for slot in (3, 4, 5)])
+        self.assertEqual(0, hash_map._used[6])
+        for key in keys[1:]:
+            self.assertEqual(key, hash_map.get(key))
+
+        with self.assertRaises(KeyError):
+            hash_map.delete(keys[0])
+
+    def test_matches_dict(self):
+        rand = random.Random(5)
+        hash_map = IntHashMap()
+        expected = {}
+
+        for _ in range(5000):
+            key = rand.randrange(-200, 200)
+            if rand.random() < 0.6:
+                hash_map.put(key, key * 3)
+                expected[key] = key * 3
+            elif key in expected:
+                hash_map.delete(key)
+                del expected[key]
+
+        self.assertEqual(expected, dict(hash_map.items()))
+        for key in range(-200, 200):
+            self.assertEqual(key in expected, hash_map.contains(key))
+
+    def test_batches_without_numpy(self):
+        with mock.patch.object(int_hash_map, 'np', None):
+            hash_map = IntHashMap()
+            hash_map.put_batch([1, 2, 3, 1], [10, 20, 30, 11])
+
+            self.assertEqual(array('q', [11, 20, 30]), hash_map.get_batch([1, 2, 3]))
+            self.assertEqual(array('q', [-1, 20]), hash_map.get_batch([4, 2], default=-1))
+            with self.assertRaises(KeyError):
+                hash_map.get_batch([4])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_get_batch(self):
+        hash_map = IntHashMap()
+        for i in range(1000):
+            hash_map.put(i, -i)
+
+        keys = np.array([5, 999, 0, 123], dtype=np.int64)
+        np.testing.assert_array_equal([-5, -999, 0, -123], hash_map.get_batch(keys))
+        np.testing.assert_array_equal([-5, 7, 7], hash_map.get_batch([5, 1000, -1], default=7))
+        self.assertEqual(0, len(hash_map.get_batch([])))
+
+        with self.assertRaises(KeyError):
+            hash_map.get_batch([5, 1000])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_put_batch(self):
+        hash_map = IntHashMap()
+        hash_map.put(7, 0)
+
+        keys = np.arange(-5000, 5000, dtype=np.int64)
+        hash_map.put_batch(keys, keys * 2)
+        # Repeated keys: the last value wins
+        hash_map.put_batch([1, 1, 2], [100, 101, 102])
+
+        expected = keys * 2
+        expected[keys == 1] = 101
+        expected[keys == 2] = 102
+
+        self.assertEqual(10000, hash_map.size)
+        np.testing.assert_array_equal(expected, hash_map.get_batch(keys))
+        self.assertEqual(101, hash_map.get(1))
+        self.assertEqual(14, hash_map.get(7))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_put_batch_colliding_keys(self):
+        hash_map = IntHashMap(size=64)
+        keys = [key for key in range(100000) if hash_map._slot(key) == 10][:8]
+        hash_map.put_batch(keys, keys)
+
+        self.assertEqual(8, hash_map.size)
+        np.testing.assert_array_equal(keys, hash_map.get_batch(keys))
+
+        with self.assertRaises(ValueError):
+            hash_map.put_batch([1, 2], [1])
+
+    def test_init_with_invalid_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            IntHashMap(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
 
 
 class Node:
@@ -11,10 +11,126 @@ class Node:
         return self.val
 
 
+def merge_sort_nodes(head: Optional[Node], key: Optional[Callable[[Any], Any]] = None) -> Tuple[Node, Node]:
+    """Sorts a chain of nodes (linked by .next) by relinking them, and returns the new head and tail.
+
+    A bottom-up merge sort: instead of recursively splitting the list in half,
+    merge runs of 1 node into sorted runs of 2, then runs of 2 into 4, and so on
+    until one run covers the whole list.
+
+    1. Count the nodes.
+    2. For width = 1, 2, 4... while width < length:
+        2.1 Cut the next two runs of width nodes off the list.
+        2.2 Merge them, and link the merged run onto the end of the new list.
+
+    We only ever change .next pointers, so no new nodes are created
+    (just one dummy node to hang the merged runs off).
+
+    Unlike sorted, we don't store each value's key (that would take O(n) space),
+    so key runs about once per node per pass: O(n log n) calls in all.
+    Keep it cheap, or sort (key, value) pairs instead.
+
+    Time: O(n log n)
+    Space: O(1)
+    STABLE: Yes.
+
+    :param head: The first node of the chain.
+    :param key: A function to get the value to compare by (called O(n log n) times, see above).
+    :return: The head and tail of the sorted chain.
+    """
+    if key is None:
+        key = _identity
+
+    length = 0
+    tail = node = head
+    while node:
+        length += 1
+        tail = node
+        node = node.next
+
+    dummy = Node()
+    width = 1
+
+    while width < length:
+        merged_tail = dummy
+        node = head
+
+        while node:
+            left = node
+            right = _cut(left, width)
+            node = _cut(right, width)
+
+            merged_tail = _merge(merged_tail, left, right, key)
+
+        head = dummy.next
+        tail = merged_tail
+        width *= 2
+
+    return head, tail
+
+
+def _identity(val: Any) -> Any:
+    return val
+
+
+def _cut(node: Optional[Node], count: int) -> Optional[Node]:
+    """Cuts the chain after count nodes, and returns the rest of it."""
+    for _ in range(count - 1):
+        if not node:
+            return None
+        node = node.next
+
+    if not node:
+        return None
+
+    rest = node.next
+    node.next = None
+
+    return rest
+
+
+def _merge(tail: Node, left: Optional[Node], right: Optional[Node], key: Callable[[Any], Any]) -> Node:
+    """Merges two sorted chains after tail, and returns the last node of the merged chain.
+
+    We hold on to the key of the node at the front of each chain, so key only runs
+    once for each node we take, rather than twice per comparison.
+    """
+    if left and right:
+        left_key, right_key = key(left.val), key(right.val)
+
+        while True:
+            # Take from the left on ties, so the sort is stable
+            if right_key < left_key:
+                tail.next = right
+                tail = right
+                right = right.next
+                if not right:
+                    break
+                right_key = key(right.val)
+            else:
+                tail.next = left
+                tail = left
+                left = left.next
+                if not left:
+                    break
+                left_key = key(left.val)
+
+    tail.next = left or right
+    while tail.next:
+        tail = tail.next
+
+    return tail
+
+
 class LinkedList:
     """A singly linked list.
 
-    Add: O(n)
+    We keep a pointer to the tail as well as the head, so we can append
+    (and join two lists together) without walking the list.
+    Everything is iterative, so long lists can't hit the recursion limit.
+
+    Add: O(1)
+    Splice: O(1)
     Remove: O(n)
     Lookup: O(n)
 
@@ -28,94 +144,115 @@ class LinkedList:
 
     def __init__(self) -> None:
         self._head = None
+        self._tail = None
         self.size = 0
 
-    def add_recursive(self, val: Any) -> None:
-        """Adds an item to the list in a recursive manner.
-
-        If the root is null, set it to be a new node.
-        If the root is not null, recurse through the list
-        until we hit a null node, at which point we'll add a new node
-        and set as the previous node's next node.
-
-        Example:
-        1 > 2 --> add_recursive(3)
-        1.next = add_recursive(2, 3)
-        2.next = add_recursive(null, 3)
-        return 3
-        2.next = 3
-        1.next = 2
-        root = 1
+    @classmethod
+    def from_iterable(cls, vals: Iterable[Any]) -> 'LinkedList':
+        """Builds a list with the values in the same order.
 
         Time: O(n)
-        Space: O(n) -- due to callstack growth
+        """
+        linked_list = cls()
+        linked_list.extend(vals)
+
+        return linked_list
+
+    def add_recursive(self, val: Any) -> None:
+        """Adds an item to the end of the list.
+
+        This used to recurse down to the end of the list:
+        1.next = add_recursive(2, 3) -> 2.next = add_recursive(null, 3) -> return 3
+        But that needs one stack frame per node, so it blew the recursion
+        limit at ~1000 nodes. Now that we keep a tail pointer it's the same as add_iterative.
+
+        Time: O(1)
+        Space: O(1)
 
         :param val: The item to add.
         :return: None
         """
-        self._head = self._add_recursive(self._head, val)
-        self.size += 1
-
-    def _add_recursive(self, node: Node, val: Any) -> Node:
-        if not node:
-            return Node(val)
-
-        node.next = self._add_recursive(node.next, val)
-        return node
+        self.add_iterative(val)
 
     def add_iterative(self, val: Any) -> None:
-        """Adds a value iteratively.
+        """Adds a value to the end of the list.
 
-        Time: O(n)
+        1. If the list is empty, the new node is both head and tail.
+        2. Otherwise, link it after the tail and make it the new tail.
+
+        Time: O(1)
         Space: O(1)
 
         :param val: The item to add
         :return: None
         """
+        new_node = Node(val)
+
         if not self._head:
-            self._head = Node(val)
+            self._head = new_node
         else:
-            new_node = self._head
-            while new_node.next:
-                new_node = new_node.next
-            new_node.next = Node(val)
+            self._tail.next = new_node
 
-        self.size = self.size + 1
+        self._tail = new_node
+        self.size += 1
 
-    def remove_recursive(self, val: Any) -> None:
-        """Removes a value from the list recursively.
+    def extend(self, vals: Iterable[Any]) -> None:
+        """Adds all of the values to the end of the list, in order.
 
-        If we hit a null node, throw a key error -- the value did not exist.
-        If we find the value, set the previous node next to the next node.
-        Otherwise, recurse to the next node.
+        Time: O(k) for k values
+        Space: O(1)
 
-        For example: 1->2->3->NULL, remove(3)
+        :param vals: The items to add.
+        :return: None
+        """
+        for val in vals:
+            self.add_iterative(val)
 
-        1. Call with (1), doesn't match
-        2. 1.next = remove(2, 3), doesn't match
-        3. 2.next = remove(3, 3), matches
-        3. set 2.next = 3.next == s.next = null
-        4. left with 1->2->NULL
+    def splice(self, other: 'LinkedList') -> None:
+        """Moves all of the nodes of other onto the end of this list.
 
-        Time: O(n)
-        Space: O(n), due to callstack growth
+        We just link our tail to other's head, so no nodes are copied.
+        Other is left empty, since the nodes now belong to this list.
 
-        :param val: The item to remove
+        Time: O(1)
+        Space: O(1)
+
+        :param other: The list to join onto this one.
         :return: None
         """
-        self._head = self._remove_recursive(self._head, val)
+        if other is self:
+            raise ValueError('Cannot splice a list onto itself')
 
-    def _remove_recursive(self, node: Node, val: Any) -> Node:
-        if not node:
-            raise KeyError('Value not found %s', val)
+        if not other._head:
+            return
 
-        if node.val == val:
-            self.size -= 1
-            return node.next
+        if not self._head:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+
+        self._tail = other._tail
+        self.size += other.size
 
-        node.next = self._remove_recursive(node.next, val)
+        other._head = None
+        other._tail = None
+        other.size = 0
 
-        return node
+    def remove_recursive(self, val: Any) -> None:
+        """Removes a value from the list.
+
+        This used to recurse down the list:
+        1.next = remove(2, 3) -> 2.next = remove(3, 3) -> matches, return 3.next
+        But like add_recursive it needed one stack frame per node,
+        so it's now the same as remove_iterative.
+
+        Time: O(n)
+        Space: O(1)
+
+        :param val: The item to remove
+        :return: None
+        """
+        self.remove_iterative(val)
 
     def remove_iterative(self, val: Any) -> None:
         """Removes a node in an iterative manner.
@@ -142,6 +279,9 @@ class LinkedList:
         if self._head.val == val:
             self._head = self._head.next
             self.size -= 1
+
+            if not self._head:
+                self._tail = None
         else:
             current_node = self._head
 
@@ -152,6 +292,9 @@ class LinkedList:
             if not current_node.next:
                 raise KeyError('Value not found %s', val)
 
+            if current_node.next is self._tail:
+                self._tail = current_node
+
             current_node.next = current_node.next.next
             self.size -= 1
 
@@ -165,7 +308,7 @@ class LinkedList:
             3.2 Set current's next to be previous
             3.3 Set previous to be current
             3.4 Set current to be next
-        4. Finally, set head to be previous
+        4. Finally, set head to be previous, and tail to the old head
 
         Time: O(n)
         Space: O(1)
@@ -186,18 +329,54 @@ class LinkedList:
             previous = current
             current = next_node
 
+        self._tail = self._head
         self._head = previous
 
+    def sort(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        """Sorts the list in place by relinking its nodes (see merge_sort_nodes).
+
+        Time: O(n log n)
+        Space: O(1)
+
+        :param key: A function to get the value to compare by
+                    (called O(n log n) times, unlike sorted, so keep it cheap).
+        :return: None
+        """
+        if self.size > 1:
+            self._head, self._tail = merge_sort_nodes(self._head, key)
+
     def is_empty(self) -> bool:
         return self.size == 0
 
-    def __iter__(self):
-        self.current = self._head
-        return self
+    def window(self, start: int, stop: Optional[int] = None) -> Iterator[Any]:
+        """Lazily yields the values in [start, stop), like islice(list, start, stop).
+
+        Negative indices count from the end (like slicing), which we can
+        work out from size without walking the list first.
+
+        Time: O(stop)
+        Space: O(1)
+
+        :param start: The index of the first value.
+        :param stop: The index to stop before (None for the end of the list).
+        :return: An iterator over the values.
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+
+        node = self._head
+        for _ in range(start):
+            node = node.next
+
+        for _ in range(stop - start):
+            yield node.val
+            node = node.next
 
-    def __next__(self):
-        if not self.current:
-            raise StopIteration
-        val = self.current.val
-        self.current = self.current.next
-        return val
+    def __iter__(self) -> Iterator[Any]:
+        """Yields the values from head to tail.
+
+        Each call gets its own cursor, so nested loops over the same list work.
+        """
+        node = self._head
+        while node:
+            yield node.val
+            node = node.next
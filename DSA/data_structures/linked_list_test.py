@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from data_structures.linked_list import LinkedList
@@ -112,3 +113,142 @@ class LinkedListTest(unittest.TestCase):
         self.assertEqual(2, linked_list._head.next.next.next.val)
         self.assertEqual(1, linked_list._head.next.next.next.next.val)
         self.assertEqual(5, linked_list.size)
+
+    def test_tail_is_kept_up_to_date(self):
+        linked_list = LinkedList()
+        linked_list.add_iterative(1)
+        linked_list.add_iterative(2)
+        linked_list.add_iterative(3)
+        self.assertEqual(3, linked_list._tail.val)
+
+        linked_list.remove_iterative(3)
+        self.assertEqual(2, linked_list._tail.val)
+
+        linked_list.reverse()
+        self.assertEqual(1, linked_list._tail.val)
+
+        linked_list.remove_iterative(2)
+        linked_list.remove_iterative(1)
+        self.assertIsNone(linked_list._tail)
+
+        linked_list.add_iterative(4)
+        self.assertEqual(4, linked_list._head.val)
+        self.assertEqual(4, linked_list._tail.val)
+
+    def test_extend(self):
+        linked_list = LinkedList()
+        linked_list.add_iterative(1)
+        linked_list.extend([2, 3])
+        linked_list.extend(range(4, 6))
+
+        self.assertEqual([1, 2, 3, 4, 5], list(linked_list))
+        self.assertEqual(5, linked_list.size)
+
+    def test_from_iterable(self):
+        linked_list = LinkedList.from_iterable('abc')
+
+        self.assertEqual(['a', 'b', 'c'], list(linked_list))
+        self.assertEqual('c', linked_list._tail.val)
+
+    def test_splice(self):
+        linked_list = LinkedList.from_iterable([1, 2])
+        other = LinkedList.from_iterable([3, 4])
+        other_tail = other._tail
+
+        linked_list.splice(other)
+
+        self.assertEqual([1, 2, 3, 4], list(linked_list))
+        self.assertEqual(4, linked_list.size)
+        self.assertIs(other_tail, linked_list._tail)
+        self.assertTrue(other.is_empty())
+        self.assertIsNone(other._head)
+
+        # Splicing onto/from an empty list
+        empty = LinkedList()
+        empty.splice(linked_list)
+        self.assertEqual([1, 2, 3, 4], list(empty))
+        empty.splice(LinkedList())
+        self.assertEqual(4, empty.size)
+
+        with self.assertRaises(ValueError):
+            empty.splice(empty)
+
+    def test_long_list_does_not_hit_recursion_limit(self):
+        linked_list = LinkedList()
+        for i in range(10000):
+            linked_list.add_recursive(i)
+
+        linked_list.remove_recursive(9999)
+
+        self.assertEqual(9999, linked_list.size)
+        self.assertEqual(9998, linked_list._tail.val)
+
+    def test_sort(self):
+        rand = random.Random(3)
+        for length in (0, 1, 2, 3, 7, 8, 100):
+            vals = [rand.randint(0, 20) for _ in range(length)]
+            linked_list = LinkedList.from_iterable(vals)
+            nodes = set(id(node) for node in _nodes(linked_list))
+
+            linked_list.sort()
+
+            self.assertEqual(sorted(vals), list(linked_list))
+            self.assertEqual(length, linked_list.size)
+            # The same nodes were relinked, none were copied
+            self.assertEqual(nodes, set(id(node) for node in _nodes(linked_list)))
+            if length:
+                self.assertEqual(max(vals), linked_list._tail.val)
+                self.assertIsNone(linked_list._tail.next)
+
+    def test_sort_with_key_is_stable(self):
+        linked_list = LinkedList.from_iterable([(2, 'a'), (1, 'b'), (2, 'c'), (1, 'd')])
+        linked_list.sort(key=lambda pair: pair[0])
+
+        self.assertEqual([(1, 'b'), (1, 'd'), (2, 'a'), (2, 'c')], list(linked_list))
+
+        linked_list.add_iterative((0, 'e'))
+        self.assertEqual((0, 'e'), linked_list._tail.val)
+
+    def test_sort_calls_key_once_per_node_per_pass(self):
+        vals = list(range(1024))
+        random.Random(4).shuffle(vals)
+        linked_list = LinkedList.from_iterable(vals)
+        calls = []
+
+        def key(val):
+            calls.append(val)
+            return val
+
+        linked_list.sort(key=key)
+
+        self.assertEqual(sorted(vals), list(linked_list))
+        # 10 passes over 1024 nodes
+        self.assertLessEqual(len(calls), 1024 * 10)
+
+
+def _nodes(linked_list):
+    node = linked_list._head
+    while node:
+        yield node
+        node = node.next
+
+
+class LinkedListIterationTest(unittest.TestCase):
+
+    def test_nested_iteration(self):
+        linked_list = LinkedList.from_iterable([1, 2, 3])
+
+        pairs = [(a, b) for a in linked_list for b in linked_list]
+
+        self.assertEqual(9, len(pairs))
+        self.assertEqual((3, 3), pairs[-1])
+
+    def test_window(self):
+        linked_list = LinkedList.from_iterable(range(10))
+
+        self.assertEqual([2, 3, 4], list(linked_list.window(2, 5)))
+        self.assertEqual([7, 8, 9], list(linked_list.window(-3)))
+        self.assertEqual([6, 7], list(linked_list.window(-4, -2)))
+        self.assertEqual([8, 9], list(linked_list.window(8, 100)))
+        self.assertEqual([], list(linked_list.window(5, 2)))
+        self.assertEqual([], list(LinkedList().window(0)))
@@ -0,0 +1,210 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import Any, Iterator, Optional, Tuple, Union
+
+# File layout: [header | slots... | heap of keys and values]
+_MAGIC = b'DSAHMAP1'
+_HEADER = struct.Struct('<8sQQ')  # magic, slot count, size
+# One slot per entry: key hash (0 = empty), heap offset, key length, value length
+_SLOT = struct.Struct('<QQII')
+
+# Keep the table at most 2/3 full (like OpenAddressingHashMap), so probes stay short
+# and there's always an empty slot to stop at.
+_MAX_LOAD_NUMERATOR = 2
+_MAX_LOAD_DENOMINATOR = 3
+
+_Data = Union[bytes, bytearray, memoryview, str]
+
+
+def _to_bytes(data: _Data) -> bytes:
+    return data.encode() if isinstance(data, str) else bytes(data)
+
+
+def _hash(key: bytes) -> int:
+    """A 64-bit hash that's the same in every process.
+
+    (Python's hash() is salted per process, so a file built with it couldn't be read by anyone else.)
+    0 marks an empty slot, so no key gets that hash.
+    """
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little') or 1
+
+
+class MmapHashMap:
+    """A read-only hash map stored in a file, and looked up straight from a memory map.
+
+    Building a big HashMap on startup means parsing every entry and allocating
+    a node for each one. Here we do that work once, in build(), and write out
+    the table itself. Opening it later just maps the file and reads the header: O(1).
+    Lookups only touch the pages they need, and every process that opens the file
+    shares the same pages in the OS page cache.
+
+    Layout:
+    * Header: magic, slot count, size.
+    * Slots: an open-addressed table (linear probing, power of two size) of fixed-width slots.
+      Each holds the key's hash, and where its key and value are in the heap.
+    * Heap: the key and value bytes, back to back.
+
+    get hashes the key, jumps to its slot's file offset, and probes from there.
+    We compare the stored hash first, so we only read the key bytes from the heap on a real match.
+
+    Keys and values are bytes (str gets UTF-8 encoded); get returns bytes.
+
+    * Build: O(n)
+    * Open: O(1)
+    * Get(key): O(1) avg
+    * Contains(key): O(1) avg
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens a file written by build().
+
+        :param path: The file to open.
+        """
+        self._file = open(path, 'rb')
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < _HEADER.size:
+                raise ValueError(f'{path} is not a hash map file (too short).')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+        try:
+            magic, self._slot_count, self.size = _HEADER.unpack_from(self._mmap, 0)
+
+            if magic != _MAGIC:
+                raise ValueError(f'{path} is not a hash map file (bad header).')
+            # A power of two (for the mask), with at least one empty slot (so probes stop)
+            if self._slot_count < 1 or self._slot_count & (self._slot_count - 1) or self.size >= self._slot_count:
+                raise ValueError(f'{path} is corrupt (slot count {self._slot_count}, size {self.size}).')
+            if file_size < _HEADER.size + self._slot_count * _SLOT.size:
+                raise ValueError(f'{path} is shorter than its header says (truncated?).')
+        except BaseException:
+            self.close()
+            raise
+
+        self._mask = self._slot_count - 1
+
+    @classmethod
+    def build(cls, path: str, pairs: Any) -> 'MmapHashMap':
+        """Writes the (key, value) pairs to a hash map file, and opens it.
+
+        If a key appears more than once, the last value wins.
+        The file is written under a temporary name and then moved into place,
+        so anyone opening path sees either the old file or the whole new one.
+
+        :param path: The file to write.
+        :param pairs: A dict, a HashMap, or an iterable of (key, value) pairs.
+        :return: The opened map.
+        """
+        if hasattr(pairs, 'items'):
+            pairs = pairs.items()
+
+        entries = []
+        for key, val in pairs:
+            key = _to_bytes(key)
+            entries.append((_hash(key), key, _to_bytes(val)))
+
+        slot_count = 1
+        while len(entries) * _MAX_LOAD_DENOMINATOR >= slot_count * _MAX_LOAD_NUMERATOR:
+            slot_count *= 2
+
+        # Place each entry (by its index in entries), replacing earlier entries for the same key
+        table = [None] * slot_count
+        mask = slot_count - 1
+        for i, (key_hash, key, _) in enumerate(entries):
+            slot = key_hash & mask
+            while table[slot] is not None:
+                other_hash, other_key, _ = entries[table[slot]]
+                if other_hash == key_hash and other_key == key:
+                    break
+                slot = (slot + 1) & mask
+            table[slot] = i
+
+        size = sum(i is not None for i in table)
+        temp_path = f'{path}.tmp'
+
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, slot_count, size))
+
+            offset = _HEADER.size + slot_count * _SLOT.size
+            for i in table:
+                if i is None:
+                    file.write(_SLOT.pack(0, 0, 0, 0))
+                    continue
+
+                key_hash, key, val = entries[i]
+                file.write(_SLOT.pack(key_hash, offset, len(key), len(val)))
+                offset += len(key) + len(val)
+
+            for i in table:
+                if i is not None:
+                    _, key, val = entries[i]
+                    file.write(key)
+                    file.write(val)
+
+        os.replace(temp_path, path)
+
+        return cls(path)
+
+    def get(self, key: _Data) -> bytes:
+        """Returns the value for this key."""
+        slot_offset = self._find(_to_bytes(key))
+        if slot_offset is None:
+            raise KeyError('Key not found!')
+
+        _, offset, key_length, val_length = _SLOT.unpack_from(self._mmap, slot_offset)
+        start = offset + key_length
+
+        return self._mmap[start:start + val_length]
+
+    def contains(self, key: _Data) -> bool:
+        return self._find(_to_bytes(key)) is not None
+
+    def items(self) -> Iterator[Tuple[bytes, bytes]]:
+        for slot in range(self._slot_count):
+            key_hash, offset, key_length, val_length = _SLOT.unpack_from(self._mmap, self._slot_offset(slot))
+            if key_hash:
+                start = offset + key_length
+                yield self._mmap[offset:start], self._mmap[start:start + val_length]
+
+    def keys(self) -> Iterator[bytes]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[bytes]:
+        return (val for _, val in self.items())
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: _Data) -> bool:
+        return self.contains(key)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.keys()
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Returns the file offset of the key's slot, or None."""
+        key_hash = _hash(key)
+        slot = key_hash & self._mask
+
+        while True:
+            slot_offset = self._slot_offset(slot)
+            slot_hash, offset, key_length, _ = _SLOT.unpack_from(self._mmap, slot_offset)
+
+            if slot_hash == 0:
+                return None
+            if slot_hash == key_hash and key_length == len(key) and self._mmap[offset:offset + key_length] == key:
+                return slot_offset
+
+            slot = (slot + 1) & self._mask
+
+    def _slot_offset(self, slot: int) -> int:
+        return _HEADER.size + slot * _SLOT.size
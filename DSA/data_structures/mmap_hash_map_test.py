@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from data_structures.hash_map import HashMap
+from data_structures.mmap_hash_map import _HEADER, _MAGIC, MmapHashMap
+
+
+class MmapHashMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'table.hmap')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_build_and_get(self):
+        hash_map = MmapHashMap.build(self.path, [('one', b'1'), (b'two', '2')])
+
+        self.assertEqual(2, hash_map.size)
+        self.assertEqual(b'1', hash_map.get('one'))
+        self.assertEqual(b'1', hash_map.get(b'one'))
+        self.assertEqual(b'2', hash_map.get('two'))
+        self.assertTrue(hash_map.contains('one'))
+        self.assertNotIn('three', hash_map)
+
+        with self.assertRaises(KeyError):
+            hash_map.get('three')
+        hash_map.close()
+
+    def test_reopen(self):
+        MmapHashMap.build(self.path, {str(i): str(i * i) for i in range(1000)}).close()
+
+        hash_map = MmapHashMap(self.path)
+        self.assertEqual(1000, len(hash_map))
+        for i in range(1000):
+            self.assertEqual(str(i * i).encode(), hash_map.get(str(i)))
+        hash_map.close()
+
+    def test_last_value_wins(self):
+        hash_map = MmapHashMap.build(self.path, [('a', '1'), ('b', '2'), ('a', '3')])
+
+        self.assertEqual(2, hash_map.size)
+        self.assertEqual(b'3', hash_map.get('a'))
+        hash_map.close()
+
+    def test_build_from_hash_map_and_iterate(self):
+        source = HashMap.from_dict({'a': 'x', 'b': 'y', 'c': ''})
+        hash_map = MmapHashMap.build(self.path, source)
+
+        self.assertEqual({b'a': b'x', b'b': b'y', b'c': b''}, dict(hash_map.items()))
+        self.assertEqual({b'a', b'b', b'c'}, set(hash_map))
+        self.assertEqual({b'x', b'y', b''}, set(hash_map.values()))
+        hash_map.close()
+
+    def test_empty_map(self):
+        hash_map = MmapHashMap.build(self.path, [])
+
+        self.assertEqual(0, hash_map.size)
+        self.assertFalse(hash_map.contains('a'))
+        self.assertEqual([], list(hash_map.items()))
+        hash_map.close()
+
+    def test_rebuild_replaces_file(self):
+        MmapHashMap.build(self.path, {'a': '1'}).close()
+        hash_map = MmapHashMap.build(self.path, {'b': '2'})
+
+        self.assertFalse(hash_map.contains('a'))
+        self.assertEqual(b'2', hash_map.get('b'))
+        self.assertEqual(['table.hmap'], os.listdir(self.directory.name))
+        hash_map.close()
+
+    def test_open_bad_file_raises_value_error(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a hash map, just some text')
+
+        with self.assertRaises(ValueError):
+            MmapHashMap(self.path)
+
+        with open(self.path, 'wb'):
+            pass
+
+        with self.assertRaises(ValueError):
+            MmapHashMap(self.path)
+
+    def test_open_truncated_file_raises_value_error(self):
+        MmapHashMap.build(self.path, {str(i): str(i) for i in range(100)}).close()
+        with open(self.path, 'r+b') as file:
+            file.truncate(_HEADER.size + 10)
+
+        with self.assertRaises(ValueError):
+            MmapHashMap(self.path)
+
+    def test_open_corrupt_header_raises_value_error(self):
+        # (slot count, size): not a power of two, zero, and no empty slot left
+        for slot_count, size in ((3, 1), (0, 0), (4, 4)):
+            with open(self.path, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, slot_count, size))
+                file.write(bytes(4096))
+
+            with self.assertRaises(ValueError):
+                MmapHashMap(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
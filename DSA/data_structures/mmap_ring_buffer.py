@@ -0,0 +1,90 @@
+import mmap
+import os
+
+from data_structures.slot_ring_buffer import _SLOTS_OFFSET, SlotRingBuffer
+
+
+class MmapRingBuffer(SlotRingBuffer):
+    """A circular FIFO queue of fixed-size slots, persisted in a memory-mapped file.
+
+    The file IS the ring buffer (see SlotRingBuffer for the layout), so
+    the read/write counters live in the file header. Reopening the file
+    after a restart just maps it and reads the header: O(1), no replay.
+
+    Enqueue/dequeue only touch the mapped pages of the slot and the counter.
+    The OS writes dirty pages back on its own, so a crashed process loses
+    nothing that was enqueued. To survive the machine going down too,
+    call flush() (msync) at the points you need to be durable.
+
+    Since a slot is filled before the write counter is bumped, a crash
+    mid-enqueue just means that item was never added.
+
+    * Enqueue: O(1) (plus the payload copy)
+    * Dequeue: O(1) (plus the payload copy)
+    * Open: O(1)
+    """
+
+    def __init__(self, path: str, capacity: int = 0, slot_size: int = 0) -> None:
+        """Opens the ring buffer at path, creating it if the file doesn't exist.
+
+        :param path: The file to store the buffer in.
+        :param capacity: The number of slots (needed to create the file).
+        :param slot_size: The max payload size in bytes (needed to create the file).
+        """
+        if not os.path.exists(path):
+            self._create(path, capacity, slot_size)
+
+        self._file = open(path, 'r+b')
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < _SLOTS_OFFSET:
+                raise ValueError(f'{path} is too short to be a ring buffer.')
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except BaseException:
+            self._file.close()
+            raise
+
+        buf = memoryview(self._mmap)
+        try:
+            super().__init__(buf)
+
+            if file_size < self.required_size(self.capacity, self.slot_size):
+                raise ValueError(f'{path} is shorter than its header says (truncated?).')
+            if (capacity and capacity != self.capacity) or (slot_size and slot_size != self.slot_size):
+                raise ValueError(f'{path} has capacity {self.capacity} and slot size {self.slot_size}.')
+        except BaseException:
+            self._close(buf)
+            raise
+
+    @classmethod
+    def _create(cls, path: str, capacity: int, slot_size: int) -> None:
+        """Writes an empty ring buffer file.
+
+        The file is written under a temporary name and then moved into place,
+        so a crash part way through never leaves a half-written file at path.
+        """
+        size = cls.required_size(capacity, slot_size)
+        header = bytearray(_SLOTS_OFFSET)
+        cls.write_header(memoryview(header), capacity, slot_size)
+        temp_path = f'{path}.tmp'
+
+        with open(temp_path, 'wb') as file:
+            file.write(header)
+            file.truncate(size)  # Zero-filled
+
+        os.replace(temp_path, path)
+
+    def flush(self) -> None:
+        """Writes any changes back to the file on disk."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file."""
+        self._mmap.flush()
+        self._close(self._buf)
+        self._buf = None
+
+    def _close(self, buf: memoryview) -> None:
+        buf.release()
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,101 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from data_structures.mmap_ring_buffer import MmapRingBuffer
+
+
+class MmapRingBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'journal.ring')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_enqueue_dequeue(self):
+        ring_buffer = MmapRingBuffer(self.path, 3, 8)
+        ring_buffer.enqueue(b'one')
+        ring_buffer.enqueue(b'two')
+
+        self.assertEqual(2, ring_buffer.size)
+        self.assertEqual(b'one', ring_buffer.dequeue())
+        self.assertEqual(b'two', ring_buffer.dequeue())
+        ring_buffer.close()
+
+    def test_circular_enqueue(self):
+        ring_buffer = MmapRingBuffer(self.path, 2, 8)
+
+        self.assertTrue(ring_buffer.enqueue(b'1'))
+        self.assertTrue(ring_buffer.enqueue(b'2'))
+        self.assertFalse(ring_buffer.enqueue(b'3'))
+
+        self.assertEqual(b'1', ring_buffer.dequeue())
+        self.assertTrue(ring_buffer.enqueue(b'3'))
+        self.assertEqual(b'2', ring_buffer.dequeue())
+        self.assertEqual(b'3', ring_buffer.dequeue())
+        ring_buffer.close()
+
+    def test_survives_reopen(self):
+        record = struct.Struct('<qd')
+
+        ring_buffer = MmapRingBuffer(self.path, 4, 16)
+        ring_buffer.enqueue(b'first')
+        ring_buffer.enqueue_record(record, 7, 0.5)
+        ring_buffer.enqueue(b'third')
+        ring_buffer.dequeue()
+        ring_buffer.close()
+
+        reopened = MmapRingBuffer(self.path)
+        self.assertEqual(4, reopened.capacity)
+        self.assertEqual(16, reopened.slot_size)
+        self.assertEqual(2, reopened.size)
+        self.assertEqual((7, 0.5), reopened.dequeue_record(record))
+        self.assertEqual(b'third', reopened.dequeue())
+        reopened.close()
+
+    def test_reopen_with_different_shape_raises_value_error(self):
+        MmapRingBuffer(self.path, 4, 16).close()
+
+        with self.assertRaises(ValueError):
+            MmapRingBuffer(self.path, 8, 16)
+
+    def test_open_non_ring_file_raises_value_error(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'\0' * 512)
+
+        with self.assertRaises(ValueError):
+            MmapRingBuffer(self.path)
+
+    def test_open_short_file_raises_value_error(self):
+        for size in (0, 100):
+            with open(self.path, 'wb') as file:
+                file.write(b'\0' * size)
+
+            with self.assertRaises(ValueError):
+                MmapRingBuffer(self.path)
+
+    def test_open_truncated_file_raises_value_error(self):
+        MmapRingBuffer(self.path, 4, 16).close()
+        with open(self.path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        with self.assertRaises(ValueError):
+            MmapRingBuffer(self.path)
+
+    def test_create_leaves_no_temp_file(self):
+        MmapRingBuffer(self.path, 4, 16).close()
+
+        self.assertEqual(['journal.ring'], os.listdir(self.directory.name))
+
+    def test_create_without_shape_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            MmapRingBuffer(self.path)
+
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+from typing import Any, List, Optional
+
+# Must be a power of two, so we can take a slot with a shift instead of a modulus.
+_ARRAY_SIZE = 8
+
+# Grow once more than 2/3 of the slots are used (live keys plus tombstones), like CPython's dict.
+_MAX_LOAD_NUMERATOR = 2
+_MAX_LOAD_DENOMINATOR = 3
+
+# Fibonacci hashing: multiply by 2^64 / golden ratio and keep the top bits.
+# Sequential keys (e.g. ints, which hash to themselves) get spread all over the table,
+# instead of filling one run of neighbouring slots that linear probing then has to walk.
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+# A slot that has never been used: a probe can stop here.
+_EMPTY = object()
+# A slot whose key was deleted: a probe has to keep going, but put can reuse it.
+_TOMBSTONE = object()
+
+
+class OpenAddressingHashMap:
+    """A hash map implemented with open addressing (linear probing).
+
+    Cf. HashMap, which chains a Node per entry off each bucket.
+    Here there are no nodes: the entries live straight in three parallel
+    arrays of hashes, keys and values, so an entry costs three slots
+    instead of a whole object, and a probe walks neighbouring slots
+    instead of chasing pointers.
+
+    * Put/get: start at the key's slot and step forward (slot + 1, wrapping)
+      until we find the key, or an empty slot (the key isn't there).
+    * Delete: we can't just empty the slot, since that would cut off the probe
+      for any key that stepped past it, so we leave a tombstone.
+    * We compare the stored hash before the key, so we only call __eq__ on real matches.
+    * Resize when 2/3 full (tombstones count too), reusing the stored hashes.
+
+    Same API as HashMap, so either can be used.
+
+    Operations:
+    * Put(key, val): O(1) avg, O(n) worst case
+    * Get(key): O(1) avg, O(n) worst case
+    * Remove(key): O(1) avg, O(n) worst case
+    * Contains(key): O(1) avg, O(n) worst case
+    """
+    def __init__(self, size: int = _ARRAY_SIZE):
+        """Initialize the arrays with a default size (rounded up to a power of two)."""
+        if size < 1:
+            raise ValueError('Size must be at least 1')
+
+        array_size = 1
+        while array_size < size:
+            array_size *= 2
+
+        self._min_array_size = array_size
+        self._allocate(array_size)
+
+    def put(self, key: Any, val: Any) -> None:
+        """Adds a key and value to the hash map.
+
+        1. Probe for the key. If it's there, update the value.
+        2. Otherwise, add it in the first tombstone we passed, or the empty slot we stopped at.
+        3. Grow (or clean out tombstones) if we're over 2/3 full.
+
+        Time: O(1) average, O(n) worst case
+        """
+        key_hash = hash(key)
+        slot = self._slot(key_hash)
+        reusable = None
+
+        while True:
+            slot_key = self._keys[slot]
+
+            if slot_key is _EMPTY:
+                break
+            if slot_key is _TOMBSTONE:
+                if reusable is None:
+                    reusable = slot
+            elif self._hashes[slot] == key_hash and (slot_key is key or slot_key == key):
+                # Updating an existing key
+                self._vals[slot] = val
+                return
+
+            slot = (slot + 1) & self._mask
+
+        if reusable is not None:
+            slot = reusable
+            self._tombstones -= 1
+
+        self._hashes[slot] = key_hash
+        self._keys[slot] = key
+        self._vals[slot] = val
+        self.size += 1
+
+        if (self.size + self._tombstones) * _MAX_LOAD_DENOMINATOR > len(self._keys) * _MAX_LOAD_NUMERATOR:
+            self._resize(self._array_size_for(self.size))
+
+    def contains(self, key: Any) -> bool:
+        """Returns True if key exists in map"""
+        return self._find(key) is not None
+
+    def get(self, key: Any) -> Any:
+        """Returns the value for this key."""
+        slot = self._find(key)
+        if slot is None:
+            raise KeyError('Key not found!')
+
+        return self._vals[slot]
+
+    def delete(self, key: Any) -> None:
+        """Deletes a key from the hash map, leaving a tombstone in its slot.
+
+        Time: O(1) average, O(n) worst case.
+        """
+        slot = self._find(key)
+        if slot is None:
+            raise KeyError('Key not found!')
+
+        self._hashes[slot] = None
+        self._keys[slot] = _TOMBSTONE
+        self._vals[slot] = None
+        self.size -= 1
+        self._tombstones += 1
+
+        # Shrink once the map gets sparse, which also clears out the tombstones
+        if self.size * 8 < len(self._keys) and len(self._keys) > self._min_array_size:
+            self._resize(self._array_size_for(self.size))
+
+    def _find(self, key: Any) -> Optional[int]:
+        """Returns the slot holding key, or None."""
+        key_hash = hash(key)
+        slot = self._slot(key_hash)
+
+        while True:
+            slot_key = self._keys[slot]
+
+            if slot_key is _EMPTY:
+                return None
+            if slot_key is not _TOMBSTONE and self._hashes[slot] == key_hash and (slot_key is key or slot_key == key):
+                return slot
+
+            slot = (slot + 1) & self._mask
+
+    def _slot(self, key_hash: int) -> int:
+        """Gets the slot to start probing from, using the top bits of the scrambled hash."""
+        return ((key_hash * _FIBONACCI) & _MASK_64) >> self._shift
+
+    def _array_size_for(self, size: int) -> int:
+        """Returns the smallest power of two array size that keeps size entries under 2/3 full."""
+        array_size = self._min_array_size
+        while (size + 1) * _MAX_LOAD_DENOMINATOR > array_size * _MAX_LOAD_NUMERATOR:
+            array_size *= 2
+
+        return array_size
+
+    def _resize(self, array_size: int) -> None:
+        """Moves every live entry into fresh arrays, reusing the stored hashes."""
+        hashes, keys, vals = self._hashes, self._keys, self._vals
+        self._allocate(array_size)
+
+        for key_hash, key, val in zip(hashes, keys, vals):
+            if key is _EMPTY or key is _TOMBSTONE:
+                continue
+
+            slot = self._slot(key_hash)
+            while self._keys[slot] is not _EMPTY:
+                slot = (slot + 1) & self._mask
+
+            self._hashes[slot] = key_hash
+            self._keys[slot] = key
+            self._vals[slot] = val
+            self.size += 1
+
+    def _allocate(self, array_size: int) -> None:
+        self._hashes: List[Optional[int]] = [None] * array_size
+        self._keys: List[Any] = [_EMPTY] * array_size
+        self._vals: List[Any] = [None] * array_size
+        self._mask = array_size - 1
+        self._shift = 64 - (array_size.bit_length() - 1)
+        self._tombstones = 0
+        self.size = 0
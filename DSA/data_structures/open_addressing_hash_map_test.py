@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from data_structures.open_addressing_hash_map import OpenAddressingHashMap
+
+
+class _CollidingKey:
+    """A key whose hash always collides, to force long probes."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and self.name == other.name
+
+
+class OpenAddressingHashMapTest(unittest.TestCase):
+
+    def test_put(self):
+        hash_map = OpenAddressingHashMap()
+        hash_map.put("1", 1)
+        hash_map.put("2", 2)
+        hash_map.put("3", 3)
+
+        self.assertEqual(3, hash_map.size)
+
+    def test_get_and_contains(self):
+        hash_map = OpenAddressingHashMap()
+        hash_map.put("1", 1)
+        hash_map.put("2", 2)
+
+        self.assertEqual(1, hash_map.get("1"))
+        self.assertEqual(2, hash_map.get("2"))
+        self.assertTrue(hash_map.contains("1"))
+        self.assertFalse(hash_map.contains("3"))
+
+        with self.assertRaises(KeyError):
+            hash_map.get("3")
+
+    def test_update_value(self):
+        hash_map = OpenAddressingHashMap()
+        hash_map.put("1", 1)
+        hash_map.put("1", "one")
+
+        self.assertEqual("one", hash_map.get("1"))
+        self.assertEqual(1, hash_map.size)
+
+    def test_delete_keeps_probe_chain(self):
+        hash_map = OpenAddressingHashMap()
+        keys = [_CollidingKey(i) for i in range(4)]
+        for i, key in enumerate(keys):
+            hash_map.put(key, i)
+
+        hash_map.delete(keys[1])
+
+        # keys[2] and keys[3] were probed past keys[1]'s slot
+        self.assertEqual(2, hash_map.get(keys[2]))
+        self.assertEqual(3, hash_map.get(keys[3]))
+        self.assertFalse(hash_map.contains(keys[1]))
+        self.assertEqual(3, hash_map.size)
+
+        # The tombstone gets reused
+        hash_map.put(keys[1], 'back')
+        self.assertEqual('back', hash_map.get(keys[1]))
+        self.assertEqual(0, hash_map._tombstones)
+
+        with self.assertRaises(KeyError):
+            hash_map.delete(_CollidingKey(10))
+
+    def test_grows_and_shrinks(self):
+        hash_map = OpenAddressingHashMap()
+        for i in range(1000):
+            hash_map.put(i, i)
+
+        self.assertEqual(2048, len(hash_map._keys))
+        for i in range(1000):
+            self.assertEqual(i, hash_map.get(i))
+
+        for i in range(990):
+            hash_map.delete(i)
+
+        self.assertLess(len(hash_map._keys), 2048)
+        for i in range(990, 1000):
+            self.assertEqual(i, hash_map.get(i))
+
+    def test_matches_dict(self):
+        rand = random.Random(11)
+        hash_map = OpenAddressingHashMap()
+        expected = {}
+
+        for _ in range(5000):
+            key = rand.randrange(300)
+            if rand.random() < 0.6:
+                hash_map.put(key, key * 2)
+                expected[key] = key * 2
+            elif key in expected:
+                hash_map.delete(key)
+                del expected[key]
+
+        self.assertEqual(len(expected), hash_map.size)
+        for key in range(300):
+            self.assertEqual(key in expected, hash_map.contains(key))
+
+    def test_init_with_invalid_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            OpenAddressingHashMap(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
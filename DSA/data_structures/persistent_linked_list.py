@@ -0,0 +1,147 @@
+from typing import Any, Iterable, Iterator, Optional
+
+
+class Node:
+    """An immutable list node. Never change a node once it's linked: other lists may share it."""
+
+    __slots__ = ('val', 'next')
+
+    def __init__(self, val: Any, next_node: Optional['Node']) -> None:
+        self.val = val
+        self.next = next_node
+
+
+class PersistentLinkedList:
+    """An immutable singly linked list, where every change returns a new list.
+
+    The trick is that the old and new lists share nodes (structural sharing).
+    Prepending creates one node that points at the old head, so both versions
+    are valid and nothing is copied. This makes snapshots free: just keep
+    a reference to the version you want to go back to.
+
+    1 > 2 > 3          (old list)
+    0 -^               (old.prepend(0))
+
+    Removing a value can't change the nodes in front of it (the old list
+    uses them), so we copy just those and share everything after (path copying).
+
+    Prepend: O(1)
+    Head/rest: O(1)
+    Remove: O(k), where k is the position of the value
+    Lookup: O(n)
+
+    Uses:
+        * Undo/redo history
+        * Backtracking and speculative evaluation (try something, throw it away)
+        * Sharing data between threads without locks (nothing ever changes)
+    """
+
+    __slots__ = ('_head', 'size')
+
+    def __init__(self) -> None:
+        """Initializes an empty list."""
+        self._head = None
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, vals: Iterable[Any]) -> 'PersistentLinkedList':
+        """Builds a list with the values in the same order.
+
+        Time: O(n)
+        """
+        head = None
+        size = 0
+
+        for val in reversed(list(vals)):
+            head = Node(val, head)
+            size += 1
+
+        return cls._from_node(head, size)
+
+    def prepend(self, val: Any) -> 'PersistentLinkedList':
+        """Returns a new list with val in front of this one.
+
+        Time: O(1)
+        Space: O(1)
+
+        :param val: The item to add.
+        :return: The new list.
+        """
+        return self._from_node(Node(val, self._head), self.size + 1)
+
+    def head(self) -> Any:
+        """Returns the first value in the list."""
+        if not self._head:
+            raise Exception('List is empty')
+
+        return self._head.val
+
+    def rest(self) -> 'PersistentLinkedList':
+        """Returns the list without its first value (sharing all of its nodes).
+
+        Time: O(1)
+        """
+        if not self._head:
+            raise Exception('List is empty')
+
+        return self._from_node(self._head.next, self.size - 1)
+
+    def remove(self, val: Any) -> 'PersistentLinkedList':
+        """Returns a new list without the first occurrence of val.
+
+        1. Walk the list until we find the value, remembering the nodes we passed.
+        2. Copy the passed nodes, in reverse, onto the node after the value.
+
+        Time: O(k), where k is the position of val
+        Space: O(k)
+
+        :param val: The value to remove.
+        :return: The new list.
+        """
+        passed = []
+        node = self._head
+
+        while node and node.val != val:
+            passed.append(node.val)
+            node = node.next
+
+        if not node:
+            raise KeyError('Value not found %s', val)
+
+        head = node.next
+        for passed_val in reversed(passed):
+            head = Node(passed_val, head)
+
+        return self._from_node(head, self.size - 1)
+
+    def reverse(self) -> 'PersistentLinkedList':
+        """Returns a reversed copy of the list.
+
+        Time: O(n)
+        Space: O(n)
+        """
+        head = None
+        node = self._head
+
+        while node:
+            head = Node(node.val, head)
+            node = node.next
+
+        return self._from_node(head, self.size)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._head
+        while node:
+            yield node.val
+            node = node.next
+
+    @classmethod
+    def _from_node(cls, head: Optional[Node], size: int) -> 'PersistentLinkedList':
+        persistent_list = cls.__new__(cls)
+        persistent_list._head = head
+        persistent_list.size = size
+
+        return persistent_list
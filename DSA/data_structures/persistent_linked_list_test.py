@@ -0,0 +1,64 @@
+import unittest
+
+from data_structures.persistent_linked_list import PersistentLinkedList
+
+
+class PersistentLinkedListTest(unittest.TestCase):
+
+    def test_prepend(self):
+        empty = PersistentLinkedList()
+        one = empty.prepend(1)
+        two = one.prepend(2)
+
+        self.assertEqual([], list(empty))
+        self.assertEqual([1], list(one))
+        self.assertEqual([2, 1], list(two))
+        self.assertEqual(2, two.size)
+
+    def test_versions_share_nodes(self):
+        base = PersistentLinkedList.from_iterable([1, 2, 3])
+        left = base.prepend('a')
+        right = base.prepend('b')
+
+        self.assertIs(base._head, left._head.next)
+        self.assertIs(base._head, right._head.next)
+        self.assertEqual(['a', 1, 2, 3], list(left))
+        self.assertEqual(['b', 1, 2, 3], list(right))
+
+    def test_head_and_rest(self):
+        linked_list = PersistentLinkedList.from_iterable([1, 2, 3])
+
+        self.assertEqual(1, linked_list.head())
+        self.assertEqual([2, 3], list(linked_list.rest()))
+        self.assertIs(linked_list._head.next, linked_list.rest()._head)
+
+        with self.assertRaises(Exception):
+            PersistentLinkedList().head()
+
+    def test_remove(self):
+        linked_list = PersistentLinkedList.from_iterable([1, 2, 3, 4])
+        removed = linked_list.remove(2)
+
+        self.assertEqual([1, 3, 4], list(removed))
+        self.assertEqual(3, removed.size)
+        self.assertEqual([1, 2, 3, 4], list(linked_list))
+
+        # Everything after the removed value is shared
+        self.assertIs(linked_list._head.next.next, removed._head.next)
+
+        with self.assertRaises(KeyError):
+            linked_list.remove(5)
+
+    def test_reverse(self):
+        linked_list = PersistentLinkedList.from_iterable([1, 2, 3])
+
+        self.assertEqual([3, 2, 1], list(linked_list.reverse()))
+        self.assertEqual([1, 2, 3], list(linked_list))
+
+    def test_is_empty(self):
+        self.assertTrue(PersistentLinkedList().is_empty())
+        self.assertFalse(PersistentLinkedList().prepend(1).is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+from typing import Any, Iterator
+
+from data_structures.persistent_linked_list import PersistentLinkedList
+
+
+class PersistentStack:
+    """An immutable LIFO queue, where push/pop return a new stack.
+
+    Built on a PersistentLinkedList (the top of the stack is the head),
+    so a new version shares every node with the one it came from.
+    Keeping an old version around is an O(1) snapshot.
+
+        stack = PersistentStack().push(1).push(2)
+        top = stack.peek()     # 2
+        stack = stack.pop()    # The old stack still has 2 on top
+
+    Operations:
+    Push: O(1)
+    Peek/Pop: O(1)
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self) -> None:
+        """Initializes an empty stack."""
+        self._items = PersistentLinkedList()
+
+    @property
+    def size(self) -> int:
+        return self._items.size
+
+    def push(self, val: Any) -> 'PersistentStack':
+        """Returns a new stack with val on top of this one.
+
+        :param val: The value to add to the stack.
+        :return: The new stack.
+        """
+        return self._from_items(self._items.prepend(val))
+
+    def peek(self) -> Any:
+        """Returns the value at the top of the stack.
+
+        :return: The value at the top of the stack.
+        """
+        if self.size == 0:
+            raise Exception('Stack is empty')
+
+        return self._items.head()
+
+    def pop(self) -> 'PersistentStack':
+        """Returns a new stack without the top value (use peek to read it first).
+
+        :return: The new stack.
+        """
+        if self.size == 0:
+            raise Exception('Stack is empty')
+
+        return self._from_items(self._items.rest())
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates from the top of the stack down."""
+        return iter(self._items)
+
+    @classmethod
+    def _from_items(cls, items: PersistentLinkedList) -> 'PersistentStack':
+        stack = cls.__new__(cls)
+        stack._items = items
+
+        return stack
@@ -0,0 +1,40 @@
+import unittest
+
+from data_structures.persistent_stack import PersistentStack
+
+
+class PersistentStackTest(unittest.TestCase):
+
+    def test_push(self):
+        stack = PersistentStack().push(1).push(2).push(3)
+
+        self.assertEqual(3, stack.size)
+        self.assertEqual(3, stack.peek())
+        self.assertEqual([3, 2, 1], list(stack))
+
+    def test_pop(self):
+        stack = PersistentStack().push(1).push(2)
+        popped = stack.pop()
+
+        self.assertEqual(1, popped.peek())
+        self.assertEqual(1, popped.size)
+        self.assertTrue(popped.pop().is_empty())
+
+    def test_snapshots_are_unchanged(self):
+        snapshot = PersistentStack().push(1).push(2)
+        branch = snapshot.pop().push(3)
+
+        self.assertEqual([2, 1], list(snapshot))
+        self.assertEqual([3, 1], list(branch))
+
+    def test_pop_empty_stack_raises_exception(self):
+        with self.assertRaises(Exception):
+            PersistentStack().pop()
+
+    def test_peek_empty_stack_raises_exception(self):
+        with self.assertRaises(Exception):
+            PersistentStack().peek()
+
+
+if __name__ == '__main__':
+    unittest.main()
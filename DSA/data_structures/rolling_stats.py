@@ -0,0 +1,210 @@
+import math
+from collections import deque
+from typing import Dict
+
+from data_structures.ring_buffer import RingBuffer
+
+_DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class RollingStats:
+    """Statistics over the last N samples, updated as samples come in.
+
+    The samples live in a RingBuffer. When it's full, the oldest sample
+    is dequeued (evicted) before the new one is added, and every aggregate
+    is updated for both, so reading a stat never has to scan the window.
+
+    * Mean/variance: keep a running sum and sum of squares, exactly.
+        Every float is an integer multiple of some power of two, so we store the
+        samples as integer multiples of 2^-scale (the finest power any sample needed)
+        and keep the sums in Python ints. Evicting a sample subtracts exactly what
+        adding it added, so there's no rounding error to pile up: one huge sample
+        can't leave a trace in the sums after it's gone. mean and variance are only
+        rounded once, when we divide (and variance is n*sum_sq - sum^2 over n^2 with
+        no cancellation, since it's exact).
+    * Min/max: keep a monotonic deque of (sequence number, value).
+        For min, each new sample pops every sample at the back that is >= it,
+        since those can never be the min again. So the front is always the min,
+        and it's evicted once its sequence number falls out of the window.
+    * Quantiles: keep a log-bucketed histogram (like DDSketch). A value x > 0
+        goes in bucket ceil(log_gamma(x)), so the bucket's representative value
+        is within relative_accuracy of x. Buckets are just counts, so evicting
+        is a decrement. The number of buckets depends on the range of the values
+        (log scale), not the window size.
+
+    Time:
+        add: O(1) amortized
+        mean/variance/min/max: O(1)
+        quantile: O(B log B) for B histogram buckets
+    """
+
+    def __init__(self, window: int, relative_accuracy: float = _DEFAULT_RELATIVE_ACCURACY) -> None:
+        """Initializes the stats.
+
+        :param window: The number of samples to keep.
+        :param relative_accuracy: How close quantile estimates are to real samples (e.g. 0.01 = 1%).
+        """
+        if window < 1:
+            raise ValueError('Window must be at least 1.')
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('Relative accuracy must be between 0 and 1.')
+
+        self._samples = RingBuffer(window)
+        self._window = window
+        self._sequence = 0
+        self.size = 0
+
+        # In units of 2^-scale
+        self._scale = 0
+        self._sum = 0
+        self._sum_of_squares = 0
+
+        self._min_deque = deque()
+        self._max_deque = deque()
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive_buckets: Dict[int, int] = {}
+        self._negative_buckets: Dict[int, int] = {}
+        self._zero_count = 0
+
+    def add(self, val: float) -> None:
+        """Adds a sample, evicting the oldest one if the window is full.
+
+        :param val: The sample to add (must be finite).
+        :return: None.
+        """
+        # inf/nan have no exact value to add (or take back out)
+        if not math.isfinite(val):
+            raise ValueError('Sample must be finite.')
+
+        if not self._samples.enqueue(val):
+            self._evict(self._samples.dequeue())
+            self._samples.enqueue(val)
+        else:
+            self.size += 1
+
+        units = self._to_units(val)
+        self._sum += units
+        self._sum_of_squares += units * units
+
+        while self._min_deque and self._min_deque[-1][1] >= val:
+            self._min_deque.pop()
+        self._min_deque.append((self._sequence, val))
+
+        while self._max_deque and self._max_deque[-1][1] <= val:
+            self._max_deque.pop()
+        self._max_deque.append((self._sequence, val))
+
+        self._update_bucket(val, 1)
+        self._sequence += 1
+
+    def mean(self) -> float:
+        self._check_not_empty()
+        return self._sum / (self.size << self._scale)
+
+    def variance(self) -> float:
+        """Returns the population variance of the window."""
+        self._check_not_empty()
+        numerator = self.size * self._sum_of_squares - self._sum * self._sum
+        return numerator / ((self.size * self.size) << 2 * self._scale)
+
+    def stdev(self) -> float:
+        return math.sqrt(self.variance())
+
+    def min(self) -> float:
+        self._check_not_empty()
+        return self._min_deque[0][1]
+
+    def max(self) -> float:
+        self._check_not_empty()
+        return self._max_deque[0][1]
+
+    def quantile(self, q: float) -> float:
+        """Returns an estimate of the q-quantile of the window (e.g. 0.99 for p99).
+
+        1. Work out the rank we want: q * (size - 1).
+        2. Walk the buckets from smallest value to largest, adding up counts.
+        3. Return the representative value of the bucket that reaches the rank.
+
+        :param q: The quantile, between 0 and 1.
+        :return: A value within relative_accuracy of a sample at that rank.
+        """
+        self._check_not_empty()
+        if not 0 <= q <= 1:
+            raise ValueError('Quantile must be between 0 and 1.')
+
+        rank = q * (self.size - 1)
+        seen = 0
+
+        # Bigger keys are bigger magnitudes, so the most negative values come first.
+        for key in sorted(self._negative_buckets, reverse=True):
+            seen += self._negative_buckets[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive_buckets):
+            seen += self._positive_buckets[key]
+            if seen > rank:
+                return self._bucket_value(key)
+
+        # Only reachable through rounding in rank, so return the top bucket
+        return self.max()
+
+    def _evict(self, val: float) -> None:
+        """Removes the oldest sample from all of the aggregates."""
+        units = self._to_units(val)
+        self._sum -= units
+        self._sum_of_squares -= units * units
+
+        oldest = self._sequence - self._window
+        if self._min_deque[0][0] == oldest:
+            self._min_deque.popleft()
+        if self._max_deque[0][0] == oldest:
+            self._max_deque.popleft()
+
+        self._update_bucket(val, -1)
+
+    def _to_units(self, val: float) -> int:
+        """Returns val as an exact multiple of 2^-scale, first making the scale finer if val needs it."""
+        numerator, denominator = float(val).as_integer_ratio()
+        bits = denominator.bit_length() - 1  # The denominator is a power of two
+
+        if bits > self._scale:
+            finer = bits - self._scale
+            self._sum <<= finer
+            self._sum_of_squares <<= 2 * finer
+            self._scale = bits
+
+        return numerator << (self._scale - bits)
+
+    def _update_bucket(self, val: float, delta: int) -> None:
+        """Adds delta to the count of the bucket val falls in."""
+        if val > 0:
+            buckets = self._positive_buckets
+        elif val < 0:
+            buckets = self._negative_buckets
+            val = -val
+        else:
+            self._zero_count += delta
+            return
+
+        key = math.ceil(math.log(val) / self._log_gamma)
+        count = buckets.get(key, 0) + delta
+
+        if count:
+            buckets[key] = count
+        else:
+            del buckets[key]
+
+    def _bucket_value(self, key: int) -> float:
+        """Returns the value in the middle (relatively) of bucket (gamma^(key-1), gamma^key]."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _check_not_empty(self) -> None:
+        if self.size == 0:
+            raise Exception('No samples.')
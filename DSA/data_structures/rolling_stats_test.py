@@ -0,0 +1,138 @@
+import random
+import statistics
+import unittest
+
+from data_structures.rolling_stats import RollingStats
+
+
+class RollingStatsTest(unittest.TestCase):
+
+    def test_mean_and_variance(self):
+        stats = RollingStats(3)
+        for val in [1, 2, 3, 4, 5]:
+            stats.add(val)
+
+        self.assertEqual(3, stats.size)
+        self.assertAlmostEqual(4.0, stats.mean())
+        self.assertAlmostEqual(statistics.pvariance([3, 4, 5]), stats.variance())
+        self.assertAlmostEqual(statistics.pstdev([3, 4, 5]), stats.stdev())
+
+    def test_evicted_large_sample_leaves_no_rounding_error(self):
+        stats = RollingStats(3)
+        for val in [1e20, 1, 2, 3]:
+            stats.add(val)
+
+        self.assertEqual(2.0, stats.mean())
+        self.assertAlmostEqual(statistics.pvariance([1, 2, 3]), stats.variance())
+
+        # Nanosecond latencies, with one 100s timeout passing through the window
+        rand = random.Random(6)
+        stats = RollingStats(1000)
+        latencies = [rand.uniform(1950, 2050) for _ in range(2000)]
+        latencies[500] = 100e9
+        for val in latencies:
+            stats.add(val)
+
+        window = latencies[-1000:]
+        self.assertAlmostEqual(statistics.fmean(window), stats.mean())
+        self.assertAlmostEqual(statistics.pvariance(window), stats.variance())
+
+    def test_variance_of_large_values_close_together(self):
+        stats = RollingStats(4)
+        for val in [1e9 + 1, 1e9 + 2, 1e9 + 3, 1e9 + 4, 1e9 + 5]:
+            stats.add(val)
+
+        self.assertEqual(1.25, stats.variance())
+        self.assertEqual(1e9 + 3.5, stats.mean())
+
+    def test_min_max(self):
+        stats = RollingStats(3)
+
+        stats.add(5)
+        stats.add(1)
+        stats.add(3)
+        self.assertEqual(1, stats.min())
+        self.assertEqual(5, stats.max())
+
+        stats.add(2)  # Evicts 5
+        self.assertEqual(1, stats.min())
+        self.assertEqual(3, stats.max())
+
+        stats.add(4)  # Evicts 1
+        self.assertEqual(2, stats.min())
+        self.assertEqual(4, stats.max())
+
+    def test_min_max_match_scan(self):
+        rand = random.Random(42)
+        stats = RollingStats(50)
+        samples = []
+
+        for _ in range(1000):
+            val = rand.randint(-100, 100)
+            stats.add(val)
+            samples.append(val)
+
+            window = samples[-50:]
+            self.assertEqual(min(window), stats.min())
+            self.assertEqual(max(window), stats.max())
+
+    def test_quantile_within_relative_accuracy(self):
+        rand = random.Random(7)
+        stats = RollingStats(1000, relative_accuracy=0.01)
+        samples = [rand.lognormvariate(0, 1) for _ in range(3000)]
+
+        for val in samples:
+            stats.add(val)
+
+        window = sorted(samples[-1000:])
+        for q in (0.0, 0.5, 0.9, 0.99, 1.0):
+            expected = window[int(q * 999)]
+            self.assertAlmostEqual(expected, stats.quantile(q), delta=expected * 0.01)
+
+    def test_quantile_with_zero_and_negative_values(self):
+        stats = RollingStats(5)
+        for val in [-10, -1, 0, 1, 10]:
+            stats.add(val)
+
+        self.assertAlmostEqual(-10, stats.quantile(0), delta=0.1)
+        self.assertEqual(0, stats.quantile(0.5))
+        self.assertAlmostEqual(10, stats.quantile(1), delta=0.1)
+
+    def test_empty_stats_raise_exception(self):
+        stats = RollingStats(3)
+        with self.assertRaises(Exception):
+            stats.mean()
+        with self.assertRaises(Exception):
+            stats.quantile(0.5)
+
+    def test_invalid_arguments_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            RollingStats(0)
+        with self.assertRaises(ValueError):
+            RollingStats(3, relative_accuracy=1)
+
+        stats = RollingStats(3)
+        stats.add(1)
+        with self.assertRaises(ValueError):
+            stats.quantile(1.5)
+
+    def test_non_finite_sample_raises_value_error(self):
+        stats = RollingStats(3)
+        stats.add(1)
+        stats.add(2)
+
+        for val in (float('inf'), float('-inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                stats.add(val)
+
+        # Nothing changed, so later samples still give the right answers
+        stats.add(3)
+        stats.add(4)
+        self.assertEqual(3, stats.size)
+        self.assertAlmostEqual(3.0, stats.mean())
+        self.assertEqual(2, stats.min())
+        self.assertEqual(4, stats.max())
+
+
+if __name__ == '__main__':
+    unittest.main()
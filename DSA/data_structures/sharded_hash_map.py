@@ -0,0 +1,271 @@
+import hashlib
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
+
+from data_structures.hash_map import HashMap
+
+# Points each shard gets on the ring. More points spread the keys more evenly between shards.
+_VNODES = 64
+
+
+def _ring_hash(data: bytes) -> int:
+    """A 64-bit position on the ring. Has to be the same in the client and every worker,
+    which rules out hash() (it's salted per process for str and bytes)."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def _key_bytes(key: Any) -> bytes:
+    """Encodes a key for _ring_hash, tagged with its type so 'a', b'a' and 1/'1' don't clash."""
+    if isinstance(key, str):
+        return b's' + key.encode()
+    if isinstance(key, bytes):
+        return b'b' + key
+    if isinstance(key, int):
+        return b'i' + str(int(key)).encode()
+
+    raise TypeError('Sharded keys must be str, bytes or int')
+
+
+class ConsistentHashRing:
+    """Maps keys to shards, so adding a shard only moves the keys the new shard takes over.
+
+    With shard = hash % N, changing N moves almost every key. Instead, each shard puts
+    vnodes points on a ring of 64-bit positions, and a key belongs to the first point
+    clockwise from its own position. A new shard's points each take over the
+    arc just before them, so only ~1/N of the keys move, all of them to the new shard.
+
+    Having many points (virtual nodes) per shard evens out the arcs, so each shard
+    gets about the same share of the keys.
+
+    * Add shard: O(vnodes * points) (inserting into sorted lists)
+    * Shard for key: O(log points)
+    """
+
+    def __init__(self, vnodes: int = _VNODES) -> None:
+        if vnodes < 1:
+            raise ValueError('Vnodes must be at least 1')
+
+        self._vnodes = vnodes
+        # Sorted ring positions, and the shard that owns each one
+        self._points: List[int] = []
+        self._shards: List[int] = []
+
+    def add(self, shard: int) -> None:
+        for i in range(self._vnodes):
+            point = _ring_hash(f'{shard}#{i}'.encode())
+            index = bisect_left(self._points, point)
+            self._points.insert(index, point)
+            self._shards.insert(index, shard)
+
+    def shard_for(self, key: Any) -> int:
+        """Returns the shard that owns the key: the first point clockwise from it (wrapping around)."""
+        if not self._points:
+            raise ValueError('Ring has no shards')
+
+        index = bisect_right(self._points, _ring_hash(_key_bytes(key)))
+
+        return self._shards[index % len(self._points)]
+
+
+def _serve(conn, shard: int) -> None:
+    """Worker process loop: keeps one HashMap, and runs commands from the pipe until told to close.
+
+    Each reply is (True, result) or (False, exception), so errors get raised in the client.
+    """
+    hash_map = HashMap()
+
+    def extract(ring: ConsistentHashRing) -> List[Tuple[Any, Any]]:
+        moved = [(key, val) for key, val in hash_map.items() if ring.shard_for(key) != shard]
+        for key, _ in moved:
+            hash_map.delete(key)
+        return moved
+
+    commands = {
+        'put_many': hash_map.put_many,
+        'get_many': hash_map.get_many,
+        'get': hash_map.get,
+        'delete': hash_map.delete,
+        'size': lambda: hash_map.size,
+        'extract': extract,
+    }
+
+    while True:
+        command, args = conn.recv()
+        if command == 'close':
+            break
+
+        try:
+            result = commands[command](*args)
+        except Exception as e:
+            conn.send((False, e))
+        else:
+            conn.send((True, result))
+
+    conn.close()
+
+
+class ShardedHashMap:
+    """A hash map split across worker processes, one HashMap per process (a shard).
+
+    One process means one core and one address space. Here every shard is its own
+    process, so lookups for different shards run in parallel, and the map can
+    hold more than one process's worth of memory.
+
+    * A ConsistentHashRing picks each key's shard.
+    * The client talks to each shard over a Pipe. put_many/get_many group the keys
+      by shard, send every shard its whole batch, and only then wait for the replies,
+      so the shards work at the same time and we pay one round trip per shard, not per key.
+    * add_shard starts a new worker and adds it to the ring. Each old shard then hands
+      over just the keys the new shard now owns (consistent hashing keeps that to ~1/N).
+
+    Keys must be str, bytes or int (so every process hashes them the same way),
+    and keys and values get pickled to cross the pipes.
+    Call close (or use a with block) to stop the workers.
+
+    Operations (plus a round trip to a worker):
+    * Put(key, val): O(1) avg
+    * Get(key): O(1) avg
+    * Put/get many (k keys): O(k) avg, one round trip per shard
+    * Add shard: O(n / N) keys moved
+    """
+
+    def __init__(self, shards: int = 4, vnodes: int = _VNODES) -> None:
+        """Starts the worker processes.
+
+        :param shards: How many worker processes to start.
+        :param vnodes: Points per shard on the consistent hash ring.
+        """
+        if shards < 1:
+            raise ValueError('Shards must be at least 1')
+
+        self._ring = ConsistentHashRing(vnodes)
+        self._workers: List[multiprocessing.Process] = []
+        self._conns = []
+
+        for _ in range(shards):
+            self._start_shard()
+
+    @property
+    def size(self) -> int:
+        return sum(self._call_all('size', [()] * len(self._conns)))
+
+    def put(self, key: Any, val: Any) -> None:
+        self.put_many([(key, val)])
+
+    def get(self, key: Any) -> Any:
+        return self._call(self._ring.shard_for(key), 'get', key)
+
+    def contains(self, key: Any) -> bool:
+        try:
+            self.get(key)
+        except KeyError:
+            return False
+
+        return True
+
+    def delete(self, key: Any) -> None:
+        self._call(self._ring.shard_for(key), 'delete', key)
+
+    def put_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Adds (key, value) pairs, sending each shard its share in one message."""
+        batches: Dict[int, List[Tuple[Any, Any]]] = {}
+        for key, val in pairs:
+            batches.setdefault(self._ring.shard_for(key), []).append((key, val))
+
+        for shard, batch in batches.items():
+            self._conns[shard].send(('put_many', (batch,)))
+        self._receive_all(batches)
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        """Returns the value for each key (or default), asking each shard for its share in one message."""
+        keys = list(keys)
+        positions: Dict[int, List[int]] = {}
+        for i, key in enumerate(keys):
+            positions.setdefault(self._ring.shard_for(key), []).append(i)
+
+        for shard, indices in positions.items():
+            self._conns[shard].send(('get_many', ([keys[i] for i in indices], default)))
+
+        values = [default] * len(keys)
+        for indices, shard_values in zip(positions.values(), self._receive_all(positions)):
+            for i, val in zip(indices, shard_values):
+                values[i] = val
+
+        return values
+
+    def add_shard(self) -> int:
+        """Starts a new shard and moves the keys it now owns over to it.
+
+        :return: The new shard's number.
+        """
+        shard = self._start_shard()
+
+        moved = self._call_all('extract', [(self._ring,)] * shard)
+        self._call(shard, 'put_many', [pair for pairs in moved for pair in pairs])
+
+        return shard
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        for conn in self._conns:
+            conn.send(('close', ()))
+            conn.close()
+        for worker in self._workers:
+            worker.join()
+
+        self._conns = []
+        self._workers = []
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def __enter__(self) -> 'ShardedHashMap':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start_shard(self) -> int:
+        shard = len(self._conns)
+        conn, worker_conn = multiprocessing.Pipe()
+        worker = multiprocessing.Process(target=_serve, args=(worker_conn, shard), daemon=True)
+        worker.start()
+        worker_conn.close()
+
+        self._conns.append(conn)
+        self._workers.append(worker)
+        self._ring.add(shard)
+
+        return shard
+
+    def _call(self, shard: int, command: str, *args: Any) -> Any:
+        self._conns[shard].send((command, args))
+        return self._receive(shard)
+
+    def _call_all(self, command: str, args: List[tuple]) -> List[Any]:
+        """Sends shard i the command with args[i], then collects the replies (so the shards run in parallel)."""
+        for conn, shard_args in zip(self._conns, args):
+            conn.send((command, shard_args))
+
+        return self._receive_all(range(len(args)))
+
+    def _receive(self, shard: int) -> Any:
+        return self._receive_all([shard])[0]
+
+    def _receive_all(self, shards: Iterable[int]) -> List[Any]:
+        """Collects a reply from each shard, in order.
+
+        If any shard failed, raise its error, but only after reading every reply,
+        so no pipe is left with an unread reply.
+        """
+        replies = [self._conns[shard].recv() for shard in shards]
+
+        for ok, result in replies:
+            if not ok:
+                raise result
+
+        return [result for _, result in replies]
@@ -0,0 +1,120 @@
+import unittest
+
+from data_structures.sharded_hash_map import ConsistentHashRing, ShardedHashMap
+
+
+class ConsistentHashRingTest(unittest.TestCase):
+
+    def test_spreads_keys_between_shards(self):
+        ring = ConsistentHashRing()
+        for shard in range(4):
+            ring.add(shard)
+
+        counts = [0] * 4
+        for i in range(10000):
+            counts[ring.shard_for(i)] += 1
+
+        for count in counts:
+            self.assertGreater(count, 1500)
+
+    def test_adding_a_shard_only_moves_keys_to_it(self):
+        ring = ConsistentHashRing()
+        for shard in range(4):
+            ring.add(shard)
+        keys = [f'key{i}' for i in range(10000)]
+        before = [ring.shard_for(key) for key in keys]
+
+        ring.add(4)
+        after = [ring.shard_for(key) for key in keys]
+
+        moved = [(old, new) for old, new in zip(before, after) if old != new]
+        self.assertTrue(all(new == 4 for _, new in moved))
+        self.assertLess(len(moved), 10000 * 0.3)
+        self.assertGreater(len(moved), 10000 * 0.1)
+
+    def test_keys_are_typed(self):
+        ring = ConsistentHashRing(vnodes=1)
+        ring.add(0)
+
+        self.assertEqual(0, ring.shard_for(True))
+        with self.assertRaises(TypeError):
+            ring.shard_for(1.5)
+        with self.assertRaises(ValueError):
+            ConsistentHashRing().shard_for('a')
+        with self.assertRaises(ValueError):
+            ConsistentHashRing(vnodes=0)
+
+
+class ShardedHashMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self.hash_map = ShardedHashMap(shards=3)
+
+    def tearDown(self):
+        self.hash_map.close()
+
+    def test_put_get_delete(self):
+        self.hash_map.put('a', 1)
+        self.hash_map.put(2, [2])
+        self.hash_map.put('a', 'one')
+
+        self.assertEqual(2, self.hash_map.size)
+        self.assertEqual('one', self.hash_map.get('a'))
+        self.assertEqual([2], self.hash_map.get(2))
+        self.assertIn(2, self.hash_map)
+
+        self.hash_map.delete(2)
+
+        self.assertEqual(1, len(self.hash_map))
+        self.assertFalse(self.hash_map.contains(2))
+        with self.assertRaises(KeyError):
+            self.hash_map.get(2)
+        with self.assertRaises(KeyError):
+            self.hash_map.delete(2)
+
+    def test_put_many_get_many(self):
+        self.hash_map.put_many((i, i * i) for i in range(1000))
+
+        self.assertEqual(1000, self.hash_map.size)
+        self.assertEqual([i * i for i in range(1000)], self.hash_map.get_many(range(1000)))
+        self.assertEqual([4, -1, 9], self.hash_map.get_many([2, 'missing', 3], default=-1))
+
+        # Every shard got some of the keys
+        sizes = self.hash_map._call_all('size', [()] * 3)
+        self.assertTrue(all(size > 0 for size in sizes))
+
+    def test_add_shard_moves_keys(self):
+        self.hash_map.put_many((str(i), i) for i in range(3000))
+
+        self.assertEqual(3, self.hash_map.add_shard())
+
+        sizes = self.hash_map._call_all('size', [()] * 4)
+        self.assertEqual(3000, sum(sizes))
+        self.assertGreater(sizes[3], 0)
+        self.assertEqual(list(range(3000)), self.hash_map.get_many(str(i) for i in range(3000)))
+
+        # No shard is left holding a key it doesn't own
+        ring = self.hash_map._ring
+        self.assertEqual([[]] * 4, self.hash_map._call_all('extract', [(ring,)] * 4))
+
+        self.hash_map.put('new', 1)
+        self.assertEqual(1, self.hash_map.get('new'))
+
+    def test_unsupported_key_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            self.hash_map.put(1.5, 1)
+
+    def test_context_manager_stops_workers(self):
+        with ShardedHashMap(shards=2) as hash_map:
+            hash_map.put('a', 1)
+            workers = list(hash_map._workers)
+
+        self.assertTrue(all(not worker.is_alive() for worker in workers))
+
+    def test_init_with_invalid_shards_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ShardedHashMap(shards=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+from data_structures.slot_ring_buffer import SlotRingBuffer
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Opens an existing segment, without registering it with this process's resource tracker if we can.
+
+    The tracker unlinks every segment registered with it when its process exits,
+    so a process that only attached would destroy the buffer for everyone else.
+    Only the creator should unlink it. See SharedRingBuffer for what that means before Python 3.13.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedRingBuffer(SlotRingBuffer):
+    """A circular FIFO queue of fixed-size slots in shared memory.
+
+    Any process that attaches to the segment (by name) can enqueue/dequeue
+    bytes payloads or fixed-width struct records, without pickling and
+    without any syscalls on the hot path (it's just reads/writes to shared pages).
+    See SlotRingBuffer for the layout.
+
+    Modes:
+        * SPSC (single producer, single consumer): no locks at all.
+        * MPSC: pass a multiprocessing.Lock, which producers take around enqueue.
+          There must still be only one consumer.
+
+    Gotcha: we rely on stores becoming visible in program order, which holds
+    on x86 but isn't guaranteed on weaker memory models (e.g. ARM).
+
+    Gotcha: before Python 3.13, attaching always registers the segment with the
+    attaching process's resource tracker, which unlinks it when that process exits.
+    Child processes of the creator share its tracker, so they're fine, but an
+    unrelated process that attaches destroys the buffer when it exits.
+    (Unregistering after attaching would break the children instead: it would drop the
+    creator's registration from the shared tracker.) On 3.13+ we attach with track=False.
+
+    * Enqueue: O(1) (plus the payload copy)
+    * Dequeue: O(1) (plus the payload copy)
+    """
+
+    def __init__(self, capacity: int = 0, slot_size: int = 0,
+                 name: Optional[str] = None, lock: Any = None) -> None:
+        """Creates a new shared buffer, or attaches to an existing one.
+
+        :param capacity: The number of slots (only used when creating).
+        :param slot_size: The max payload size in bytes (only used when creating).
+        :param name: The name of an existing buffer to attach to, or None to create one.
+        :param lock: A multiprocessing.Lock shared by all producers, for MPSC mode.
+        """
+        if name is None:
+            size = self.required_size(capacity, slot_size)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self.write_header(self._shm.buf, capacity, slot_size)
+        else:
+            self._shm = _attach(name)
+
+        super().__init__(self._shm.buf, lock)
+
+    @property
+    def name(self) -> str:
+        """The name other processes use to attach to this buffer."""
+        return self._shm.name
+
+    def close(self) -> None:
+        """Detaches this process from the buffer."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the buffer. Call once, from the process that created it."""
+        self._shm.unlink()
@@ -0,0 +1,146 @@
+import multiprocessing
+import os
+import struct
+import subprocess
+import sys
+import time
+import unittest
+
+from data_structures.shared_ring_buffer import SharedRingBuffer
+
+_RECORD = struct.Struct('<qd')
+
+
+def _produce(name, lock, start, count):
+    ring_buffer = SharedRingBuffer(name=name, lock=lock)
+    for i in range(start, start + count):
+        while not ring_buffer.enqueue_record(_RECORD, i, i / 2):
+            pass
+    ring_buffer.close()
+
+
+def _attach_and_close(name):
+    SharedRingBuffer(name=name).close()
+
+
+class SharedRingBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ring_buffer = SharedRingBuffer(3, 16)
+
+    def tearDown(self):
+        self.ring_buffer.close()
+        self.ring_buffer.unlink()
+
+    def test_enqueue_dequeue(self):
+        self.ring_buffer.enqueue(b'one')
+        self.ring_buffer.enqueue(bytearray(b'two'))
+        self.ring_buffer.enqueue(memoryview(b'three'))
+
+        self.assertEqual(3, self.ring_buffer.size)
+        self.assertEqual(b'one', self.ring_buffer.dequeue())
+        self.assertEqual(b'two', self.ring_buffer.dequeue())
+        self.assertEqual(b'three', self.ring_buffer.dequeue())
+        self.assertEqual(0, self.ring_buffer.size)
+
+    def test_circular_enqueue(self):
+        self.assertTrue(self.ring_buffer.enqueue(b'1'))
+        self.assertTrue(self.ring_buffer.enqueue(b'2'))
+        self.assertTrue(self.ring_buffer.enqueue(b'3'))
+        self.assertFalse(self.ring_buffer.enqueue(b'4'))
+
+        self.assertEqual(b'1', self.ring_buffer.dequeue())
+        self.assertTrue(self.ring_buffer.enqueue(b'4'))
+
+        self.assertEqual(b'2', self.ring_buffer.dequeue())
+        self.assertEqual(b'3', self.ring_buffer.dequeue())
+        self.assertEqual(b'4', self.ring_buffer.dequeue())
+
+    def test_records(self):
+        self.ring_buffer.enqueue_record(_RECORD, 1, 0.5)
+        self.ring_buffer.enqueue_record(_RECORD, -2, 1.5)
+
+        self.assertEqual((1, 0.5), self.ring_buffer.dequeue_record(_RECORD))
+        self.assertEqual((-2, 1.5), self.ring_buffer.dequeue_record(_RECORD))
+
+    def test_attach_by_name(self):
+        self.ring_buffer.enqueue(b'hello')
+
+        attached = SharedRingBuffer(name=self.ring_buffer.name)
+        self.assertEqual(3, attached.capacity)
+        self.assertEqual(16, attached.slot_size)
+        self.assertEqual(b'hello', attached.dequeue())
+        attached.close()
+
+        self.assertEqual(0, self.ring_buffer.size)
+
+    def test_dequeue_empty_buffer_raises_exception(self):
+        with self.assertRaises(Exception):
+            self.ring_buffer.dequeue()
+
+    def test_oversized_payload_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.ring_buffer.enqueue(b'x' * 17)
+        with self.assertRaises(ValueError):
+            self.ring_buffer.enqueue_record(struct.Struct('<3q'), 1, 2, 3)
+
+    def test_init_with_invalid_capacity_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            SharedRingBuffer(0, 16)
+        with self.assertRaises(ValueError):
+            SharedRingBuffer(16, 0)
+
+    def test_multiple_producer_processes(self):
+        lock = multiprocessing.Lock()
+        producers = [multiprocessing.Process(target=_produce,
+                                             args=(self.ring_buffer.name, lock, start, 100))
+                     for start in (0, 100)]
+        for producer in producers:
+            producer.start()
+
+        received = []
+        deadline = time.monotonic() + 10
+        while len(received) < 200:
+            if time.monotonic() > deadline:
+                self.fail(f'Only received {len(received)} records')
+            if self.ring_buffer.size:
+                received.append(self.ring_buffer.dequeue_record(_RECORD))
+
+        for producer in producers:
+            producer.join(10)
+
+        self.assertEqual([(i, i / 2) for i in range(200)], sorted(received))
+
+    @unittest.skipIf(sys.version_info < (3, 13), 'Needs SharedMemory(track=False)')
+    def test_attaching_process_does_not_unlink(self):
+        self.ring_buffer.enqueue(b'kept')
+
+        # An unrelated process has its own resource tracker (our own children share ours).
+        # Stopping it waits for it to clean up whatever was registered with it.
+        script = ('from multiprocessing import resource_tracker\n'
+                  'from data_structures.shared_ring_buffer import SharedRingBuffer\n'
+                  f'SharedRingBuffer(name={self.ring_buffer.name!r}).close()\n'
+                  'resource_tracker._resource_tracker._stop()\n')
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', script], cwd=package_root, check=True, timeout=30)
+
+        attached = SharedRingBuffer(name=self.ring_buffer.name)
+        self.assertEqual(b'kept', attached.dequeue())
+        attached.close()
+
+    def test_attaching_child_process_does_not_unlink(self):
+        self.ring_buffer.enqueue(b'kept')
+
+        # Children share our resource tracker, so this works on every version
+        child = multiprocessing.Process(target=_attach_and_close, args=(self.ring_buffer.name,))
+        child.start()
+        child.join(10)
+        self.assertEqual(0, child.exitcode)
+
+        attached = SharedRingBuffer(name=self.ring_buffer.name)
+        self.assertEqual(b'kept', attached.dequeue())
+        attached.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
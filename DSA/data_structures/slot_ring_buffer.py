@@ -0,0 +1,170 @@
+import struct
+from contextlib import nullcontext
+from typing import Any, Optional, Tuple
+
+# Header layout. The write and read counters sit on their own cache lines,
+# so the producer and consumer aren't invalidating each other's line on every op.
+_WRITE_OFFSET = 0
+_READ_OFFSET = 64
+_META_OFFSET = 128
+_SLOTS_OFFSET = 192
+
+_MAGIC = b'DSARING1'
+_COUNTER = struct.Struct('<Q')
+_META = struct.Struct('<8sII')  # magic, capacity, slot size
+_LENGTH = struct.Struct('<I')
+
+
+class SlotRingBuffer:
+    """A circular FIFO queue of fixed-size slots, laid out in a flat buffer.
+
+    This holds the ring logic for buffers that live outside the Python heap
+    (shared memory, memory-mapped files...). Subclasses create or open the
+    memory and pass us a writable memoryview over it.
+
+    Layout: [write count | read count | magic, capacity, slot size | slots...]
+    Each slot is a 4-byte payload length followed by slot_size bytes.
+
+    Instead of positions, we store how many items have ever been written
+    and read. These only ever go up, so:
+        * used = write - read
+        * full when used == capacity, empty when used == 0
+        * slot index = count % capacity
+    and each counter only has one writer: the producer owns the write
+    count and the consumer owns the read count. The producer fills the slot
+    BEFORE bumping the write count, so the consumer never sees a half-written
+    slot (and the other way round for read).
+
+    * Enqueue: O(1) (plus the payload copy)
+    * Dequeue: O(1) (plus the payload copy)
+    """
+
+    def __init__(self, buf: memoryview, lock: Any = None) -> None:
+        """Initializes the ring over a buffer that already has a header.
+
+        :param buf: The buffer holding the header and slots.
+        :param lock: A lock that producers take around enqueue (None for a single producer).
+        """
+        magic, self.capacity, self.slot_size = _META.unpack_from(buf, _META_OFFSET)
+        if magic != _MAGIC:
+            raise ValueError('Not a ring buffer (bad header).')
+
+        self._buf = buf
+        self._stride = _LENGTH.size + self.slot_size
+        self._producer_lock = lock if lock is not None else nullcontext()
+
+    @staticmethod
+    def required_size(capacity: int, slot_size: int) -> int:
+        """Returns the number of bytes needed for a ring of this shape."""
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+        if slot_size < 1:
+            raise ValueError('Slot size must be at least 1.')
+
+        return _SLOTS_OFFSET + capacity * (_LENGTH.size + slot_size)
+
+    @staticmethod
+    def write_header(buf: memoryview, capacity: int, slot_size: int) -> None:
+        """Sets up an empty ring in a zeroed buffer."""
+        _META.pack_into(buf, _META_OFFSET, _MAGIC, capacity, slot_size)
+
+    @property
+    def size(self) -> int:
+        """The number of items in the buffer (a snapshot if other processes are using it)."""
+        return self._count(_WRITE_OFFSET) - self._count(_READ_OFFSET)
+
+    def enqueue(self, payload: Any) -> bool:
+        """Copies a bytes-like payload into the next free slot.
+
+        :param payload: The bytes to add (at most slot_size bytes).
+        :return: True if the item could be added, False otherwise (buffer full).
+        """
+        payload = memoryview(payload).cast('B')
+        if payload.nbytes > self.slot_size:
+            raise ValueError(f'Payload is larger than the slot size ({self.slot_size} bytes).')
+
+        with self._producer_lock:
+            write = self._free_slot()
+            if write is None:
+                return False
+
+            offset = self._slot_offset(write)
+            _LENGTH.pack_into(self._buf, offset, payload.nbytes)
+            offset += _LENGTH.size
+            self._buf[offset:offset + payload.nbytes] = payload
+
+            _COUNTER.pack_into(self._buf, _WRITE_OFFSET, write + 1)
+
+        return True
+
+    def enqueue_record(self, record: struct.Struct, *vals: Any) -> bool:
+        """Packs a fixed-width record straight into the next free slot.
+
+        :param record: The struct describing the record (must fit in slot_size).
+        :param vals: The values to pack.
+        :return: True if the item could be added, False otherwise (buffer full).
+        """
+        if record.size > self.slot_size:
+            raise ValueError(f'Record is larger than the slot size ({self.slot_size} bytes).')
+
+        with self._producer_lock:
+            write = self._free_slot()
+            if write is None:
+                return False
+
+            offset = self._slot_offset(write)
+            _LENGTH.pack_into(self._buf, offset, record.size)
+            record.pack_into(self._buf, offset + _LENGTH.size, *vals)
+
+            _COUNTER.pack_into(self._buf, _WRITE_OFFSET, write + 1)
+
+        return True
+
+    def dequeue(self) -> bytes:
+        """Returns the payload at the front of the buffer.
+
+        :return: The bytes that were least-recently added to the buffer.
+        """
+        read, offset = self._used_slot()
+        length = _LENGTH.unpack_from(self._buf, offset)[0]
+        offset += _LENGTH.size
+        payload = bytes(self._buf[offset:offset + length])
+
+        _COUNTER.pack_into(self._buf, _READ_OFFSET, read + 1)
+
+        return payload
+
+    def dequeue_record(self, record: struct.Struct) -> Tuple[Any, ...]:
+        """Unpacks the record at the front of the buffer.
+
+        :param record: The struct the record was enqueued with.
+        :return: The unpacked values.
+        """
+        read, offset = self._used_slot()
+        vals = record.unpack_from(self._buf, offset + _LENGTH.size)
+
+        _COUNTER.pack_into(self._buf, _READ_OFFSET, read + 1)
+
+        return vals
+
+    def _free_slot(self) -> Optional[int]:
+        """Returns the write count if there is a free slot, else None."""
+        write = self._count(_WRITE_OFFSET)
+        if write - self._count(_READ_OFFSET) == self.capacity:
+            return None
+
+        return write
+
+    def _used_slot(self) -> Tuple[int, int]:
+        """Returns the read count and slot offset for the front of the buffer."""
+        read = self._count(_READ_OFFSET)
+        if read == self._count(_WRITE_OFFSET):
+            raise Exception('Queue is empty.')
+
+        return read, self._slot_offset(read)
+
+    def _slot_offset(self, count: int) -> int:
+        return _SLOTS_OFFSET + (count % self.capacity) * self._stride
+
+    def _count(self, offset: int) -> int:
+        return _COUNTER.unpack_from(self._buf, offset)[0]
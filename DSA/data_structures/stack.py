@@ -1,4 +1,5 @@
-from typing import Any
+from array import array
+from typing import Any, Iterable, Optional, Sequence
 
 
 class Stack:
@@ -7,6 +8,20 @@ class Stack:
     Operations:
     Push: O(1) [O(n) amortized if implemented using an array]
     Peek/Pop: O(1) [O(n) amortized if implemented using an array]
+    push_many/pop_many: O(k) for k items (extend/slice the list rather than k calls)
+    min/max/sum: O(1) if track_aggregates=True
+
+    Typed mode:
+    Pass an array module typecode (e.g. 'd', 'q') to store the values
+    unboxed in an array.array (~8 bytes each instead of a pointer plus an object).
+
+    Aggregates:
+    With track_aggregates=True, we keep three more stacks alongside the values,
+    holding the min, max and sum of everything at or below each position.
+    A push only needs the entry below it, and a pop just throws its entry away,
+    so the aggregates of the whole stack are always on top.
+    (The aggregates go in plain lists even in typed mode, since a running sum
+    soon outgrows a small typecode like 'b'.)
 
     Uses:
         * Browser back button
@@ -18,9 +33,18 @@ class Stack:
             * Put the value back on the stack
     """
 
-    def __init__(self):
-        self._stack = []
-        self.size = 0
+    def __init__(self, typecode: Optional[str] = None, track_aggregates: bool = False):
+        self._typecode = typecode
+        self._stack = self._new_stack()
+
+        self._track_aggregates = track_aggregates
+        self._mins = [] if track_aggregates else None
+        self._maxes = [] if track_aggregates else None
+        self._sums = [] if track_aggregates else None
+
+    @property
+    def size(self) -> int:
+        return len(self._stack)
 
     def push(self, val: Any) -> None:
         """Pushes a value onto the stack.
@@ -28,8 +52,34 @@ class Stack:
         :param val: The value to add to the stack.
         :return: None.
         """
+        if not self._track_aggregates:
+            self._stack.append(val)
+            return
+
+        # Work everything out before changing anything, so a bad value leaves the stack as it was
+        if self._stack:
+            new_min = min(val, self._mins[-1])
+            new_max = max(val, self._maxes[-1])
+            new_sum = self._sums[-1] + val
+        else:
+            new_min = new_max = new_sum = val
+
         self._stack.append(val)
-        self.size += 1
+        self._mins.append(new_min)
+        self._maxes.append(new_max)
+        self._sums.append(new_sum)
+
+    def push_many(self, vals: Iterable[Any]) -> None:
+        """Pushes the values onto the stack in order (so the last one ends up on top).
+
+        :param vals: The values to add to the stack.
+        :return: None.
+        """
+        if self._track_aggregates:
+            for val in vals:
+                self.push(val)
+        else:
+            self._stack.extend(vals)
 
     def peek(self) -> Any:
         """Returns the value at the top of the stack.
@@ -49,7 +99,60 @@ class Stack:
         if self.size == 0:
             raise Exception('Stack is empty')
 
-        val = self._stack.pop()
-        self.size -= 1
+        if self._track_aggregates:
+            self._mins.pop()
+            self._maxes.pop()
+            self._sums.pop()
+
+        return self._stack.pop()
+
+    def pop_many(self, count: int) -> Sequence[Any]:
+        """Removes and returns the top count values.
+
+        :param count: The number of values to pop.
+        :return: The values in the order pop would have returned them (top first).
+        """
+        if count < 0:
+            raise ValueError('Count must not be negative')
+        if count > self.size:
+            raise Exception('Stack is empty')
+        if count == 0:
+            return self._new_stack()
+
+        vals = self._stack[-count:]
+        del self._stack[-count:]
+
+        if self._track_aggregates:
+            del self._mins[-count:]
+            del self._maxes[-count:]
+            del self._sums[-count:]
+
+        vals.reverse()
+
+        return vals
+
+    def min(self) -> Any:
+        """Returns the smallest value on the stack."""
+        return self._aggregate(self._mins)
+
+    def max(self) -> Any:
+        """Returns the largest value on the stack."""
+        return self._aggregate(self._maxes)
+
+    def sum(self) -> Any:
+        """Returns the sum of the values on the stack (0 if empty)."""
+        if self._track_aggregates and self.size == 0:
+            return 0
+
+        return self._aggregate(self._sums)
+
+    def _aggregate(self, aggregates: Sequence[Any]) -> Any:
+        if not self._track_aggregates:
+            raise Exception('Aggregates not tracked (pass track_aggregates=True)')
+        if self.size == 0:
+            raise Exception('Stack is empty')
+
+        return aggregates[-1]
 
-        return val
+    def _new_stack(self) -> Sequence[Any]:
+        return [] if self._typecode is None else array(self._typecode)
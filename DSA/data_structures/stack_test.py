@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from data_structures.stack import Stack
 
@@ -43,5 +44,99 @@ class StackTest(unittest.TestCase):
             stack.peek()
 
 
+    def test_push_many(self):
+        stack = Stack()
+        stack.push_many([1, 2, 3])
+
+        self.assertEqual(3, stack.size)
+        self.assertEqual(3, stack.peek())
+
+    def test_pop_many(self):
+        stack = Stack()
+        stack.push_many(range(5))
+
+        self.assertEqual([4, 3], stack.pop_many(2))
+        self.assertEqual([], stack.pop_many(0))
+        self.assertEqual(3, stack.size)
+        self.assertEqual(2, stack.pop())
+
+    def test_pop_many_too_many_raises_exception(self):
+        stack = Stack()
+        stack.push_many([1, 2])
+        with self.assertRaises(Exception):
+            stack.pop_many(3)
+
+        self.assertEqual(2, stack.size)
+
+    def test_typed(self):
+        stack = Stack(typecode='q')
+        stack.push(1)
+        stack.push_many([2, 3, 4])
+
+        self.assertEqual(array('q', [4, 3]), stack.pop_many(2))
+        self.assertEqual(2, stack.pop())
+        self.assertEqual(1, stack.size)
+
+    def test_aggregates(self):
+        stack = Stack(track_aggregates=True)
+        stack.push_many([3, 1, 4, 1, 5])
+
+        self.assertEqual(1, stack.min())
+        self.assertEqual(5, stack.max())
+        self.assertEqual(14, stack.sum())
+
+        stack.pop_many(3)
+        self.assertEqual(1, stack.min())
+        self.assertEqual(3, stack.max())
+        self.assertEqual(4, stack.sum())
+
+        stack.pop()
+        self.assertEqual(3, stack.min())
+
+        stack.pop()
+        self.assertEqual(0, stack.sum())
+        with self.assertRaises(Exception):
+            stack.min()
+
+    def test_typed_aggregates(self):
+        stack = Stack(typecode='d', track_aggregates=True)
+        stack.push_many([2.5, -1.0, 4.0])
+
+        self.assertEqual(-1.0, stack.min())
+        self.assertEqual(4.0, stack.max())
+        self.assertEqual(5.5, stack.sum())
+
+    def test_typed_aggregates_sum_past_typecode_range(self):
+        stack = Stack(typecode='b', track_aggregates=True)
+        stack.push(100)
+        stack.push(100)
+
+        self.assertEqual(200, stack.sum())
+        stack.pop()
+        self.assertEqual(100, stack.sum())
+
+    def test_failed_push_leaves_stack_unchanged(self):
+        stack = Stack(typecode='b', track_aggregates=True)
+        stack.push(100)
+
+        with self.assertRaises(OverflowError):
+            stack.push(200)
+        with self.assertRaises(TypeError):
+            stack.push('a')
+
+        self.assertEqual(1, stack.size)
+        self.assertEqual((100, 100, 100), (stack.min(), stack.max(), stack.sum()))
+        self.assertEqual(100, stack.pop())
+        self.assertEqual(0, stack.sum())
+
+    def test_aggregates_not_tracked_raises_exception(self):
+        stack = Stack()
+        stack.push(1)
+        with self.assertRaises(Exception):
+            stack.min()
+        with self.assertRaises(Exception):
+            stack.sum()
+
+
 if __name__ == '__main__':
     unittest.main()
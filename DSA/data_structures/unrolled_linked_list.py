@@ -0,0 +1,314 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# How many values each node holds.
+# Big enough that the per-node overhead is small, small enough that
+# inserting/removing inside a node (shifting its values) stays cheap.
+_DEFAULT_NODE_CAPACITY = 64
+
+
+class Node:
+    """An unrolled list node: a small array of values plus links to the neighbouring nodes."""
+
+    __slots__ = ('values', 'next', 'prev')
+
+    def __init__(self, values: Optional[List[Any]] = None) -> None:
+        self.values = values if values is not None else []
+        self.next = None
+        self.prev = None
+
+
+class UnrolledLinkedList:
+    """A doubly linked list where each node holds up to node_capacity values.
+
+    A normal linked list pays for a whole node object (plus its links) per value,
+    and every step of a traversal is a pointer hop to somewhere else in memory.
+    Here each node holds a block of values in a contiguous array, so we pay
+    the node overhead once per block, and traversal mostly walks arrays.
+
+    [1, 2, 3, 4] <> [5, 6, 7] <> [8, 9]
+
+    * When a node is full and we insert into it, we split it in half.
+    * When a node drops below half full, we merge it with a neighbour (if they fit).
+      That keeps nodes at least ~half full, so memory use stays low.
+
+    Supports the DoublyLinkedList operations (add_to_head/tail, pop_head/tail,
+    remove_val, reverse), plus insert and indexing.
+
+    B is node_capacity.
+    * Add/pop head: O(B) (inserting/popping at the front of the head node shifts its values)
+    * Add/pop tail: O(1) amortized
+    * Insert/get at index: O(n/B + B)
+    * Remove value: O(n)
+    """
+
+    def __init__(self, node_capacity: int = _DEFAULT_NODE_CAPACITY) -> None:
+        if node_capacity < 2:
+            raise ValueError('Node capacity must be at least 2')
+
+        self._node_capacity = node_capacity
+        self._head = None
+        self._tail = None
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, vals: Iterable[Any], node_capacity: int = _DEFAULT_NODE_CAPACITY) -> 'UnrolledLinkedList':
+        """Builds a list with the values in the same order, filling every node."""
+        unrolled_list = cls(node_capacity)
+        unrolled_list.extend(vals)
+
+        return unrolled_list
+
+    def add_to_head(self, val: Any) -> None:
+        """Adds an item to the start of the list.
+
+        If the head node is full (or there isn't one), start a new head node.
+
+        :param val: The item to add.
+        :return: None
+        """
+        if not self._head or len(self._head.values) == self._node_capacity:
+            self._link_before(self._head, Node())
+
+        self._head.values.insert(0, val)
+        self.size += 1
+
+    def add_to_tail(self, val: Any) -> None:
+        """Adds an item to the end of the list.
+
+        If the tail node is full (or there isn't one), start a new tail node.
+
+        :param val: The item to add.
+        :return: None
+        """
+        if not self._tail or len(self._tail.values) == self._node_capacity:
+            self._link_after(self._tail, Node())
+
+        self._tail.values.append(val)
+        self.size += 1
+
+    def extend(self, vals: Iterable[Any]) -> None:
+        """Adds all of the values to the end of the list, a node's worth at a time."""
+        vals = iter(vals)
+
+        while True:
+            if not self._tail or len(self._tail.values) == self._node_capacity:
+                self._link_after(self._tail, Node())
+
+            free = self._node_capacity - len(self._tail.values)
+            chunk = [val for _, val in zip(range(free), vals)]
+            self._tail.values.extend(chunk)
+            self.size += len(chunk)
+
+            if len(chunk) < free:
+                break
+
+        if not self._tail.values:
+            self._unlink(self._tail)
+
+    def insert(self, index: int, val: Any) -> None:
+        """Inserts an item before position index (like list.insert).
+
+        1. Find the node holding index.
+        2. If it's full, split it in half and pick the half that holds index.
+        3. Insert into that node's array.
+
+        :param index: The position to insert at (0 to size).
+        :param val: The item to add.
+        :return: None
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            raise IndexError('Index out of range')
+
+        if index == self.size:
+            self.add_to_tail(val)
+            return
+
+        node, offset = self._locate(index)
+
+        if len(node.values) == self._node_capacity:
+            half = self._node_capacity // 2
+            new_node = Node(node.values[half:])
+            del node.values[half:]
+            self._link_after(node, new_node)
+
+            if offset > half:
+                node = new_node
+                offset -= half
+
+        node.values.insert(offset, val)
+        self.size += 1
+
+    def pop_head(self) -> Any:
+        """Removes and returns the head.
+
+        :return: The value at head.
+        """
+        if not self._head:
+            raise Exception('List is empty')
+
+        val = self._head.values.pop(0)
+        self.size -= 1
+
+        if not self._head.values:
+            self._unlink(self._head)
+
+        return val
+
+    def pop_tail(self) -> Any:
+        """Removes and returns the tail.
+
+        :return: The value at tail.
+        """
+        if not self._tail:
+            raise Exception('List is empty')
+
+        val = self._tail.values.pop()
+        self.size -= 1
+
+        if not self._tail.values:
+            self._unlink(self._tail)
+
+        return val
+
+    def remove_val(self, val: Any) -> None:
+        """Removes the first occurrence of a value.
+
+        1. Search each node's array for the value.
+        2. Delete it from the array.
+        3. If the node is empty, unlink it, or if it's under half full, try merging the next node in.
+
+        :param val: Value to remove.
+        :return: None.
+        """
+        node = self._head
+
+        while node:
+            try:
+                offset = node.values.index(val)
+            except ValueError:
+                node = node.next
+                continue
+
+            del node.values[offset]
+            self.size -= 1
+            self._rebalance(node)
+            return
+
+        raise KeyError('Value not found')
+
+    def reverse(self) -> None:
+        """Reverses the list: reverse the order of the nodes, and the values in each node.
+
+        Time: O(n)
+        Space: O(1)
+        """
+        node = self._head
+
+        while node:
+            node.values.reverse()
+            node.next, node.prev = node.prev, node.next
+            node = node.prev  # Was next before the swap
+
+        self._head, self._tail = self._tail, self._head
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Index out of range')
+
+        node, offset = self._locate(index)
+
+        return node.values[offset]
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._head
+        while node:
+            yield from node.values
+            node = node.next
+
+    def _locate(self, index: int) -> Tuple[Node, int]:
+        """Returns the node holding index, and the offset of index in it.
+
+        Walks from whichever end is closer, skipping a whole node at a time.
+        """
+        if index < self.size // 2:
+            node = self._head
+            while index >= len(node.values):
+                index -= len(node.values)
+                node = node.next
+        else:
+            node = self._tail
+            index = self.size - 1 - index
+            while index >= len(node.values):
+                index -= len(node.values)
+                node = node.prev
+            index = len(node.values) - 1 - index
+
+        return node, index
+
+    def _rebalance(self, node: Node) -> None:
+        """Unlinks an empty node, or merges an under-full node with a neighbour it fits into."""
+        if not node.values:
+            self._unlink(node)
+            return
+
+        if len(node.values) >= self._node_capacity // 2:
+            return
+
+        if node.next and len(node.values) + len(node.next.values) <= self._node_capacity:
+            node.values.extend(node.next.values)
+            self._unlink(node.next)
+        elif node.prev and len(node.prev.values) + len(node.values) <= self._node_capacity:
+            node.prev.values.extend(node.values)
+            self._unlink(node)
+
+    def _link_after(self, node: Optional[Node], new_node: Node) -> None:
+        """Links new_node after node (or as the only node, if node is None)."""
+        if not node:
+            self._head = self._tail = new_node
+            return
+
+        new_node.prev = node
+        new_node.next = node.next
+
+        if node.next:
+            node.next.prev = new_node
+        else:
+            self._tail = new_node
+
+        node.next = new_node
+
+    def _link_before(self, node: Optional[Node], new_node: Node) -> None:
+        """Links new_node before node (or as the only node, if node is None)."""
+        if not node:
+            self._head = self._tail = new_node
+            return
+
+        new_node.next = node
+        new_node.prev = node.prev
+
+        if node.prev:
+            node.prev.next = new_node
+        else:
+            self._head = new_node
+
+        node.prev = new_node
+
+    def _unlink(self, node: Node) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+
+        node.next = node.prev = None
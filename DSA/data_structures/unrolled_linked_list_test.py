@@ -0,0 +1,141 @@
+import random
+import unittest
+
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+class UnrolledLinkedListTest(unittest.TestCase):
+
+    def test_add_to_tail(self):
+        unrolled_list = UnrolledLinkedList(node_capacity=2)
+        unrolled_list.add_to_tail(1)
+        unrolled_list.add_to_tail(2)
+        unrolled_list.add_to_tail(3)
+
+        self.assertEqual(3, unrolled_list.size)
+        self.assertEqual([1, 2], unrolled_list._head.values)
+        self.assertEqual([3], unrolled_list._tail.values)
+
+    def test_add_to_head(self):
+        unrolled_list = UnrolledLinkedList(node_capacity=2)
+        unrolled_list.add_to_head(1)
+        unrolled_list.add_to_head(2)
+        unrolled_list.add_to_head(3)
+
+        self.assertEqual([3, 2, 1], list(unrolled_list))
+        self.assertEqual([3], unrolled_list._head.values)
+
+    def test_pop_head_and_tail(self):
+        unrolled_list = UnrolledLinkedList.from_iterable(range(5), node_capacity=2)
+
+        self.assertEqual(0, unrolled_list.pop_head())
+        self.assertEqual(4, unrolled_list.pop_tail())
+        self.assertEqual(1, unrolled_list.pop_head())
+        self.assertEqual(3, unrolled_list.pop_tail())
+        self.assertEqual(2, unrolled_list.pop_tail())
+        self.assertTrue(unrolled_list.is_empty())
+        self.assertIsNone(unrolled_list._head)
+        self.assertIsNone(unrolled_list._tail)
+
+        with self.assertRaises(Exception):
+            unrolled_list.pop_head()
+
+    def test_extend_fills_nodes(self):
+        unrolled_list = UnrolledLinkedList(node_capacity=4)
+        unrolled_list.add_to_tail(0)
+        unrolled_list.extend(range(1, 10))
+
+        self.assertEqual(list(range(10)), list(unrolled_list))
+        self.assertEqual([0, 1, 2, 3], unrolled_list._head.values)
+        self.assertEqual([8, 9], unrolled_list._tail.values)
+
+        unrolled_list.extend([])
+        self.assertEqual([8, 9], unrolled_list._tail.values)
+
+    def test_insert_splits_full_node(self):
+        unrolled_list = UnrolledLinkedList.from_iterable([1, 2, 3, 4], node_capacity=4)
+        unrolled_list.insert(3, 'x')
+
+        self.assertEqual([1, 2, 3, 'x', 4], list(unrolled_list))
+        self.assertEqual([1, 2], unrolled_list._head.values)
+        self.assertEqual([3, 'x', 4], unrolled_list._tail.values)
+
+        unrolled_list.insert(0, 'start')
+        unrolled_list.insert(unrolled_list.size, 'end')
+        self.assertEqual(['start', 1, 2, 3, 'x', 4, 'end'], list(unrolled_list))
+
+        with self.assertRaises(IndexError):
+            unrolled_list.insert(100, 'y')
+
+    def test_getitem(self):
+        unrolled_list = UnrolledLinkedList.from_iterable(range(20), node_capacity=3)
+
+        for i in range(20):
+            self.assertEqual(i, unrolled_list[i])
+        self.assertEqual(19, unrolled_list[-1])
+
+        with self.assertRaises(IndexError):
+            unrolled_list[20]
+
+    def test_remove_val_merges_nodes(self):
+        unrolled_list = UnrolledLinkedList.from_iterable(range(8), node_capacity=4)
+
+        unrolled_list.remove_val(1)
+        unrolled_list.remove_val(2)
+        self.assertEqual([0, 3, 4, 5, 6, 7], list(unrolled_list))
+
+        unrolled_list.remove_val(3)  # [0] is under half full, but [4, 5, 6, 7] doesn't fit
+        self.assertEqual([0], unrolled_list._head.values)
+
+        unrolled_list.remove_val(7)
+        unrolled_list.remove_val(6)
+        unrolled_list.remove_val(5)  # [4] fits into the previous node
+        self.assertEqual([0, 4], unrolled_list._head.values)
+        self.assertIs(unrolled_list._head, unrolled_list._tail)
+
+        with self.assertRaises(KeyError):
+            unrolled_list.remove_val(10)
+
+    def test_reverse(self):
+        unrolled_list = UnrolledLinkedList.from_iterable(range(7), node_capacity=3)
+        unrolled_list.reverse()
+
+        self.assertEqual([6, 5, 4, 3, 2, 1, 0], list(unrolled_list))
+        self.assertEqual(0, unrolled_list.pop_tail())
+        self.assertEqual(6, unrolled_list.pop_head())
+        self.assertEqual(4, unrolled_list[1])
+
+    def test_matches_list(self):
+        rand = random.Random(1)
+        unrolled_list = UnrolledLinkedList(node_capacity=4)
+        expected = []
+
+        for i in range(2000):
+            op = rand.randrange(5)
+            if op == 0:
+                unrolled_list.add_to_head(i)
+                expected.insert(0, i)
+            elif op == 1:
+                unrolled_list.add_to_tail(i)
+                expected.append(i)
+            elif op == 2:
+                index = rand.randint(0, len(expected))
+                unrolled_list.insert(index, i)
+                expected.insert(index, i)
+            elif op == 3 and expected:
+                val = rand.choice(expected)
+                unrolled_list.remove_val(val)
+                expected.remove(val)
+            elif expected:
+                self.assertEqual(expected.pop(), unrolled_list.pop_tail())
+
+        self.assertEqual(expected, list(unrolled_list))
+        self.assertEqual(len(expected), unrolled_list.size)
+
+    def test_init_with_invalid_node_capacity_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(1)
+
+
+if __name__ == '__main__':
+    unittest.main()